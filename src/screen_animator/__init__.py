@@ -1,28 +1,50 @@
 import importlib.resources
 import shutil
-from functools import partial
 import argparse
 import logging
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 import pygame as pg
+from pygame._sdl2.video import Window, Renderer
 
 from screen_animator import example
 from screen_animator.log_setup import setup_logging
+from screen_animator.calibration import Calibrator
 from screen_animator.controller import Controller, EventManager, QuitAction
+from screen_animator.headless import HEADLESS_DISPLAY_SIZE, init_headless
 from screen_animator.item_groups import (
     ItemGroup,
-    TimedItemGroup,
     LeftScrollingTextItemGroup,
     ColorChangeItemGroup,
     RandomImagesItemGroup,
     FpsCounterItemGroup,
 )
+from screen_animator.feed import MessageFeed
+from screen_animator.gc_policy import GC_POLICIES, FrameCollector
+from screen_animator.governor import QualityGovernor
 from screen_animator.image_loading import ImageLoader, SvgTypeImageLoader
+from screen_animator.instrumentation import FrameStats, DumpStatsAction
 from screen_animator.model import Model
+from screen_animator.render_thread import (
+    RenderThread,
+    SnapshotBuffer,
+    SnapshotPublisher,
+)
+from screen_animator.profiling import (
+    CProfileProfiler,
+    Profiler,
+    SamplingProfiler,
+    StopProfilerAction,
+    ToggleProfilerAction,
+)
+from screen_animator.reloading import ReloadSettingsAction, watch_files
 from screen_animator.settings import SettingsManager
-from screen_animator.view import View
+from screen_animator.sinks import FrameSink, FramebufferSink, NullSink
+from screen_animator.timing import SimulatedClock, SystemClock
+from screen_animator.view import ModelView, RendererView, View
+from screen_animator.watchdog import STALL_MULTIPLE, StallWatchdog
 from screen_animator.speed_changer import (
     ResetSpeedAction,
     IncreaseSpeedAction,
@@ -32,9 +54,14 @@ from screen_animator.speed_changer import (
 log = logging.getLogger(__name__)
 
 DEBUG_DISPLAY_SIZE = 800, 400
+BACKENDS = ["surface", "renderer"]
+PROFILERS: dict[str, Callable[[float | None], Profiler]] = {
+    "cprofile": CProfileProfiler,
+    "sampling": SamplingProfiler,
+}
 ITEM_GROUP_TYPES: list[Callable[[SettingsManager, pg.Rect], ItemGroup]] = [
-    partial(TimedItemGroup, wrapped_group=ColorChangeItemGroup),
-    partial(TimedItemGroup, wrapped_group=RandomImagesItemGroup),
+    ColorChangeItemGroup,
+    RandomImagesItemGroup,
     LeftScrollingTextItemGroup,
 ]
 EVENT_TYPES: list[tuple[int, int] | int] = [
@@ -86,6 +113,120 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="turns on debug mode which limits output to windowed mode and renders FPS counter (optional, off by default)",
     )
+    parser.add_argument(
+        "-s",
+        "--render-scale",
+        type=float,
+        default=1.0,
+        help="render at a fraction of the display resolution and scale up to fill it, e.g. 0.5 (optional, 1.0 by default)",
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=BACKENDS,
+        default=BACKENDS[0],
+        help="drawing backend, `surface` draws in software, `renderer` uses the SDL2 renderer and the GPU where available (optional, `surface` by default)",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="render off-screen without a display, e.g. to measure performance (optional, off by default)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed for random choices, so the animation can be repeated exactly (optional, random by default)",
+    )
+    parser.add_argument(
+        "--simulate",
+        action="store_true",
+        help="advance time by exactly one frame per frame drawn, running as fast as possible (optional, off by default)",
+    )
+    parser.add_argument(
+        "--idle",
+        action="store_true",
+        help="when nothing on screen is moving or changing, wait for the next keypress or timed change rather than running at the target FPS (optional, off by default)",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="frame_stats.json",
+        help="record time spent in each stage of every frame, written to a JSON file on exit or when `s` is pressed (optional, off by default, `frame_stats.json` if no path given)",
+    )
+    parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="record memory allocated by Python in each frame with `tracemalloc` in the frame stats, slowing frames (optional, off by default, requires `--stats`)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="reload the input files when they change, without restarting, only rebuilding what the changed settings affect (optional, off by default)",
+    )
+    parser.add_argument(
+        "--feed",
+        help="show messages pushed, one per line, to a Unix socket created at this path, or to a named pipe if the path is one, ahead of those in the input files (optional, off by default)",
+    )
+    parser.add_argument(
+        "--calibrate",
+        nargs="?",
+        const="calibration.toml",
+        help="measure rendering headlessly at the display size, then write settings that hold the target FPS to a TOML file to use after the other inputs, and exit (optional, off by default, `calibration.toml` if no path given)",
+    )
+    parser.add_argument(
+        "--governor",
+        action="store_true",
+        help="step outline copies, anti-aliasing and number of images down when the target FPS cannot be held, and back up when it can (optional, off by default)",
+    )
+    parser.add_argument(
+        "--gc",
+        choices=GC_POLICIES,
+        default="auto",
+        help="when garbage is collected, `auto` leaves it to Python, `frame` freezes everything loaded at startup and only collects between frames when there is time to spare (optional, `auto` by default)",
+    )
+    parser.add_argument(
+        "--watchdog",
+        nargs="?",
+        type=float,
+        const=STALL_MULTIPLE,
+        help=f"log the stack of the main loop when a frame takes longer than this multiple of the target frame time (optional, off by default, {STALL_MULTIPLE:g} if no multiple given)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        help="profile the app, written to a file on exit, `p` or `SIGUSR1` toggles profiling (optional, off by default, `profile.pstats` or `profile.collapsed` if no path given)",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=list(PROFILERS),
+        default="cprofile",
+        help="profiler to use, `cprofile` writes `pstats` files, `sampling` writes collapsed stacks for flame graphs (optional, `cprofile` by default)",
+    )
+    parser.add_argument(
+        "--profile-window",
+        type=float,
+        help="seconds to profile for each time profiling starts (optional, until exit or toggled by default)",
+    )
+    parser.add_argument(
+        "--profile-paused",
+        action="store_true",
+        help="wait until toggled before profiling (optional, profiling starts immediately by default)",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="draw frames in a separate thread from snapshots of the model (optional, off by default, requires `--headless` or `--framebuffer`)",
+    )
+    parser.add_argument(
+        "--framebuffer",
+        help="write frames to a framebuffer device (e.g. `/dev/fb0`) or file instead of opening a window (optional, off by default)",
+    )
+    parser.add_argument(
+        "--framebuffer-format",
+        choices=list(FramebufferSink.pixel_formats),
+        help="pixel format of the framebuffer (optional, read from the device by default)",
+    )
     parser.add_argument(
         "-l",
         "--logging",
@@ -95,54 +236,277 @@ def _parse_args() -> argparse.Namespace:
 
     args = parser.parse_args()
     args.fps = args.fps or args.debug
+    if not 0 < args.render_scale <= 1:
+        parser.error("render scale must be greater than 0 and no more than 1")
+    if args.framebuffer and (args.backend != "surface" or args.render_scale != 1):
+        parser.error(
+            "framebuffer output only supports the `surface` backend at full scale"
+        )
+    if args.watchdog is not None and args.watchdog <= 1:
+        parser.error("watchdog multiple must be greater than 1")
+    if args.profile_window is not None and args.profile_window <= 0:
+        parser.error("profile window must be greater than 0")
+    if args.calibrate and args.render_scale != 1:
+        parser.error("calibration only supports full scale")
+    if args.headless and args.backend != "surface":
+        parser.error("headless mode only supports the `surface` backend")
+    if args.threaded and not (args.headless or args.framebuffer):
+        parser.error(
+            "threaded mode only supports `--headless` or `--framebuffer` output, as a window must be drawn from the main thread"
+        )
+    if args.allocations and not args.stats:
+        parser.error("recording allocations requires frame stats")
 
     return args
 
 
-def _set_display_size(display_size: tuple[float, float] | None = None) -> pg.Surface:
+def _set_display_size(
+    display_size: tuple[float, float] | None = None, render_scale: float = 1.0
+) -> pg.Surface:
     pg.display.set_caption("screen_animator")
 
+    if render_scale != 1:
+        return _set_scaled_display_size(display_size, render_scale)
+
     if display_size is None:
         return pg.display.set_mode((0, 0), pg.FULLSCREEN)
 
     return pg.display.set_mode(display_size)
 
 
+def _set_scaled_display_size(
+    display_size: tuple[float, float] | None, render_scale: float
+) -> pg.Surface:
+    """Create a smaller display surface that `pygame` scales up to the output size."""
+    output_size = display_size or pg.display.get_desktop_sizes()[0]
+    render_size = _scale_size(output_size, render_scale)
+    flags = pg.SCALED if display_size is not None else pg.SCALED | pg.FULLSCREEN
+    log.info(
+        "Rendering at %s, scaled up to %s (render scale %s)",
+        render_size,
+        output_size,
+        render_scale,
+    )
+
+    return pg.display.set_mode(render_size, flags)
+
+
+def _create_renderer(
+    display_size: tuple[float, float] | None = None, render_scale: float = 1.0
+) -> Renderer:
+    """Create an SDL2 window and renderer, scaling up from the render scale if set."""
+    output_size = display_size or pg.display.get_desktop_sizes()[0]
+    window = Window(
+        "screen_animator", output_size, fullscreen_desktop=display_size is None
+    )
+    renderer = Renderer(window)
+    if render_scale != 1:
+        renderer.logical_size = _scale_size(output_size, render_scale)
+    log.info("Created renderer with viewport %s", renderer.get_viewport())
+
+    return renderer
+
+
+def _scale_size(size: tuple[float, float], scale: float) -> tuple[int, int]:
+    width, height = size
+
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _open_framebuffer(args: argparse.Namespace) -> FramebufferSink:
+    """Open the framebuffer, reading its geometry if it is a device."""
+    return FramebufferSink(
+        args.framebuffer,
+        None if Path(args.framebuffer).is_char_device() else DEBUG_DISPLAY_SIZE,
+        args.framebuffer_format,
+    )
+
+
+def _calibrate(args: argparse.Namespace) -> None:
+    """Calibrate settings headlessly at the size of the display or framebuffer."""
+    if args.framebuffer:
+        sink = _open_framebuffer(args)
+        display_size = sink.size
+        sink.close()
+    elif args.debug:
+        display_size = DEBUG_DISPLAY_SIZE
+    elif args.headless:
+        display_size = HEADLESS_DISPLAY_SIZE
+    else:
+        display_size = pg.display.get_desktop_sizes()[0]
+    init_headless()
+    calibrated = Calibrator(args.input, display_size, rotated=args.rotate).write(
+        args.calibrate
+    )
+    log.info("Calibrated settings: %s", calibrated)
+    print(f"Run with: -i {' '.join(args.input)} {args.calibrate}")
+
+
 def main() -> None:
     """Main app function to run."""
-    pg.init()
     args = _parse_args()
+    if args.headless or args.framebuffer:
+        init_headless()
+    else:
+        pg.init()
     setup_logging(args.logging)
 
     ImageLoader.register_loader(".svg", SvgTypeImageLoader)
 
+    if args.calibrate:
+        _calibrate(args)
+        return
+
     item_group_types = (
         ITEM_GROUP_TYPES + [FpsCounterItemGroup] if args.fps else ITEM_GROUP_TYPES
     )
 
-    display = _set_display_size(DEBUG_DISPLAY_SIZE if args.debug else None)
-    settings_manager = SettingsManager(args.input)
-    model = Model(settings_manager, item_group_types, display.get_rect())
-    view = View(model, display, settings_manager.settings, args.rotate)
+    stats = (
+        FrameStats(allocations=args.allocations)
+        if args.stats or args.watchdog
+        else None
+    )
+    display_size = DEBUG_DISPLAY_SIZE if args.debug else None
+    sink: FrameSink | None = None
+    if args.framebuffer:
+        sink = _open_framebuffer(args)
+        display = pg.Surface(sink.size)
+        perimeter = display.get_rect()
+    elif args.headless:
+        sink = NullSink()
+        display = pg.Surface(_scale_size(HEADLESS_DISPLAY_SIZE, args.render_scale))
+        perimeter = display.get_rect()
+    elif args.backend == "renderer":
+        renderer = _create_renderer(display_size, args.render_scale)
+        perimeter = renderer.get_viewport()
+    else:
+        display = _set_display_size(display_size, args.render_scale)
+        perimeter = display.get_rect()
+    settings_manager = SettingsManager(
+        args.input,
+        args.render_scale,
+        args.seed,
+        SimulatedClock() if args.simulate else SystemClock(),
+    )
+    feed = None
+    if args.feed:
+        feed = MessageFeed(settings_manager, args.feed)
+        item_group_types = [
+            (
+                partial(LeftScrollingTextItemGroup, feed=feed)
+                if group is LeftScrollingTextItemGroup
+                else group
+            )
+            for group in item_group_types
+        ]
+    model = Model(settings_manager, item_group_types, perimeter, stats)
+    view: ModelView
+    render_thread = None
+    render_stats = None
+    if args.backend == "renderer":
+        view = RendererView(model, renderer, settings_manager.state, args.rotate, stats)
+    elif args.threaded:
+        render_stats = FrameStats() if args.stats else None
+        snapshot_buffer = SnapshotBuffer()
+        render_thread = RenderThread(
+            View(
+                model,
+                display,
+                settings_manager.state,
+                args.rotate,
+                sink,
+                render_stats,
+            ),
+            snapshot_buffer,
+            render_stats,
+        )
+        view = SnapshotPublisher(model, snapshot_buffer, stats)
+    else:
+        view = View(model, display, settings_manager.state, args.rotate, sink, stats)
 
-    event_types = EVENT_TYPES + [model.update_event_type]
+    event_types = EVENT_TYPES.copy()
 
-    screen_animator = Controller(settings_manager.settings, model)
+    watchdog = (
+        StallWatchdog(settings_manager, args.watchdog, stats) if args.watchdog else None
+    )
+    collector = FrameCollector(settings_manager, stats) if args.gc == "frame" else None
+    screen_animator = Controller(
+        settings_manager,
+        model,
+        view,
+        settings_manager.clock,
+        stats,
+        watchdog,
+        QualityGovernor(settings_manager) if args.governor else None,
+        args.idle and not args.simulate,
+        collector,
+    )
     listeners = [
         quit_action := QuitAction([screen_animator]),
         quit_action,
         ResetSpeedAction(model.speed_changer),
         IncreaseSpeedAction(model.speed_changer),
         DecreaseSpeedAction(model.speed_changer),
-        view,
     ]
-    event_manager = EventManager(listeners, event_types)
+    if args.stats and stats is not None:
+        listeners.append(DumpStatsAction(stats, args.stats))
+        event_types.append((pg.KEYDOWN, pg.K_s))
+    profiler = None
+    if args.profile is not None:
+        profiler = PROFILERS[args.profiler](args.profile_window)
+        profiler.install_signal_handler()
+        toggle_profiler_action = ToggleProfilerAction(profiler)
+        listeners += [
+            toggle_profiler_action,
+            toggle_profiler_action,
+            StopProfilerAction(profiler),
+        ]
+        event_types += [
+            (pg.KEYDOWN, pg.K_p),
+            profiler.toggle_event_type,
+            profiler.stop_event_type,
+        ]
+    watcher = None
+    if args.watch:
+        watcher = watch_files(args.input)
+        listeners.append(ReloadSettingsAction(settings_manager, model))
+        event_types.append(watcher.event_type)
+    event_manager = EventManager(listeners, event_types, stats)
 
     try:
+        if profiler is not None and not args.profile_paused:
+            profiler.start()
+        if watchdog is not None:
+            watchdog.start()
+        if render_thread is not None:
+            render_thread.start()
+        if collector is not None:
+            collector.start()
+        if watcher is not None:
+            watcher.start()
+        if feed is not None:
+            feed.start()
         screen_animator.run(event_manager)
     except KeyboardInterrupt:
         pass
     finally:
+        if feed is not None:
+            feed.stop()
+        if watcher is not None:
+            watcher.stop()
+        if collector is not None:
+            collector.stop()
+        if watchdog is not None:
+            watchdog.stop()
+        if profiler is not None:
+            profiler.dump(args.profile or profiler.default_path)
+        if render_thread is not None:
+            render_thread.stop()
+        view.close()
+        if args.stats and stats is not None:
+            stats.dump(args.stats)
+            if render_stats is not None:
+                render_stats.dump(Path(args.stats).with_suffix(".render.json"))
         print("Closing app")
 
 
@@ -0,0 +1,447 @@
+import argparse
+import importlib.resources
+import itertools
+import json
+import logging
+import platform
+import sys
+import tempfile
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import pygame as pg
+
+from screen_animator import example
+from screen_animator.headless import HEADLESS_DISPLAY_SIZE, HeadlessRenderer
+from screen_animator.instrumentation import FrameStats
+from screen_animator.settings import SettingsExporter
+
+log = logging.getLogger(__name__)
+
+BENCHMARK_FRAMES = 300
+WARMUP_FRAMES = 30
+REGRESSION_THRESHOLD = 0.1
+MAX_FRAME_ALLOCATION = 4096
+
+SCENARIO_AXES: dict[str, list[tuple[str, dict[str, Any]]]] = {
+    "outline": [
+        ("outline_12", {"messages": {"outline_copies": 12}}),
+        ("outline_none", {"messages": {"outline_copies": 0}}),
+        ("outline_360", {"messages": {"outline_copies": 360}}),
+    ],
+    "size": [
+        ("size_100", {"messages": {"sizes": [100, 100]}}),
+        ("size_350", {"messages": {"sizes": [350, 350]}}),
+    ],
+    "images": [
+        ("images_10", {"images": {"number": 10}}),
+        ("images_0", {"images": {"number": 0}}),
+        ("images_30", {"images": {"number": 30}}),
+    ],
+    "rotation": [("unrotated", {}), ("rotated", {"rotated": True})],
+    "anti_aliasing": [
+        ("aliased", {"messages": {"anti-aliasing": False}}),
+        ("anti_aliased", {"messages": {"anti-aliasing": True}}),
+    ],
+    "reposition": [
+        ("reposition_0", {"images": {"reposition_attempts": 0}}),
+        ("reposition_100", {"images": {"reposition_attempts": 100}}),
+    ],
+}
+BENCHMARK_IMAGES = [(64, (255, 255, 0)), (48, (255, 0, 255)), (32, (0, 255, 255))]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Settings overriding the base settings for a benchmark run.
+
+    Attributes
+    ----------
+    name
+        Name of the scenario.
+    settings
+        Settings layered over the base settings.
+    rotated
+        Whether output is rotated.
+    """
+
+    name: str
+    settings: dict[str, Any] = field(default_factory=dict)
+    rotated: bool = False
+
+
+def build_scenarios(full: bool = False) -> list[Scenario]:
+    """
+    Build scenarios from `SCENARIO_AXES`.
+
+    By default, a `base` scenario uses the first option of every axis, and each other
+    scenario varies one axis from the base, named after the option used.
+
+    Parameters
+    ----------
+    full : optional
+        Build every combination of the axes instead, named after all options used
+        (default is False).
+
+    Returns
+    -------
+    list[Scenario]
+        Scenarios to run.
+    """
+    axes = list(SCENARIO_AXES.values())
+    combinations: list[tuple[str, Sequence[tuple[str, dict[str, Any]]]]]
+    if full:
+        combinations = [
+            ("-".join(name for name, _ in combination), combination)
+            for combination in itertools.product(*axes)
+        ]
+    else:
+        base = [axis[0] for axis in axes]
+        combinations = [("base", base)] + [
+            (option[0], base[:axis_idx] + [option] + base[axis_idx + 1 :])
+            for axis_idx, axis in enumerate(axes)
+            for option in axis[1:]
+        ]
+
+    scenarios = []
+    for name, combination in combinations:
+        settings: dict[str, Any] = {}
+        rotated = False
+        for _, overrides in combination:
+            for key, value in overrides.items():
+                if key == "rotated":
+                    rotated = value
+                else:
+                    settings.setdefault(key, {}).update(value)
+        scenarios.append(Scenario(name, settings, rotated))
+
+    return scenarios
+
+
+class BenchmarkRunner:
+    """
+    Runs scenarios headlessly, measuring startup and frame times.
+
+    Methods
+    -------
+    run
+        Run all scenarios.
+    run_scenario
+        Run a single scenario.
+    """
+
+    def __init__(
+        self,
+        settings_files: Iterable[str | PathLike],
+        frames: int = BENCHMARK_FRAMES,
+        warmup_frames: int = WARMUP_FRAMES,
+        size: tuple[int, int] = HEADLESS_DISPLAY_SIZE,
+        allocations: bool = False,
+    ) -> None:
+        """
+        Set the base settings and number of frames for each scenario.
+
+        Parameters
+        ----------
+        settings_files
+            Paths to settings files forming the base settings of every scenario.
+        frames : optional
+            Number of frames measured for each scenario (default is 300).
+        warmup_frames : optional
+            Number of frames run before measuring (default is 30).
+        size : optional
+            Width and height of frames in pixels (default is 800x400).
+        allocations : optional
+            Whether to record memory allocated in each frame (default is False).
+        """
+        self._settings_files = list(settings_files)
+        self._frames = frames
+        self._warmup_frames = warmup_frames
+        self._size = size
+        self._allocations = allocations
+        log.info("Creating %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_files}, {self._frames}, {self._warmup_frames}, {self._size}, {self._allocations})"
+
+    def run(self, scenarios: Iterable[Scenario]) -> dict[str, Any]:
+        """
+        Run all scenarios.
+
+        Parameters
+        ----------
+        scenarios
+            Scenarios to run.
+
+        Returns
+        -------
+        dict
+            Description of the environment, and results for each scenario.
+        """
+        results: dict[str, Any] = {
+            "environment": {
+                "python": platform.python_version(),
+                "pygame": pg.version.ver,
+                "sdl": ".".join(str(part) for part in pg.get_sdl_version()),
+                "machine": platform.machine(),
+            },
+            "frames": self._frames,
+            "size": list(self._size),
+            "scenarios": {},
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            images = self._create_images(Path(directory))
+            for scenario in scenarios:
+                print(f"Running scenario {scenario.name}...", file=sys.stderr)
+                results["scenarios"][scenario.name] = self.run_scenario(
+                    scenario, Path(directory), images
+                )
+
+        return results
+
+    def run_scenario(
+        self,
+        scenario: Scenario,
+        directory: Path,
+        images: list[tuple[str, int]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a single scenario.
+
+        Parameters
+        ----------
+        scenario
+            Scenario to run.
+        directory
+            Directory to write the settings layer for the scenario to.
+        images : optional
+            Image sources to use, replacing any in the base settings (default is
+            None, the base settings are used).
+
+        Returns
+        -------
+        dict
+            Startup time in seconds, and frame time and stage time summaries in
+            milliseconds, with bytes allocated per frame if recorded.
+        """
+        settings = {key: dict(value) for key, value in scenario.settings.items()}
+        if images is not None:
+            settings.setdefault("images", {})["sources"] = images
+        layer_path = directory / f"{scenario.name}.toml"
+        SettingsExporter().export_settings(settings, layer_path)
+
+        stats = FrameStats(self._frames, self._allocations)
+        start = perf_counter()
+        renderer = HeadlessRenderer(
+            [*self._settings_files, layer_path],
+            self._size,
+            rotated=scenario.rotated,
+            seed=0,
+            stats=stats,
+        )
+        startup_time = perf_counter() - start
+        renderer.step(self._warmup_frames)
+        stats.reset()
+        renderer.step(self._frames)
+        summary = stats.summary()
+
+        result = {
+            "startup_s": startup_time,
+            "frame_ms": summary["stages"]["frame"],
+            "stages": summary["stages"],
+        }
+        if self._allocations:
+            result["allocated_bytes"] = summary["stages"]["allocated_bytes"]
+
+        return result
+
+    @staticmethod
+    def _create_images(directory: Path) -> list[tuple[str, int]]:
+        images = []
+        for image_idx, (width, color) in enumerate(BENCHMARK_IMAGES):
+            image = pg.Surface((width, width))
+            image.fill(color)
+            image_path = directory / f"image_{image_idx}.bmp"
+            pg.image.save(image, image_path)
+            images.append((image_path.as_posix(), -1))
+
+        return images
+
+
+def compare(
+    results: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> list[str]:
+    """
+    Compare benchmark results against a baseline, finding regressions.
+
+    Parameters
+    ----------
+    results
+        Results of benchmark.
+    baseline
+        Results of a previous benchmark to compare against.
+    threshold : optional
+        Fractional increase in median or 95th percentile frame time, or startup time,
+        considered a regression (default is 0.1).
+
+    Returns
+    -------
+    list[str]
+        Descriptions of regressions found.
+    """
+    regressions = []
+    for name, result in results["scenarios"].items():
+        baseline_result = baseline["scenarios"].get(name)
+        if baseline_result is None:
+            continue
+
+        measures = [
+            ("startup", result["startup_s"], baseline_result["startup_s"]),
+            *(
+                (
+                    f"frame {percentile}",
+                    result["frame_ms"][percentile],
+                    baseline_result["frame_ms"][percentile],
+                )
+                for percentile in ("p50", "p95")
+            ),
+        ]
+        for measure, value, baseline_value in measures:
+            if value > baseline_value * (1 + threshold):
+                regressions.append(
+                    f"{name}: {measure} increased from {baseline_value:.3f} to {value:.3f}"
+                )
+
+    return regressions
+
+
+def check_allocations(
+    results: Mapping[str, Any], max_bytes: int = MAX_FRAME_ALLOCATION
+) -> list[str]:
+    """
+    Check memory allocated per frame stays within a bound once warmed up.
+
+    Frames creating new items, e.g. the next message, are expected to allocate, so
+    the 95th percentile of each scenario is checked rather than every frame.
+
+    Parameters
+    ----------
+    results
+        Results of benchmark, with bytes allocated per frame recorded.
+    max_bytes : optional
+        Most bytes allowed to be allocated in a frame (default is 4096).
+
+    Returns
+    -------
+    list[str]
+        Descriptions of scenarios allocating too much.
+    """
+    return [
+        f"{name}: {result['allocated_bytes']['p95']:.0f} bytes allocated per frame, more than {max_bytes}"
+        for name, result in results["scenarios"].items()
+        if result["allocated_bytes"]["p95"] > max_bytes
+    ]
+
+
+def _parse_args() -> argparse.Namespace:
+    """Processes the command line arguments provided."""
+    parser = argparse.ArgumentParser(
+        prog="screen_animator_benchmark",
+        description="Benchmark screen_animator rendering headlessly across a matrix of scenarios.",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="*",
+        help="paths to TOML files with base settings (optional, falls back to the example settings by default)",
+    )
+    parser.add_argument(
+        "-n",
+        "--frames",
+        type=int,
+        default=BENCHMARK_FRAMES,
+        help=f"number of frames measured for each scenario (optional, {BENCHMARK_FRAMES} by default)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="run every combination of scenario options, rather than one option at a time (optional, off by default)",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        nargs="*",
+        help="names of scenarios to run (optional, all by default)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="path of JSON file to write results to (optional, printed by default)",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        help="path of JSON file with previous results to compare against (optional)",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help=f"fractional increase in time considered a regression (optional, {REGRESSION_THRESHOLD} by default)",
+    )
+    parser.add_argument(
+        "-a",
+        "--allocations",
+        nargs="?",
+        type=int,
+        const=MAX_FRAME_ALLOCATION,
+        help=f"record memory allocated by Python in each frame with `tracemalloc`, failing if the 95th percentile is more than this many bytes (optional, off by default, {MAX_FRAME_ALLOCATION} if no bytes given)",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run benchmarks, exiting with an error if regressions against the baseline found."""
+    args = _parse_args()
+    settings_files = args.input or [
+        str(importlib.resources.files(example).joinpath("inputs_all.toml"))
+    ]
+    scenarios = build_scenarios(args.full)
+    if args.scenario:
+        scenarios = [
+            scenario for scenario in scenarios if scenario.name in args.scenario
+        ]
+
+    results = BenchmarkRunner(
+        settings_files, args.frames, allocations=args.allocations is not None
+    ).run(scenarios)
+    results_json = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(results_json)
+    else:
+        print(results_json)
+
+    regressions = []
+    if args.baseline:
+        regressions += compare(
+            results, json.loads(Path(args.baseline).read_text()), args.threshold
+        )
+    if args.allocations is not None:
+        regressions += check_allocations(results, args.allocations)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import logging
+import math
+import tempfile
+from collections.abc import Iterable, Mapping
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+from screen_animator.benchmark import BenchmarkRunner, Scenario
+from screen_animator.headless import HEADLESS_DISPLAY_SIZE
+from screen_animator.settings import SettingsExporter, SettingsImporter
+
+log = logging.getLogger(__name__)
+
+CALIBRATION_FRAMES = 120
+CALIBRATION_WARMUP_FRAMES = 30
+HEADROOM = 0.8
+SIZE_SCALES = (0.75, 0.5)
+
+
+class Calibrator:
+    """
+    Finds the highest quality settings that hold the target FPS on this device.
+
+    Quality is lowered one step at a time, measuring the frame time of each step
+    headlessly, until the 95th percentile frame time fits within the target frame
+    time with some headroom. Outline copies are halved first, then anti-aliasing is
+    turned off, then message sizes are reduced. If no step is fast enough, the
+    target FPS is lowered to what the lowest quality can hold.
+
+    Attributes
+    ----------
+    steps
+        Description, overrides and 95th percentile frame time in milliseconds of
+        each step measured.
+
+    Methods
+    -------
+    calibrate
+        Measure steps until the target FPS is held, returning settings to override.
+    write
+        Calibrate, writing the overrides to a TOML file.
+    """
+
+    def __init__(
+        self,
+        settings_files: Iterable[str | PathLike],
+        size: tuple[int, int] = HEADLESS_DISPLAY_SIZE,
+        frames: int = CALIBRATION_FRAMES,
+        headroom: float = HEADROOM,
+        rotated: bool = False,
+    ) -> None:
+        """
+        Set the settings to calibrate, and how to measure them.
+
+        Parameters
+        ----------
+        settings_files
+            Paths to settings files to calibrate.
+        size : optional
+            Width and height of the display in pixels (default is 800x400).
+        frames : optional
+            Number of frames measured for each step (default is 120).
+        headroom : optional
+            Fraction of the target frame time frames must fit within (default is
+            0.8).
+        rotated : optional
+            Whether output is rotated (default is False).
+        """
+        self._settings_files = list(settings_files)
+        self._size = size
+        self._frames = frames
+        self._headroom = headroom
+        self._rotated = rotated
+        log.info("Creating %s", self)
+
+        self.steps: list[tuple[str, dict[str, Any], float]] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_files}, {self._size}, {self._frames}, {self._headroom}, {self._rotated})"
+
+    def calibrate(self) -> dict[str, Any]:
+        """
+        Measure steps of decreasing quality until the target FPS is held.
+
+        Returns
+        -------
+        dict
+            Settings overriding those calibrated, with the target FPS.
+        """
+        settings = SettingsImporter().import_settings(self._settings_files)
+        fps = settings["timings"]["fps"]
+        budget_ms = 1000 * self._headroom / fps if fps > 0 else math.inf
+        runner = BenchmarkRunner(
+            self._settings_files, self._frames, CALIBRATION_WARMUP_FRAMES, self._size
+        )
+        self.steps.clear()
+        with tempfile.TemporaryDirectory() as directory:
+            for step_idx, (description, overrides) in enumerate(
+                self._quality_steps(settings["messages"])
+            ):
+                result = runner.run_scenario(
+                    Scenario(f"step_{step_idx}", overrides, self._rotated),
+                    Path(directory),
+                )
+                frame_time = result["frame_ms"]["p95"]
+                self.steps.append((description, overrides, frame_time))
+                log.info("Calibration step %s: %.3f ms", description, frame_time)
+                if frame_time <= budget_ms:
+                    break
+            else:
+                fps = max(1, min(fps, math.floor(1000 * self._headroom / frame_time)))
+                log.info("Target FPS not held at lowest quality, lowered to %s", fps)
+
+        return overrides | {"timings": {"fps": fps}}
+
+    def write(self, settings_file: str | PathLike) -> dict[str, Any]:
+        """
+        Calibrate, writing the settings to a TOML file to be read after the others,
+        and print the frame time of each step.
+
+        Parameters
+        ----------
+        settings_file
+            Path to the TOML file to write.
+
+        Returns
+        -------
+        dict
+            Settings overriding those calibrated, with the target FPS.
+        """
+        calibrated = self.calibrate()
+        SettingsExporter().export_settings(calibrated, settings_file)
+
+        print(f"{'step':<40}{'p95 ms':>9}")
+        for description, _, frame_time in self.steps:
+            print(f"{description:<40}{frame_time:>9.3f}")
+        print(
+            f"Target FPS {calibrated['timings']['fps']}, settings written to {settings_file}"
+        )
+
+        return calibrated
+
+    @staticmethod
+    def _quality_steps(
+        messages_dict: Mapping[str, Any],
+    ) -> list[tuple[str, dict[str, Any]]]:
+        outline_copies = messages_dict["outline_copies"]
+        anti_aliasing = messages_dict["anti-aliasing"]
+        sizes = list(messages_dict["sizes"])
+
+        def overrides() -> dict[str, Any]:
+            return {
+                "messages": {
+                    "outline_copies": outline_copies,
+                    "anti-aliasing": anti_aliasing,
+                    "sizes": sizes,
+                }
+            }
+
+        steps = [("as configured", overrides())]
+        while outline_copies > 0 and messages_dict["outline_width"] > 0:
+            outline_copies //= 2
+            steps.append((f"outline copies {outline_copies}", overrides()))
+        if anti_aliasing:
+            anti_aliasing = False
+            steps.append(("anti-aliasing off", overrides()))
+        original_sizes = sizes
+        for scale in SIZE_SCALES:
+            sizes = [max(1, round(size * scale)) for size in original_sizes]
+            steps.append((f"sizes {sizes}", overrides()))
+
+        return steps
@@ -1,19 +1,42 @@
 import logging
-from collections.abc import Iterable, Mapping
-from typing import Any
+from collections.abc import Iterable
+from time import perf_counter
 
 import pygame as pg
 
+from screen_animator.gc_policy import FrameCollector
+from screen_animator.governor import QualityGovernor
+from screen_animator.instrumentation import FrameStats, NullFrameStats
 from screen_animator.listener import Listener
 from screen_animator.model import Model
+from screen_animator.settings import SettingsManager
+from screen_animator.timing import Clock, SystemClock
+from screen_animator.view import ModelView
+from screen_animator.watchdog import StallWatchdog
 
 log = logging.getLogger(__name__)
 
+MAX_STEPS_PER_FRAME = 5
+MAX_IDLE_WAIT = 1000
+
 
 class Controller:
     """
     Allows manipulation of the `screen_animator` model.
 
+    The model is updated in fixed steps of one frame at the target frame rate, as
+    many as are due for the time elapsed, so movement and timers stay correct when
+    drawing falls behind. Each frame is then drawn once, with items part way between
+    their previous and current positions according to the time left over. If too many
+    steps are due, e.g. after a stall, the time beyond `MAX_STEPS_PER_FRAME` steps is
+    dropped rather than catching up.
+
+    When idle waits are allowed, nothing is moving every step, and nothing has
+    changed since the last frame was drawn, e.g. when scrolling is stopped, the loop
+    waits for the next input event or timed change instead of drawing the same frame
+    again. While anything is moving, frames can go undrawn when movement is slower
+    than a pixel per frame, so the loop carries on at the target frame rate.
+
     Methods
     -------
     run
@@ -22,29 +45,64 @@ class Controller:
         Stop running.
     """
 
-    def __init__(self, settings: Mapping[str, Any], model: Model) -> None:
+    def __init__(
+        self,
+        settings_manager: SettingsManager,
+        model: Model,
+        view: ModelView,
+        clock: Clock | None = None,
+        stats: FrameStats | None = None,
+        watchdog: StallWatchdog | None = None,
+        governor: QualityGovernor | None = None,
+        idle: bool = False,
+        collector: FrameCollector | None = None,
+    ) -> None:
         """
         Set initial parameters.
 
         Parameters
         ----------
-        settings
-            Dictionary of settings.
+        settings_manager
+            Manages the settings, with the target FPS, and where the measured FPS is
+            kept.
         model
             The model to manipulate.
+        view
+            Draws the model.
+        clock : optional
+            Source of time for the main loop (default is None, real time is used).
+        stats : optional
+            Records time taken by each frame (default is None, not recorded).
+        watchdog : optional
+            Told when each frame ends, to detect stalls (default is None, not
+            detected).
+        governor : optional
+            Told how long each frame took to work on, to adjust quality (default is
+            None, quality is fixed).
+        idle : optional
+            Whether to wait for the next change when nothing is moving or has
+            changed (default is False, the loop runs at the target frame rate
+            regardless).
+        collector : optional
+            Told how long each frame took to work on, to collect garbage in the time
+            left (default is None, garbage is collected automatically).
         """
-        self._settings = settings
+        self._settings_manager = settings_manager
         self._model = model
+        self._view = view
+        self._clock = clock or SystemClock()
+        self._stats = stats or NullFrameStats()
+        self._watchdog = watchdog
+        self._governor = governor
+        self._idle = idle
+        self._collector = collector
         log.info("Creating %s", self)
 
-        self._clock = pg.time.Clock()
-
         self._initialized = True
+        self._lag = 0.0
 
     def __repr__(self) -> str:
-        return (
-            f"{type(self).__name__}({type(self._settings).__name__}(), {self._model})"
-        )
+        return f"{type(self).__name__}({self._settings_manager}, {self._model}, {self._view}, {self._clock})"
 
     def run(self, event_manager: "EventManager") -> None:
         """Run main loop using `EventManager` to manager events."""
@@ -53,15 +111,77 @@ class Controller:
             type(self).__name__,
             " now running, entering main loop".upper(),
         )
-        timings_dict = self._settings["timings"]
+        settings_manager = self._settings_manager
+        state = settings_manager.state
+        self._clock.tick()
         while self._initialized:
-            self._clock.tick(timings_dict["fps"])
-            self._model.update()
+            fps = settings_manager.config.timings.fps
+            self._stats.begin("tick")
+            elapsed = self._clock.tick(fps)
+            self._stats.end()
+            start = perf_counter()
+            alpha = self._update_model(elapsed, fps)
             event_manager.manage_events()
-            timings_dict["fps_actual"] = self._clock.get_fps()
+            drawn = self._view.update(alpha)
+            state.fps_actual = self._clock.get_fps()
+            if self._governor is not None:
+                self._governor.observe(perf_counter() - start)
+            if self._collector is not None:
+                self._collector.collect(perf_counter() - start)
+            if (
+                self._idle
+                and not drawn
+                and self._initialized
+                and not self._model.moving
+            ):
+                self._wait_idle()
+            self._stats.end_frame()
+            if self._watchdog is not None:
+                self._watchdog.heartbeat()
 
         log.info("Run method complete, %s stopping", type(self).__name__)
 
+    def _update_model(self, elapsed: int, fps: float) -> float:
+        """Update the model by the steps due, returning the fraction of a step left."""
+        if fps <= 0:
+            self._model.update()
+            return 1.0
+
+        step_time = 1000 / fps
+        self._lag += elapsed
+        steps = 0
+        while self._lag >= step_time and steps < MAX_STEPS_PER_FRAME:
+            self._model.update()
+            self._lag -= step_time
+            steps += 1
+        if self._lag >= step_time:
+            log.debug("Model too far behind, dropping %.1f ms", self._lag)
+            self._lag %= step_time
+        if steps > 1:
+            self._stats.count("frames_skipped", steps - 1)
+
+        return self._lag / step_time
+
+    def _wait_idle(self) -> None:
+        """Wait for the next event, or until a timed group next changes."""
+        deadline = self._model.next_deadline
+        timeout = (
+            MAX_IDLE_WAIT
+            if deadline is None
+            else min(MAX_IDLE_WAIT, deadline - self._clock.get_ticks())
+        )
+        if timeout <= 0:
+            return
+
+        if self._watchdog is not None:
+            self._watchdog.idle(timeout / 1000)
+        self._stats.begin("idle")
+        event = pg.event.wait(timeout)
+        if event.type != pg.NOEVENT:
+            pg.event.post(event)
+        self._stats.end()
+        self._clock.tick()
+
     def quit(self) -> None:
         """Stop instance from continuing to run."""
         log.info("Telling %s to quit", type(self).__name__)
@@ -88,9 +208,11 @@ class EventManager:
         self,
         listeners: Iterable[Listener] | None = None,
         event_types: Iterable[tuple[int, ...] | int] | None = None,
+        stats: FrameStats | None = None,
     ) -> None:
         """Store `Listener`s with `event_type` key."""
         self._listeners = {}
+        self._stats = stats or NullFrameStats()
         if not (listeners is None or event_types is None):
             for listener, event_type in zip(listeners, event_types):
                 self.register_listener(listener, event_type)
@@ -137,14 +259,17 @@ class EventManager:
 
     def manage_events(self) -> None:
         """Process `pygame` queue of events for events of interest."""
-        for event in pg.event.get():
-            keys = tuple(
-                key for key in (event.type, event.dict.get("key")) if key is not None
-            )
-            listener = self._listeners.get(keys)
-
-            if listener is not None:
-                listener.notify()
+        self._stats.begin("events")
+        if pg.event.peek():
+            for event in pg.event.get():
+                key = getattr(event, "key", None)
+                listener = self._listeners.get(
+                    (event.type,) if key is None else (event.type, key)
+                )
+
+                if listener is not None:
+                    listener.notify()
+        self._stats.end()
 
 
 class QuitAction(Listener):
@@ -0,0 +1,375 @@
+import heapq
+import itertools
+import json
+import logging
+import os
+import selectors
+import socket
+import stat
+import threading
+from collections.abc import Iterable
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from screen_animator.settings import SettingsManager
+
+if TYPE_CHECKING:
+    from _typeshed import FileDescriptorLike
+
+log = logging.getLogger(__name__)
+
+MAX_QUEUED = 16
+MAX_LINE = 4096
+POLL_INTERVAL = 0.5
+
+
+class MessageQueue:
+    """
+    Bounded queue of messages, taken highest priority first, and in the order put
+    for the same priority.
+
+    Putting waits while the queue is full, so a feed stops reading until messages
+    are taken, and clients writing faster than messages are shown are held back.
+
+    Attributes
+    ----------
+    closed
+        Whether the queue is closed, so nothing more can be put.
+
+    Methods
+    -------
+    put
+        Add a message, waiting while the queue is full.
+    get_nowait
+        Take the highest priority message, without waiting.
+    close
+        Close the queue, waking anything waiting to put.
+    """
+
+    def __init__(self, max_size: int = MAX_QUEUED) -> None:
+        """
+        Create an empty queue.
+
+        Parameters
+        ----------
+        max_size : optional
+            Most messages held at once (default is 16).
+        """
+        self._max_size = max_size
+        log.info("Creating %s", self)
+
+        self.closed = False
+        self._messages: list[tuple[int, int, str]] = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._max_size})"
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def put(
+        self, message: str, priority: int = 0, timeout: float | None = None
+    ) -> bool:
+        """
+        Add a message, waiting while the queue is full.
+
+        Parameters
+        ----------
+        message
+            Message to add.
+        priority : optional
+            Messages with higher priority are taken first (default is 0).
+        timeout : optional
+            Most seconds to wait for space (default is None, wait until there is
+            space or the queue is closed).
+
+        Returns
+        -------
+        bool
+            Whether the message was added, False if the queue stayed full or closed.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self.closed or len(self._messages) < self._max_size, timeout
+            ):
+                return False
+            if self.closed:
+                return False
+            heapq.heappush(self._messages, (-priority, next(self._order), message))
+
+        return True
+
+    def get_nowait(self) -> str | None:
+        """Take the highest priority message, or None if there are none waiting."""
+        with self._condition:
+            if not self._messages:
+                return None
+            _, _, message = heapq.heappop(self._messages)
+            self._condition.notify()
+
+        return message
+
+    def close(self) -> None:
+        """Close the queue, waking anything waiting to put."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class MessageFeed:
+    """
+    Reads messages pushed to a Unix socket or named pipe from a separate thread.
+
+    Each line written is a message, either plain text with priority 0, or a JSON
+    object with `text` and optional `priority`, e.g.
+    `{"text": "Breaking news", "priority": 1}`. Messages are queued, higher priority
+    first, with the separator added, for the scrolling text to render and show in
+    place of its next message. Only text is handled here, as fonts must only be used
+    from the main thread. While the queue is full, the feed stops reading, so
+    clients are held back rather than messages dropped or the animation slowed.
+
+    Attributes
+    ----------
+    path
+        Path of the socket or named pipe.
+    queue
+        Message text, waiting to be shown.
+
+    Methods
+    -------
+    start
+        Open the socket or named pipe, and start reading in a separate thread.
+    stop
+        Stop reading, and close the socket or named pipe.
+    get
+        Take the next message, without waiting.
+    """
+
+    def __init__(
+        self,
+        settings_manager: SettingsManager,
+        path: str | PathLike,
+        max_queued: int = MAX_QUEUED,
+        interval: float = POLL_INTERVAL,
+    ) -> None:
+        """
+        Set where to read messages from.
+
+        Parameters
+        ----------
+        settings_manager
+            Manages settings, for the separator added to messages.
+        path
+            Path of a named pipe to read, or of a Unix socket to create otherwise.
+        max_queued : optional
+            Most messages waiting to be shown (default is 16).
+        interval : optional
+            Most seconds to wait before checking whether reading was stopped
+            (default is 0.5).
+        """
+        self._settings_manager = settings_manager
+        self.path = Path(path)
+        self._max_queued = max_queued
+        self._interval = interval
+        log.info("Creating %s", self)
+
+        self.queue = MessageQueue(max_queued)
+        self._selector: selectors.BaseSelector | None = None
+        self._listener: socket.socket | None = None
+        self._buffers: dict[int, bytes] = {}
+        self._discarding: set[int] = set()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_manager}, {str(self.path)!r}, {self._max_queued}, {self._interval})"
+
+    def start(self) -> None:
+        """
+        Open the socket or named pipe, and start reading in a separate thread.
+
+        Raises
+        ------
+        OSError
+            If the socket or named pipe cannot be opened.
+        """
+        log.info("Starting %s", self)
+        selector = self._selector = selectors.DefaultSelector()
+        if self.path.is_fifo():
+            self._open_fifo(selector)
+        else:
+            self._listener = self._open_socket(selector)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._serve,
+            args=(selector, self._listener),
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reading, wait for the thread to finish, and close the socket or pipe."""
+        log.info("Stopping %s", self)
+        self._stopped.set()
+        self.queue.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._selector is not None:
+            for key in list(self._selector.get_map().values()):
+                self._close(key.fileobj)
+            self._selector.close()
+            self._selector = None
+        if self._listener is not None:
+            self.path.unlink(missing_ok=True)
+            self._listener = None
+
+    def get(self) -> str | None:
+        """Take the next message, with the separator, or None if there are none."""
+        return self.queue.get_nowait()
+
+    def _open_fifo(self, selector: selectors.BaseSelector) -> None:
+        # Opened for writing too, so the pipe stays open between writers.
+        fd = os.open(self.path, os.O_RDWR | os.O_NONBLOCK)
+        selector.register(fd, selectors.EVENT_READ)
+        log.info("Reading messages from named pipe %s", self.path)
+
+    def _open_socket(self, selector: selectors.BaseSelector) -> socket.socket:
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix sockets are not available")
+        if self.path.exists() and stat.S_ISSOCK(self.path.stat().st_mode):
+            self.path.unlink()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(os.fspath(self.path))
+        listener.listen()
+        listener.setblocking(False)
+        selector.register(listener, selectors.EVENT_READ)
+        log.info("Listening for messages on socket %s", self.path)
+
+        return listener
+
+    def _serve(
+        self, selector: selectors.BaseSelector, listener: socket.socket | None
+    ) -> None:
+        while not self._stopped.is_set():
+            for key, _ in selector.select(self._interval):
+                if listener is not None and key.fileobj is listener:
+                    self._accept(selector, listener)
+                elif not self._read(selector, key):
+                    return
+
+    def _accept(
+        self, selector: selectors.BaseSelector, listener: socket.socket
+    ) -> None:
+        try:
+            connection, _ = listener.accept()
+        except BlockingIOError:
+            return
+        log.debug("Feed client connected")
+        connection.setblocking(False)
+        selector.register(connection, selectors.EVENT_READ)
+
+    def _read(
+        self, selector: selectors.BaseSelector, key: selectors.SelectorKey
+    ) -> bool:
+        """
+        Read from a client, queueing each complete line, and any line left once the
+        client disconnects. Lines longer than `MAX_LINE` are dropped, up to the next
+        newline. Returns False once the queue is closed.
+        """
+        try:
+            data = os.read(key.fd, MAX_LINE)
+        except BlockingIOError:
+            return True
+        except OSError:
+            log.exception("Cannot read from feed client")
+            data = b""
+        if not data:
+            log.debug("Feed client disconnected")
+            selector.unregister(key.fileobj)
+            self._close(key.fileobj)
+            self._discarding.discard(key.fd)
+            lines = [self._buffers.pop(key.fd, b"")]
+        elif key.fd in self._discarding and b"\n" not in data:
+            lines = []
+        else:
+            if key.fd in self._discarding:
+                self._discarding.remove(key.fd)
+                data = data.split(b"\n", 1)[1]
+            *lines, rest = (self._buffers.pop(key.fd, b"") + data).split(b"\n")
+            if len(rest) > MAX_LINE:
+                log.warning("Feed line longer than %s bytes, dropping it", MAX_LINE)
+                self._discarding.add(key.fd)
+            elif rest:
+                self._buffers[key.fd] = rest
+        for line in lines:
+            if len(line) > MAX_LINE:
+                log.warning("Feed line longer than %s bytes, dropping it", MAX_LINE)
+                continue
+            message = self._parse(line.decode("utf-8", "replace").rstrip("\r"))
+            if message is None:
+                continue
+            text, priority = message
+            separator = self._settings_manager.config.messages.separator
+            if not self.queue.put(f"{text}{separator}", priority):
+                return False
+
+        return True
+
+    @staticmethod
+    def _close(fileobj: "FileDescriptorLike") -> None:
+        """Close a socket, or the file descriptor of a named pipe."""
+        if isinstance(fileobj, socket.socket):
+            fileobj.close()
+        else:
+            os.close(fileobj if isinstance(fileobj, int) else fileobj.fileno())
+
+    def _parse(self, line: str) -> tuple[str, int] | None:
+        """Message text and priority from a line, or None if there is no message."""
+        if line.startswith("{"):
+            try:
+                match json.loads(line):
+                    case {"text": str(text), "priority": int(priority)}:
+                        pass
+                    case {"text": str(text)}:
+                        priority = 0
+                    case _:
+                        raise ValueError("expected `text`, and `priority` if given")
+            except ValueError as error:
+                log.warning("Ignoring feed message %r: %s", line, error)
+                return None
+        else:
+            text, priority = line, 0
+
+        if not text.strip():
+            return None
+        log.info("Received feed message %r with priority %s", text, priority)
+
+        return text, priority
+
+
+def send_messages(
+    path: str | PathLike, messages: Iterable[str], priority: int = 0
+) -> None:
+    """
+    Send messages to a feed listening on a Unix socket, waiting while its queue is
+    full.
+
+    Parameters
+    ----------
+    path
+        Path of the socket.
+    messages
+        Messages to send.
+    priority : optional
+        Messages with higher priority are shown first (default is 0).
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(os.fspath(path))
+        for message in messages:
+            line = json.dumps({"text": message, "priority": priority})
+            client.sendall(f"{line}\n".encode())
@@ -0,0 +1,134 @@
+import gc
+import logging
+from time import perf_counter
+
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+from screen_animator.settings import SettingsManager
+
+log = logging.getLogger(__name__)
+
+GC_POLICIES = ["auto", "frame"]
+MAX_DEFERRAL = 10
+
+
+class FrameCollector:
+    """
+    Runs Python's cyclic garbage collector between frames, rather than whenever
+    enough objects have been allocated, which may be in the middle of drawing.
+
+    When started, everything loaded so far, e.g. settings, images and fonts, is
+    collected once and frozen, so later collections do not scan it again, and
+    automatic collection is turned off. After each frame, if the time left before
+    the next frame is due is longer than the last pause of a generation due, that
+    generation is collected, trying the oldest generation due first. A generation is
+    due once its count passes its threshold, as for automatic collection. If frames
+    never finish early, e.g. without a target FPS, a generation is collected anyway
+    once its count passes `MAX_DEFERRAL` times its threshold, so memory does not grow
+    without bound.
+
+    Attributes
+    ----------
+    pauses
+        Seconds taken by the last collection of each generation.
+
+    Methods
+    -------
+    start
+        Freeze objects loaded so far, and turn off automatic collection.
+    stop
+        Turn automatic collection back on, unfreezing objects.
+    collect
+        Collect the oldest generation due, if there is time before the next frame.
+    """
+
+    def __init__(
+        self,
+        settings_manager: SettingsManager,
+        stats: FrameStats | None = None,
+        max_deferral: float = MAX_DEFERRAL,
+    ) -> None:
+        """
+        Set the target frame time to collect within.
+
+        Parameters
+        ----------
+        settings_manager
+            Manages settings, with the target FPS.
+        stats : optional
+            Records time taken by collections (default is None, not recorded).
+        max_deferral : optional
+            Multiple of its threshold a generation's count can reach before it is
+            collected without time to spare (default is 10).
+        """
+        self._settings_manager = settings_manager
+        self._stats = stats or NullFrameStats()
+        self._max_deferral = max_deferral
+        log.info("Creating %s", self)
+
+        self.pauses = [0.0, 0.0, 0.0]
+        self._thresholds = gc.get_threshold()
+        self._was_enabled = gc.isenabled()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_manager}, {self._stats}, {self._max_deferral})"
+
+    def start(self) -> None:
+        """Collect and freeze objects loaded so far, and turn off automatic collection."""
+        log.info("Freezing objects and turning off automatic garbage collection")
+        self._thresholds = gc.get_threshold()
+        self._was_enabled = gc.isenabled()
+        gc.collect()
+        gc.freeze()
+        log.info("%s objects frozen", gc.get_freeze_count())
+        gc.disable()
+
+    def stop(self) -> None:
+        """Turn automatic collection back on if it was on, unfreezing objects."""
+        log.info("Restoring automatic garbage collection")
+        gc.unfreeze()
+        if self._was_enabled:
+            gc.enable()
+
+    def collect(self, work_time: float) -> int | None:
+        """
+        Collect the oldest generation due, if there is time before the next frame.
+
+        Parameters
+        ----------
+        work_time
+            Seconds spent working on the frame just finished.
+
+        Returns
+        -------
+        int or None
+            Generation collected, or None if nothing was collected.
+        """
+        fps = self._settings_manager.config.timings.fps
+        spare_time = 1 / fps - work_time if fps > 0 else 0.0
+        counts = gc.get_count()
+        for generation in (2, 1, 0):
+            threshold = self._thresholds[generation]
+            if threshold <= 0 or counts[generation] <= threshold:
+                continue
+            if (
+                spare_time >= self.pauses[generation]
+                or counts[generation] >= threshold * self._max_deferral
+            ):
+                self._collect(generation, spare_time)
+                return generation
+
+        return None
+
+    def _collect(self, generation: int, spare_time: float) -> None:
+        self._stats.begin("gc")
+        start = perf_counter()
+        collected = gc.collect(generation)
+        self.pauses[generation] = perf_counter() - start
+        self._stats.end()
+        self._stats.count("gc.collected", collected)
+        log.debug(
+            "Collected generation %s in %.3f ms, with %.3f ms to spare",
+            generation,
+            1000 * self.pauses[generation],
+            1000 * spare_time,
+        )
@@ -0,0 +1,271 @@
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from typing import Any
+
+from screen_animator.settings import SettingsManager
+
+log = logging.getLogger(__name__)
+
+GOVERNOR_DEFAULTS: dict[str, Any] = {
+    "min_outline_copies": 0,
+    "min_image_number": 0,
+    "anti_aliasing": True,
+    "window": 1.0,
+    "settle": 2.0,
+    "lower_load": 0.6,
+    "upper_load": 0.95,
+}
+MIN_WINDOW_FRAMES = 10
+
+
+class Knob(ABC):
+    """
+    Interface for a setting the governor can step down to reduce rendering work.
+
+    Methods
+    -------
+    step_down
+        Lower quality by one step (sublasses to implement).
+    step_up
+        Raise quality by one step (sublasses to implement).
+    """
+
+    def __init__(
+        self, name: str, settings_dict: MutableMapping[str, Any], key: str
+    ) -> None:
+        """
+        Store the setting to change, and its original value as the highest quality.
+
+        Parameters
+        ----------
+        name
+            Short name of the knob, e.g. for reporting.
+        settings_dict
+            Dictionary of settings containing the setting.
+        key
+            Key of the setting.
+        """
+        self.name = name
+        self._settings_dict = settings_dict
+        self._key = key
+
+        self._original = settings_dict[key]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {type(self._settings_dict).__name__}(), {self._key!r})"
+
+    def __str__(self) -> str:
+        return f"{self.name} {self.value}"
+
+    @property
+    def value(self) -> Any:
+        """Current value of the setting."""
+        return self._settings_dict[self._key]
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._settings_dict[self._key] = value
+
+    @abstractmethod
+    def step_down(self) -> bool:
+        """Lower quality by one step, returning whether it changed."""
+
+    @abstractmethod
+    def step_up(self) -> bool:
+        """Raise quality by one step, returning whether it changed."""
+
+
+class CountKnob(Knob):
+    """
+    Count that is halved to lower quality, and doubled back up to its original value.
+
+    Methods
+    -------
+    step_down
+        Halve the count, no lower than the minimum.
+    step_up
+        Double the count, no higher than its original value.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        settings_dict: MutableMapping[str, Any],
+        key: str,
+        minimum: int = 0,
+    ):
+        """
+        Store the setting to change, and the lowest it can be set to.
+
+        Parameters
+        ----------
+        name
+            Short name of the knob, e.g. for reporting.
+        settings_dict
+            Dictionary of settings containing the setting.
+        key
+            Key of the setting.
+        minimum : optional
+            Lowest value the count can be set to (default is 0).
+        """
+        super().__init__(name, settings_dict, key)
+        self._minimum = min(minimum, self._original)
+
+    def step_down(self) -> bool:
+        """Halve the count, no lower than the minimum."""
+        value = max(self._minimum, self.value // 2)
+        changed = value != self.value
+        self.value = value
+
+        return changed
+
+    def step_up(self) -> bool:
+        """Double the count, no higher than its original value."""
+        value = min(self._original, max(1, self.value * 2))
+        changed = value != self.value
+        self.value = value
+
+        return changed
+
+
+class SwitchKnob(Knob):
+    """
+    Switch that is turned off to lower quality, if it was originally on.
+
+    Methods
+    -------
+    step_down
+        Turn off.
+    step_up
+        Turn back on, if originally on.
+    """
+
+    def __str__(self) -> str:
+        return f"{self.name} {'on' if self.value else 'off'}"
+
+    def step_down(self) -> bool:
+        """Turn off."""
+        changed = self.value
+        self.value = False
+
+        return changed
+
+    def step_up(self) -> bool:
+        """Turn back on, if originally on."""
+        changed = self.value != self._original
+        self.value = self._original
+
+        return changed
+
+
+class QualityGovernor:
+    """
+    Steps quality down when frames take too long to render to hold the target frame
+    rate, and back up when there is time to spare.
+
+    The load is the time spent working on each frame, as a fraction of the target
+    frame time, averaged over a window. Quality is stepped down when the load is
+    above the upper limit, by stepping down the first knob that can be, and stepped
+    up when below the lower limit, in reverse order. Frames are ignored for a while
+    after each step, as some changes only take effect with the next message. Knobs,
+    their bounds and the limits are set in the optional `governor` settings. Settings
+    are compiled again after each step, and the quality is described in the settings
+    state, e.g. for the FPS counter.
+
+    Attributes
+    ----------
+    knobs
+        Settings that can be stepped down, in order.
+
+    Methods
+    -------
+    observe
+        Record the time spent on a frame, changing quality if needed.
+    """
+
+    def __init__(self, settings_manager: SettingsManager) -> None:
+        """
+        Create knobs within the bounds in the settings.
+
+        Parameters
+        ----------
+        settings_manager
+            Manages the settings to change.
+        """
+        self._settings_manager = settings_manager
+        log.info("Creating %s", self)
+
+        settings = self._settings_manager.settings
+        self._governor_dict = GOVERNOR_DEFAULTS | settings.get("governor", {})
+        messages_dict = settings["messages"]
+        self.knobs: list[Knob] = [
+            CountKnob(
+                "outline",
+                messages_dict,
+                "outline_copies",
+                self._governor_dict["min_outline_copies"],
+            ),
+            CountKnob(
+                "images",
+                settings["images"],
+                "number",
+                self._governor_dict["min_image_number"],
+            ),
+        ]
+        if self._governor_dict["anti_aliasing"]:
+            self.knobs.insert(1, SwitchKnob("aa", messages_dict, "anti-aliasing"))
+        self._loads: list[float] = []
+        self._settle_frames = 0
+        self._report()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_manager})"
+
+    def observe(self, busy_time: float) -> None:
+        """
+        Record the time spent working on a frame, changing quality at the end of each
+        window if the load is outside the limits.
+
+        Parameters
+        ----------
+        busy_time
+            Seconds spent working on the frame, excluding time waiting for the next.
+        """
+        fps = self._settings_manager.config.timings.fps
+        if fps <= 0:
+            return
+
+        if self._settle_frames > 0:
+            self._settle_frames -= 1
+            return
+
+        self._loads.append(busy_time * fps)
+        if len(self._loads) < max(
+            MIN_WINDOW_FRAMES, round(self._governor_dict["window"] * fps)
+        ):
+            return
+
+        load = sum(self._loads) / len(self._loads)
+        self._loads.clear()
+        if load > self._governor_dict["upper_load"]:
+            self._step(self.knobs, "down", load)
+        elif load < self._governor_dict["lower_load"]:
+            self._step(self.knobs[::-1], "up", load)
+
+    def _step(self, knobs: list[Knob], direction: str, load: float) -> None:
+        for knob in knobs:
+            if getattr(knob, f"step_{direction}")():
+                log.info("Load %.2f, stepped quality %s: %s", load, direction, knob)
+                self._settings_manager.compile()
+                self._report()
+                self._settle_frames = round(
+                    self._governor_dict["settle"]
+                    * self._settings_manager.config.timings.fps
+                )
+                return
+
+    def _report(self) -> None:
+        self._settings_manager.state.quality = ", ".join(
+            str(knob) for knob in self.knobs
+        )
@@ -0,0 +1,197 @@
+import logging
+import os
+from collections.abc import Callable, Iterable
+from os import PathLike
+from pathlib import Path
+
+import numpy as np
+import pygame as pg
+
+from screen_animator.image_loading import ImageLoader, SvgTypeImageLoader
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+from screen_animator.item_groups import ItemGroup
+from screen_animator.model import Model
+from screen_animator.settings import SettingsManager
+from screen_animator.sinks import NullSink
+from screen_animator.timing import SimulatedClock
+from screen_animator.view import View
+
+log = logging.getLogger(__name__)
+
+HEADLESS_DISPLAY_SIZE = 800, 400
+
+
+def init_headless() -> None:
+    """Initialise `pygame` with the SDL dummy video driver, so no display is needed."""
+    if pg.display.get_init() and pg.display.get_driver() != "dummy":
+        log.info("Restarting `pygame` display with dummy video driver")
+        pg.display.quit()
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pg.init()
+
+
+class HeadlessRenderer:
+    """
+    Runs the `screen_animator` model and view off-screen, without a display.
+
+    Attributes
+    ----------
+    settings_manager
+        Manages the settings.
+    stats
+        Records time taken by each stage of every frame.
+    model
+        The model being rendered.
+    view
+        The view drawing the model to an off-screen surface.
+
+    Methods
+    -------
+    step
+        Update the model and draw a number of frames.
+    capture
+        Step through frames, returning them as arrays.
+    save
+        Step through frames, saving them as image files.
+    """
+
+    def __init__(
+        self,
+        settings_files: Iterable[str | PathLike],
+        size: tuple[int, int] = HEADLESS_DISPLAY_SIZE,
+        item_group_types: (
+            Iterable[Callable[[SettingsManager, pg.Rect], ItemGroup]] | None
+        ) = None,
+        rotated: bool = False,
+        seed: int | None = None,
+        stats: FrameStats | None = None,
+    ) -> None:
+        """
+        Initialise `pygame` without a display, and set up the model and view.
+
+        Time is simulated, advancing one frame at the target frame rate per frame
+        drawn, so frames can be drawn as fast as possible.
+
+        Parameters
+        ----------
+        settings_files
+            Paths to settings files.
+        size : optional
+            Width and height of frames in pixels (default is 800x400).
+        item_group_types : optional
+            Class handles for elements of the model (default is the same as the app).
+        rotated : optional
+            Flips the frames across the horizontal axis (default is False, not flipped).
+        seed : optional
+            Seed for random choices, for repeatable frames (default is None, seeded
+            from the system).
+        stats : optional
+            Records time taken by each stage of every frame (default is None, not
+            recorded).
+        """
+        if item_group_types is None:
+            from screen_animator import ITEM_GROUP_TYPES
+
+            item_group_types = ITEM_GROUP_TYPES
+        log.info("Creating %s", type(self).__name__)
+
+        init_headless()
+        ImageLoader.register_loader(".svg", SvgTypeImageLoader)
+        self._display = pg.Surface(size)
+        self.settings_manager = SettingsManager(
+            settings_files, seed=seed, clock=SimulatedClock()
+        )
+        self.stats = stats or NullFrameStats()
+        self.model = Model(
+            self.settings_manager, item_group_types, self._display.get_rect(), stats
+        )
+        self.view = View(
+            self.model,
+            self._display,
+            self.settings_manager.state,
+            rotated,
+            NullSink(),
+            stats,
+        )
+        log.info("%s initialization complete", type(self).__name__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.settings_manager}, {self._display.get_size()})"
+
+    @property
+    def frame(self) -> pg.Surface:
+        """The most recently drawn frame."""
+        return self._display
+
+    def step(self, frames: int = 1) -> None:
+        """
+        Update the model and draw a number of frames.
+
+        Parameters
+        ----------
+        frames : optional
+            Number of frames to step through (default is 1).
+        """
+        settings_manager = self.settings_manager
+        for _ in range(frames):
+            settings_manager.clock.tick(settings_manager.config.timings.fps)
+            self.model.update()
+            self.view.update()
+            settings_manager.state.fps_actual = settings_manager.clock.get_fps()
+            self.stats.end_frame()
+
+    def capture(self, frames: int, every: int = 1) -> list[np.ndarray]:
+        """
+        Step through frames, returning them as arrays.
+
+        Parameters
+        ----------
+        frames
+            Number of frames to step through.
+        every : optional
+            Interval between frames captured (default is 1, every frame).
+
+        Returns
+        -------
+        list[np.ndarray]
+            Frames captured, each with shape (height, width, 3).
+        """
+        captured = []
+        for frame_num in range(1, frames + 1):
+            self.step()
+            if frame_num % every == 0:
+                captured.append(pg.surfarray.array3d(self._display).transpose(1, 0, 2))
+
+        return captured
+
+    def save(
+        self, frames: int, directory: str | PathLike, every: int = 1
+    ) -> list[Path]:
+        """
+        Step through frames, saving them as image files.
+
+        Parameters
+        ----------
+        frames
+            Number of frames to step through.
+        directory
+            Directory to save images to, created if missing.
+        every : optional
+            Interval between frames saved (default is 1, every frame).
+
+        Returns
+        -------
+        list[Path]
+            Paths of images saved.
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        paths = []
+        for frame_num in range(1, frames + 1):
+            self.step()
+            if frame_num % every == 0:
+                path = Path(directory, f"frame_{frame_num:06d}.png")
+                pg.image.save(self._display, path)
+                paths.append(path)
+        log.info("Saved %s frames to %s", len(paths), directory)
+
+        return paths
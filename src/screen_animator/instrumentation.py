@@ -0,0 +1,261 @@
+import json
+import logging
+import tracemalloc
+from os import PathLike
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from screen_animator.listener import Listener
+
+log = logging.getLogger(__name__)
+
+HISTOGRAM_BINS_MS = (0, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 133, float("inf"))
+
+
+class FrameStats:
+    """
+    Records time spent in each stage of every frame, in ring buffers.
+
+    Stages can be nested, in which case time is only counted against the innermost
+    stage. A stage that runs more than once in a frame has its times added together.
+
+    Memory allocated by Python in each frame can also be recorded with `tracemalloc`,
+    as the peak traced memory above that at the start of the frame, counted as
+    `allocated_bytes`. Memory allocated outside Python, e.g. by SDL for surfaces, is
+    not included.
+
+    Attributes
+    ----------
+    current_stage
+        Innermost stage currently running, if any.
+
+    Methods
+    -------
+    begin
+        Start timing a stage.
+    end
+        Stop timing the most recently started stage.
+    reset
+        Discard all stored times.
+    count
+        Add to a counter for the current frame.
+    end_frame
+        Store the times for the frame just finished.
+    summary
+        Summarise stored times with percentiles and histograms.
+    dump
+        Write summary to a JSON file and print a table.
+    """
+
+    def __init__(self, capacity: int = 1024, allocations: bool = False) -> None:
+        """
+        Create empty ring buffers.
+
+        Parameters
+        ----------
+        capacity : optional
+            Number of frames stored for each stage (default is 1024).
+        allocations : optional
+            Whether to record memory allocated in each frame, starting `tracemalloc`
+            if needed (default is False).
+        """
+        self._capacity = capacity
+        self._allocations = allocations
+        log.info("Creating %s", self)
+
+        if self._allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._capacity}, {self._allocations})"
+
+    def reset(self) -> None:
+        """Discard all stored times."""
+        self.current_stage: str | None = None
+        self._stack: list[list[Any]] = []
+        self._frame: dict[str, float] = {}
+        self._buffers: dict[str, np.ndarray] = {}
+        self._recorded: dict[str, int] = {}
+        self._counters: set[str] = set()
+        self._frame_start = perf_counter()
+        self.frames = 0
+        self._start_allocations()
+
+    def begin(self, stage: str) -> None:
+        """
+        Start timing a stage.
+
+        Parameters
+        ----------
+        stage
+            Name of stage.
+        """
+        self._stack.append([stage, perf_counter(), 0.0])
+        self.current_stage = stage
+
+    def end(self) -> None:
+        """Stop timing the most recently started stage."""
+        stage, start, nested = self._stack.pop()
+        elapsed = perf_counter() - start
+        self._frame[stage] = self._frame.get(stage, 0.0) + elapsed - nested
+        if self._stack:
+            self._stack[-1][2] += elapsed
+            self.current_stage = self._stack[-1][0]
+        else:
+            self.current_stage = None
+
+    def count(self, counter: str, value: float = 1) -> None:
+        """
+        Add to a counter for the current frame, stored alongside stage times.
+
+        Parameters
+        ----------
+        counter
+            Name of counter.
+        value : optional
+            Amount to add (default is 1).
+        """
+        self._counters.add(counter)
+        self._frame[counter] = self._frame.get(counter, 0.0) + value
+
+    def end_frame(self) -> None:
+        """Store the times for the frame just finished, along with total frame time."""
+        if self._allocations:
+            self.count(
+                "allocated_bytes",
+                tracemalloc.get_traced_memory()[1] - self._traced_start,
+            )
+        now = perf_counter()
+        self._frame["frame"] = now - self._frame_start
+        self._frame_start = now
+        for stage, value in self._frame.items():
+            buffer = self._buffers.get(stage)
+            if buffer is None:
+                buffer = self._buffers[stage] = np.zeros(self._capacity)
+                self._recorded[stage] = 0
+            buffer[self._recorded[stage] % self._capacity] = value
+            self._recorded[stage] += 1
+        self._frame.clear()
+        self.frames += 1
+        self._start_allocations()
+
+    def _start_allocations(self) -> None:
+        if self._allocations:
+            tracemalloc.reset_peak()
+            self._traced_start = tracemalloc.get_traced_memory()[0]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarise stored times with percentiles and histograms.
+
+        Returns
+        -------
+        dict
+            Number of frames, and for each stage, the number of values stored, and
+            the mean, median, 95th and 99th percentile, and maximum in milliseconds,
+            with a histogram of values. Counters are summarised in the same way,
+            without conversion to milliseconds.
+        """
+        stages = {}
+        for stage, buffer in sorted(self._buffers.items()):
+            values = buffer[: min(self._recorded[stage], self._capacity)]
+            is_counter = stage in self._counters
+            if not is_counter:
+                values = values * 1000
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            stages[stage] = {
+                "count": len(values),
+                "mean": float(values.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(values.max()),
+                "unit": "count" if is_counter else "ms",
+            }
+            if not is_counter:
+                counts, _ = np.histogram(values, HISTOGRAM_BINS_MS)
+                stages[stage]["histogram"] = counts.tolist()
+
+        return {
+            "frames": self.frames,
+            "histogram_bins_ms": HISTOGRAM_BINS_MS[:-1],
+            "stages": stages,
+        }
+
+    def dump(self, path: str | PathLike | None = None) -> None:
+        """
+        Write summary to a JSON file if specified, and print a table of stage times.
+
+        Parameters
+        ----------
+        path : optional
+            Path of JSON file to write (default is None, no file written).
+        """
+        summary = self.summary()
+        if path is not None:
+            Path(path).write_text(json.dumps(summary, indent=2))
+            log.info("Frame stats written to %s", path)
+
+        print(f"Frame stats over {summary['frames']} frames:")
+        print(f"{'stage':<40}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+        for stage, stats in summary["stages"].items():
+            print(
+                f"{stage:<40}"
+                + "".join(
+                    f"{stats[key]:>9.3f}"
+                    for key in ("mean", "p50", "p95", "p99", "max")
+                )
+            )
+
+
+class NullFrameStats(FrameStats):
+    """`FrameStats` that records nothing, used when instrumentation is off."""
+
+    def begin(self, stage: str) -> None:
+        """Do nothing."""
+
+    def end(self) -> None:
+        """Do nothing."""
+
+    def count(self, counter: str, value: float = 1) -> None:
+        """Do nothing."""
+
+    def end_frame(self) -> None:
+        """Do nothing."""
+
+
+class DumpStatsAction(Listener):
+    """
+    Custom listener to dump frame stats on demand.
+
+    Methods
+    -------
+    notify
+        Dump frame stats.
+    """
+
+    def __init__(self, stats: FrameStats, path: str | PathLike | None = None) -> None:
+        """
+        Store stats to dump, and where to dump them.
+
+        Parameters
+        ----------
+        stats
+            Frame stats to dump.
+        path : optional
+            Path of JSON file to write (default is None, no file written).
+        """
+        self._stats = stats
+        self._path = path
+        log.info("Created %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._stats}, {self._path})"
+
+    def notify(self) -> None:
+        """Dump frame stats."""
+        self._stats.dump(self._path)
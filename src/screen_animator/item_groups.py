@@ -1,26 +1,210 @@
 import logging
-import random
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator, Set as AbstractSet
+from dataclasses import dataclass
 
 import pygame as pg
 import numpy as np
 
-from screen_animator.items import ScrollingMovement, RandomMovement, Item, Direction
+from screen_animator.feed import MessageFeed
+from screen_animator.items import (
+    CompactItem,
+    Direction,
+    GroupScrollingMovement,
+    MessageItem,
+    RandomMovement,
+)
 from screen_animator.settings import SettingsManager
 
 log = logging.getLogger(__name__)
 
+POSITION_DTYPE = np.dtype(
+    [("x", np.int32), ("y", np.int32), ("width", np.int32), ("height", np.int32)]
+)
+PRERENDERED_MESSAGES = 2
 
-class ItemGroup(ABC, pg.sprite.Group):
+
+class ItemArray:
+    """
+    Array-backed container of `CompactItem`s, in drawing order, standing in for a
+    `pygame` sprite group.
+
+    Items are held in a list, so they can be iterated without copying, and their
+    positions are gathered into a NumPy structured array, with fields `x`, `y`,
+    `width` and `height`, for checks across every item at once, e.g. with
+    `collides_any`. The array is gathered again from the items' rects when read
+    after any item moved or the items changed.
+
+    Attributes
+    ----------
+    positions
+        Position of each item, in drawing order.
+
+    Methods
+    -------
+    sprites
+        List of the items.
+    add
+        Add items.
+    remove
+        Remove items.
+    empty
+        Remove all items.
+    moved
+        Mark positions as needing to be gathered again.
+    update
+        Update each item.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty container."""
+        self._items: list[CompactItem] = []
+        self._positions = np.zeros(0, POSITION_DTYPE)
+        self._stale = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} items)"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[CompactItem]:
+        return iter(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return getattr(item, "group", None) is self
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Position of each item, in drawing order."""
+        if self._stale:
+            num_items = len(self._items)
+            if len(self._positions) < num_items:
+                self._positions = np.zeros(
+                    max(num_items, 2 * len(self._positions)), POSITION_DTYPE
+                )
+            self._positions[:num_items] = [
+                (item.rect.x, item.rect.y, item.rect.width, item.rect.height)
+                for item in self._items
+            ]
+            self._stale = False
+
+        return self._positions[: len(self._items)]
+
+    def sprites(self) -> list[CompactItem]:
+        """List of the items, in drawing order."""
+        return list(self._items)
+
+    def add(self, *items: CompactItem) -> None:
+        """
+        Add items after those already held, taking them from any other group.
+
+        Parameters
+        ----------
+        *items
+            Items to add.
+        """
+        for item in items:
+            if item.group is self:
+                continue
+            if item.group is not None:
+                item.group.remove(item)
+            item.group = self
+            self._items.append(item)
+        self._stale = True
+
+    def remove(self, *items: CompactItem) -> None:
+        """
+        Remove items, keeping the order of the others.
+
+        Parameters
+        ----------
+        *items
+            Items to remove.
+        """
+        removed = {item for item in items if item.group is self}
+        if not removed:
+            return
+
+        for item in removed:
+            item.group = None
+        self._items = [item for item in self._items if item not in removed]
+        self._stale = True
+
+    def empty(self) -> None:
+        """Remove all items."""
+        self.remove(*self._items)
+
+    def moved(self) -> None:
+        """Mark positions as needing to be gathered again, after an item moved."""
+        self._stale = True
+
+    def update(self, *args, **kwargs) -> None:
+        """Update each item."""
+        for item in self._items:
+            item.update(*args, **kwargs)
+
+
+def collides_any(rect: pg.Rect, positions: np.ndarray) -> bool:
+    """
+    Whether a rect overlaps any of the positions, as `pg.Rect.colliderect`.
+
+    Parameters
+    ----------
+    rect
+        Rect to check.
+    positions
+        Positions to check against, as held by `ItemArray`.
+
+    Returns
+    -------
+    bool
+        Whether any overlap.
+    """
+    if not (rect.width and rect.height):
+        return False
+
+    x, y = positions["x"], positions["y"]
+    width, height = positions["width"], positions["height"]
+
+    return bool(
+        np.any(
+            (width > 0)
+            & (height > 0)
+            & (x < rect.right)
+            & (x + width > rect.left)
+            & (y < rect.bottom)
+            & (y + height > rect.top)
+        )
+    )
+
+
+def group_items(item_group: Iterable | pg.sprite.AbstractGroup) -> Iterable:
+    """Items of a group in drawing order, without copying a `pygame` group's list."""
+    if isinstance(item_group, pg.sprite.AbstractGroup):
+        return item_group.spritedict
+
+    return item_group
+
+
+class ItemGroup(ABC, ItemArray):
     """
     Interface for `Item` groups.
 
+    Attributes
+    ----------
+    name
+        Name of the group.
+
     Methods
     -------
     create
         Create items in group (sublasses to implement).
     update
         Update items in group (sublasses to implement).
+    apply_settings
+        Respond to settings changed by a reload.
     """
 
     def __init__(self, settings_manager: SettingsManager, perimeter: pg.Rect) -> None:
@@ -38,16 +222,33 @@ class ItemGroup(ABC, pg.sprite.Group):
         self._settings_manager = settings_manager
         self._perimeter = perimeter
 
-        self._settings = self._settings_manager.settings
+    @property
+    def name(self) -> str:
+        """Name of the group, e.g. for reporting."""
+        return type(self).__name__
 
     @abstractmethod
     def create(self) -> None:
         """Create item(s) in group, to be implemented by sublasses."""
 
+    def apply_settings(self, changed: AbstractSet[str]) -> None:
+        """
+        Respond to settings changed by a reload, doing nothing unless overridden by
+        groups depending on them.
+
+        Parameters
+        ----------
+        changed
+            Dotted path of each setting that changed, e.g. `messages.messages`.
+        """
+
 
 class TimeableItemGroup(ItemGroup):
     """
     Interface for allowing ItemGroups to be controlled by time.
+
+    Groups are only updated each time their time difference passes, by the
+    scheduler in the model.
     """
 
     _time_diff: float
@@ -58,81 +259,64 @@ class TimeableItemGroup(ItemGroup):
         return self._time_diff
 
 
-class TimedItemGroup(ItemGroup):
+@dataclass(frozen=True, slots=True)
+class RenderedMessage:
     """
-    Manages when wrapped groups are updated.
-
-    Methods
-    -------
-    create
-        Create items in wrapped `ItemGroup`, set the initial time tracked by `pygame`.
-    update
-        Change wrapped `ItemGroup`.
+    Message rendered, ready to scroll.
+
+    Attributes
+    ----------
+    text
+        Message text, with the separator.
+    font
+        Font the message was rendered with.
+    content
+        Message rendered in the text color.
+    outline_content
+        Message rendered in the outline color, or None if there is no outline.
+    render_key
+        Settings the message was rendered with.
     """
 
-    _time: int
-
-    def __init__(
-        self,
-        settings_manager: SettingsManager,
-        perimeter: pg.Rect,
-        wrapped_group: type[TimeableItemGroup],
-    ) -> None:
-        """
-        Initialise group with settings and context perimeter.
-
-        Parameters
-        ----------
-        settings_manager
-            Dictionary of settings.
-        perimeter
-            Outer limit of 'canvas' in `pygame`.
-        """
-        super().__init__(settings_manager, perimeter)
-        self._wrapped_group_type = wrapped_group
-        log.info("Creating %s", self)
-
-        self._wrapped_group = wrapped_group(settings_manager, perimeter)
-
-    def __repr__(self) -> str:
-        return f"{type(self).__name__}({self._settings_manager}, {self._perimeter}, {self._wrapped_group_type})"
-
-    def sprites(self):
-        """Sprites in wrapped group."""
-        return self._wrapped_group.sprites()
-
-    def create(self) -> None:
-        """Run wrapped instance method, set the elapsed time according to `pygame`."""
-        self._wrapped_group.create()
-        self._time = pg.time.get_ticks()
-
-    def update(self):
-        """Check elapsed time, run wrapped instance update if ready."""
-        time = pg.time.get_ticks()
-        time_diff = time - self._time
-        if time_diff >= self._wrapped_group.time_diff * 1000:
-            log.debug(
-                "%s milliseconds passed, updating %s", time_diff, type(self).__name__
-            )
-            self._wrapped_group.update()
-            self._time = time
+    text: str
+    font: pg.Font
+    content: pg.Surface
+    outline_content: pg.Surface | None
+    render_key: tuple
 
 
 class LeftScrollingTextItemGroup(ItemGroup):
     """
     Group of items that will scroll messages to the left.
 
+    The group scrolls as a whole, with item positions relative to where scrolling
+    started, so scrolling costs the same however many outline copies there are. Each
+    message and its outlines are kept together, and removed together once scrolled
+    off screen. With a feed, messages pushed to it are shown next, ahead of those
+    from the settings. Fonts are only used from the main thread, so feed messages
+    are rendered here, one each update at most, a few messages ahead of being
+    shown, so bursts of messages do not slow frames.
+
     Methods
     -------
     create
         Create a message with a set speed to the left.
     update
         Update messages depending on message position.
+    empty
+        Remove all messages and outlines.
+    apply_settings
+        Update speed, or start again with a new message, when settings change.
     """
 
-    _movement = ScrollingMovement
+    _movement = GroupScrollingMovement
 
-    def __init__(self, settings_manager: SettingsManager, perimeter: pg.Rect) -> None:
+    def __init__(
+        self,
+        settings_manager: SettingsManager,
+        perimeter: pg.Rect,
+        feed: MessageFeed | None = None,
+    ) -> None:
         """
         Initialize group with a settings manager and defined perimeter.
 
@@ -142,18 +326,20 @@ class LeftScrollingTextItemGroup(ItemGroup):
             Manages settings.
         perimeter
             Defines outer perimeter.
+        feed : optional
+            Feed of messages to show next, when any are waiting (default is None,
+            only messages from the settings are shown).
         """
         super().__init__(settings_manager, perimeter)
+        self._feed = feed
         log.info("Creating %s", self)
 
-        speed = (
-            self._settings["messages"]["scroll_speed"]
-            // self._settings["timings"]["fps"]
-        )
-        self._scrolling_movement = self._movement(speed, Direction.LEFT)
+        self._scrolling_movement = self._movement(self._base_speed(), Direction.LEFT)
+        self._messages: list[MessageItem] = []
+        self._prerendered: deque[RenderedMessage] = deque()
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self._settings_manager}, {self._perimeter})"
+        return f"{type(self).__name__}({self._settings_manager}, {self._perimeter}, {self._feed})"
 
     @property
     def speed(self) -> float:
@@ -168,99 +354,206 @@ class LeftScrollingTextItemGroup(ItemGroup):
         """
         Create a message `Item` that scrolls to the left with a set speed.
 
-        Message is initially placed with middle-left set at the middle-right of the
-        perimeter, i.e. off-screen to the right.
+        The next message from the feed is taken if one has been rendered, rendered
+        again if colors changed since, otherwise a message is chosen from the
+        settings and rendered. Message is initially placed with middle-left set at
+        the middle-right of the perimeter, i.e. off-screen to the right.
         """
-        messages_dict = self._settings["messages"]
-        self._settings_manager.set_font()
-        message_text = self._settings_manager.generate_message_text()
-        log.debug("Creating %s with text: %s", Item.__name__, message_text)
-        start_position = self._calculate_start_position(message_text)
-        self._set_outline(message_text, start_position)
-        message = Item(
-            self,
-            self._generate_message(message_text, messages_dict["font"]),
-            self._perimeter,
-            self._scrolling_movement,
+        if not self._prerendered:
+            rendered = self._render_next_message()
+        else:
+            rendered = self._prerendered.popleft()
+            if rendered.render_key != self._render_key(rendered.font):
+                log.debug("Colors changed since rendering feed message, rendering")
+                rendered = self._render(rendered.text, rendered.font)
+        log.debug("Creating %s with text: %s", MessageItem.__name__, rendered.text)
+        x_offset, y_offset = self._scrolling_movement.offset()
+        start_x, start_y = self._calculate_start_position(rendered.content.get_height())
+        start_position = start_x - round(x_offset), start_y - round(y_offset)
+        outlines = self._set_outline(rendered.outline_content, start_position)
+        message = MessageItem(
+            self, rendered.content, self._perimeter, self._scrolling_movement
         )
-        setattr(message, "message_text", message_text)
-        setattr(message, "font", messages_dict["font"])
+        message.message_text = rendered.text
+        message.font = rendered.font
+        message.render_key = rendered.render_key
         message.rect.midleft = start_position
-        message.rect.x += messages_dict["outline_width"]
+        message.rect.x += self._settings_manager.config.messages.outline_width
+        message.outlines = outlines
+        message.extent = message.rect.unionall([outline.rect for outline in outlines])
+        self._messages.append(message)
 
     def update(self):
         """
         Update messages in group.
 
-        If the message has left the left side of the perimeter entirely, it will be
-        deleted. If all messages are within the right-hand perimeter, a new message
-        will be generated.
+        The group is scrolled on. Once a message and its outlines have left the left
+        side of the perimeter entirely, they will be deleted, and the distance
+        scrolled is moved into the positions of those left, so it stays small.
+        Messages are rendered again if their color or anti-aliasing has changed. If
+        the newest message is within the right-hand perimeter, a new message will be
+        generated. The next message waiting in the feed, if any, is rendered.
         """
-        super().update()
-
-        for message in self.sprites():
-            if message.rect.right < self._perimeter.left:
-                log.debug("%s has scrolled off screen, destroying", message)
-                message.kill()
-            else:
-                try:
-                    message.content = self._generate_message(
-                        message.message_text, message.font
-                    )
-                except AttributeError:
-                    pass
+        self._scrolling_movement.advance()
+        x_offset = round(self._scrolling_movement.offset()[0])
+        for message in self._messages:
+            render_key = self._render_key(message.font)
+            if message.render_key != render_key:
+                message.content = self._generate_message(
+                    message.message_text, message.font
+                )
+                message.render_key = render_key
 
-        if all(
-            message.rect.right <= self._perimeter.right for message in self.sprites()
+        removed = False
+        while (
+            self._messages
+            and self._messages[0].extent.right + x_offset < self._perimeter.left
+        ):
+            message = self._messages.pop(0)
+            log.debug("%s has scrolled off screen, destroying", message)
+            self.remove(*message.outlines, message)
+            removed = True
+        if removed or not self._messages:
+            self._rebase()
+            x_offset = round(self._scrolling_movement.offset()[0])
+
+        if (
+            not self._messages
+            or self._messages[-1].extent.right + x_offset <= self._perimeter.right
         ):
             self.create()
+        self._prerender()
 
-    def _generate_message(self, message_text: str, font: pg.Font) -> pg.Surface:
-        messages_dict = self._settings["messages"]
+    def empty(self) -> None:
+        """Remove all messages and outlines."""
+        super().empty()
+        self._messages.clear()
 
+    def apply_settings(self, changed: AbstractSet[str]) -> None:
+        """
+        Update the speed if the scroll speed or FPS changed. If any other message
+        settings changed, messages on screen are removed and a new one created, so
+        only text is rendered again.
+
+        Parameters
+        ----------
+        changed
+            Dotted path of each setting that changed, e.g. `messages.messages`.
+        """
+        if changed & {"messages.scroll_speed", "timings.fps"}:
+            self.speed = self._base_speed()
+        if any(
+            path.startswith("messages.") and path != "messages.scroll_speed"
+            for path in changed
+        ):
+            log.info("Message settings changed, starting a new message")
+            self._prerendered = deque(
+                self._render(rendered.text, self._next_font())
+                for rendered in self._prerendered
+            )
+            self.empty()
+            self.create()
+
+    def _rebase(self) -> None:
+        """Move the distance scrolled into item positions, drawing them in place."""
+        x_shift, y_shift = self._scrolling_movement.rebase()
+        if not (x_shift or y_shift):
+            return
+
+        for item in self:
+            item.rect.move_ip(x_shift, y_shift)
+        for message in self._messages:
+            message.extent.move_ip(x_shift, y_shift)
+        self.moved()
+
+    def _base_speed(self) -> float:
+        config = self._settings_manager.config
+
+        return config.messages.scroll_speed // config.timings.fps
+
+    def _render_key(self, font: pg.Font) -> tuple:
+        """Settings a message is rendered with, to only render again when changed."""
+        return (
+            font,
+            self._settings_manager.config.messages.anti_aliasing,
+            self._settings_manager.state.color,
+        )
+
+    def _render_next_message(self) -> RenderedMessage:
+        """Choose a message from the settings, with a new font, and render it."""
+        font = self._next_font()
+
+        return self._render(self._settings_manager.generate_message_text(), font)
+
+    def _prerender(self) -> None:
+        """Render the next message waiting in the feed, unless enough are rendered."""
+        if self._feed is None or len(self._prerendered) >= PRERENDERED_MESSAGES:
+            return
+
+        text = self._feed.get()
+        if text is not None:
+            log.debug("Rendering feed message: %s", text)
+            self._prerendered.append(self._render(text, self._next_font()))
+
+    def _next_font(self) -> pg.Font:
+        """Font of a new size chosen from the settings."""
+        return self._settings_manager.set_font()
+
+    def _render(self, text: str, font: pg.Font) -> RenderedMessage:
+        """Render message text, with its outline if there is one."""
+        messages = self._settings_manager.config.messages
+        state = self._settings_manager.state
+
+        return RenderedMessage(
+            text,
+            font,
+            self._generate_message(text, font),
+            (
+                font.render(text, messages.anti_aliasing, state.outline_color)
+                if messages.outline_width > 0
+                else None
+            ),
+            self._render_key(font),
+        )
+
+    def _generate_message(self, message_text: str, font: pg.Font) -> pg.Surface:
         return font.render(
             message_text,
-            messages_dict["anti-aliasing"],
-            messages_dict["color"],
+            self._settings_manager.config.messages.anti_aliasing,
+            self._settings_manager.state.color,
         )
 
-    def _set_outline(self, message_text: str, start_position: tuple[int, int]) -> None:
-        messages_dict = self._settings["messages"]
-        log.debug("Setting text outline with width %s", messages_dict["outline_width"])
-        outline_width = messages_dict["outline_width"]
-        if outline_width > 0:
-            outline_text = messages_dict["font"].render(
-                message_text,
-                messages_dict["anti-aliasing"],
-                messages_dict["outline_color"],
-            )
-            angles = np.linspace(
-                0, 360, messages_dict["outline_copies"], endpoint=False
-            )
+    def _set_outline(
+        self, outline_text: pg.Surface | None, start_position: tuple[int, int]
+    ) -> list[CompactItem]:
+        messages = self._settings_manager.config.messages
+        log.debug("Setting text outline with width %s", messages.outline_width)
+        outline_width = messages.outline_width
+        outlines = []
+        if outline_width > 0 and outline_text is not None:
+            angles = np.linspace(0, 360, messages.outline_copies, endpoint=False)
             x_shift = outline_width * np.cos(np.radians(angles - 90)) + outline_width
             y_shift = outline_width * np.sin(np.radians(angles - 90))
             xy_shifts = np.transpose(np.vstack((x_shift, y_shift)))
             for xy_shift in xy_shifts:
-                outline = Item(
+                outline = CompactItem(
                     self, outline_text, self._perimeter, self._scrolling_movement
                 )
                 outline.rect.midleft = start_position
                 outline.rect.x += xy_shift[0]
                 outline.rect.y += xy_shift[1]
+                outlines.append(outline)
 
-    def _calculate_start_position(self, message_text: str) -> tuple[int, int]:
-        messages_dict = self._settings["messages"]
-        if not messages_dict["start_middle"]:
-            dummy_message = self._generate_message(message_text, messages_dict["font"])
-            height = dummy_message.get_rect().height
+        return outlines
 
+    def _calculate_start_position(self, height: int) -> tuple[int, int]:
+        messages = self._settings_manager.config.messages
+        if not messages.start_middle:
             return (
                 self._perimeter.right,
-                random.randint(
-                    height // 2 + messages_dict["outline_width"],
-                    self._perimeter.bottom
-                    - height // 2
-                    - messages_dict["outline_width"],
+                self._settings_manager.rng.randint(
+                    height // 2 + messages.outline_width,
+                    self._perimeter.bottom - height // 2 - messages.outline_width,
                 ),
             )
 
@@ -277,6 +570,8 @@ class RandomImagesItemGroup(TimeableItemGroup):
         Create all the image items.
     update
         Update the position of all image items.
+    apply_settings
+        Create the image items again, or change timing, when settings change.
     """
 
     _movement = RandomMovement
@@ -295,41 +590,49 @@ class RandomImagesItemGroup(TimeableItemGroup):
         super().__init__(settings_manager, perimeter)
         log.info("Creating %s", self)
 
-        self._random_movement = self._movement()
-        self._time_diff = self._settings["timings"]["image_change_time"]
+        self._random_movement = self._movement(self._settings_manager.rng)
+        self._time_diff = self._settings_manager.config.timings.image_change_time
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._settings_manager}, {self._perimeter})"
 
     def create(self) -> None:
         """Create all the image items, set to move randomly within the perimeter."""
-        image_settings = self._settings["images"]
-        for _ in range(image_settings["number"]):
-            for image in image_settings["images"]:
+        for _ in range(self._settings_manager.config.images.number):
+            for image in self._settings_manager.state.images:
                 log.debug("Creating `pygame` image: %s", image)
-                Item(self, image, self._perimeter, self._random_movement)
+                CompactItem(self, image, self._perimeter, self._random_movement)
 
     def update(self):
         """
         Update the position, randomly, of all the images in the group.
 
-        Image position is updated sequentially, and each is compared to the position
-        of newly positioned images to ensure no collisions.
+        Image position is updated sequentially, and each is compared to the positions
+        of the images already repositioned to ensure no collisions. Images are created
+        again first if the number of images in the settings has changed.
         """
+        image_settings = self._settings_manager.config.images
+        if len(self) != image_settings.number * len(
+            self._settings_manager.state.images
+        ):
+            self.empty()
+            self.create()
+        debug = log.isEnabledFor(logging.DEBUG)
         log.debug("Repositioning all images")
-        group = []
         reattempts_taken_total = 0
-        num_items = len(self.sprites())
-        for image_idx, image in enumerate(self.sprites(), 1):
-            self.remove(image)
+        num_items = len(self)
+        positions = self.positions
+        for image_idx, image in enumerate(self, 1):
             image.update()
-            reattempts_allowed = self._settings["images"]["reposition_attempts"]
-            while abs(reattempts_allowed) > 0 and pg.sprite.spritecollideany(
-                image, group
+            reattempts_allowed = image_settings.reposition_attempts
+            while abs(reattempts_allowed) > 0 and collides_any(
+                image.rect, positions[: image_idx - 1]
             ):
                 image.update()
                 reattempts_allowed -= 1
                 reattempts_taken_total += 1
+                if not debug:
+                    continue
                 if reattempts_taken_total >= 1000 and reattempts_allowed <= 0:
                     log.debug(
                         "Limit of image reposition attempts reached for image %s/%s",
@@ -343,14 +646,38 @@ class RandomImagesItemGroup(TimeableItemGroup):
                         image_idx,
                         num_items,
                     )
-            group.append(image)
+            positions[image_idx - 1] = (
+                image.rect.x,
+                image.rect.y,
+                image.rect.width,
+                image.rect.height,
+            )
         log.debug(
             "All images (%s total) repositioned with %s total reattempts",
             num_items,
             reattempts_taken_total,
         )
-        random.shuffle(group)
-        self.add(group)
+        images = self.sprites()
+        self._settings_manager.rng.shuffle(images)
+        self.empty()
+        self.add(*images)
+
+    def apply_settings(self, changed: AbstractSet[str]) -> None:
+        """
+        Create and position the image items again if any image settings changed, and
+        update the time difference if the image change time changed.
+
+        Parameters
+        ----------
+        changed
+            Dotted path of each setting that changed, e.g. `images.sources`.
+        """
+        if "timings.image_change_time" in changed:
+            self._time_diff = self._settings_manager.config.timings.image_change_time
+        if any(path.startswith("images.") for path in changed):
+            log.info("Image settings changed, creating images again")
+            self.empty()
+            self.update()
 
 
 class ColorChangeItemGroup(TimeableItemGroup):
@@ -361,6 +688,8 @@ class ColorChangeItemGroup(TimeableItemGroup):
     -------
     update
         Change colors if time threshold reached.
+    apply_settings
+        Update the time difference when settings change.
     """
 
     def __init__(self, settings_manager: SettingsManager, perimeter: pg.Rect) -> None:
@@ -377,7 +706,7 @@ class ColorChangeItemGroup(TimeableItemGroup):
         super().__init__(settings_manager, perimeter)
         log.info("Creating %s", self)
 
-        self._time_diff = self._settings["timings"]["color_change_time"]
+        self._time_diff = self._settings_manager.config.timings.color_change_time
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._settings_manager}, {self._perimeter})"
@@ -389,6 +718,18 @@ class ColorChangeItemGroup(TimeableItemGroup):
         """Update colors."""
         self._settings_manager.set_colors()
 
+    def apply_settings(self, changed: AbstractSet[str]) -> None:
+        """
+        Update the time difference if the color change time changed.
+
+        Parameters
+        ----------
+        changed
+            Dotted path of each setting that changed, e.g. `timings.fps`.
+        """
+        if "timings.color_change_time" in changed:
+            self._time_diff = self._settings_manager.config.timings.color_change_time
+
 
 class FpsCounterItemGroup(ItemGroup):
     """
@@ -416,19 +757,37 @@ class FpsCounterItemGroup(ItemGroup):
         super().__init__(settings_manager, perimeter)
         log.info("Creating %s", self)
 
+        self._font = pg.font.SysFont(None, 36)
+        self._fps_text = ""
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._settings_manager}, {self._perimeter})"
 
     def create(self) -> None:
         """Create the fps counter."""
-        fps_font = pg.font.SysFont(None, 36)
-        fps_actual = self._settings["timings"]["fps_actual"]
-        content = fps_font.render(f"{fps_actual:.2f}", False, (0, 0, 0))
-        fps = Item(self, content, self._perimeter)
+        self._fps_text = self._generate_fps_text()
+        fps = CompactItem(self, self._render(self._fps_text), self._perimeter)
         fps.rect.x = 10
         fps.rect.y = 10
 
     def update(self):
-        """Update the fps counter."""
-        self.empty()
-        self.create()
+        """Update the fps counter, only rendering again when the text has changed."""
+        fps_text = self._generate_fps_text()
+        if fps_text == self._fps_text:
+            return
+
+        self._fps_text = fps_text
+        for fps in self:
+            fps.content = self._render(fps_text)
+            fps.rect.size = fps.content.get_size()
+
+    def _generate_fps_text(self) -> str:
+        state = self._settings_manager.state
+        fps_text = f"{state.fps_actual:.1f}"
+        if state.quality is not None:
+            fps_text = f"{fps_text}  {state.quality}"
+
+        return fps_text
+
+    def _render(self, fps_text: str) -> pg.Surface:
+        return self._font.render(fps_text, False, (0, 0, 0))
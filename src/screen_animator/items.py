@@ -1,10 +1,13 @@
 import random
 import logging
 from enum import Enum, auto
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, ClassVar, Protocol, runtime_checkable
 
 import pygame as pg
 
+if TYPE_CHECKING:
+    from screen_animator.item_groups import ItemArray
+
 log = logging.getLogger(__name__)
 
 
@@ -32,16 +35,87 @@ class Movement:
     -------
     move
         Move a `Movable`, to be implemented by sublasses.
+    offset
+        Offset to draw part way between positions.
     """
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}()"
 
-    def move(self, item: "Item") -> None:
+    def move(self, item: "Movable") -> None:
         """Sublasses should implement a means of moving `Movable`."""
 
+    def offset(self, alpha: float) -> tuple[float, float]:
+        """
+        Offset from the current position back towards the previous position, to draw
+        part way between the two.
+
+        Parameters
+        ----------
+        alpha
+            Fraction of the way from the previous position to the current position.
+
+        Returns
+        -------
+        tuple[float, float]
+            Offset in pixels, none unless the movement is continuous.
+        """
+        return 0, 0
+
+
+class Movable:
+    """
+    Behaviour shared by items moved by a `Movement`, needing `rect`, `perimeter` and
+    `_movement`.
+
+    Methods
+    -------
+    move
+        Move as defined by the provided `Movement` type.
+    update
+        Hook used to execute `move` through a group.
+    render_rect
+        Get the rectangle to draw at, part way between positions.
+    """
+
+    __slots__ = ()
+
+    rect: pg.Rect
+    perimeter: pg.Rect
+    _movement: Movement
+
+    def move(self) -> None:
+        """Move the instance using a `Movement` object, if defined."""
+        self._movement.move(self)
+
+    def update(self, *_args, **_kwargs) -> None:
+        """Update the instance (move it)."""
+        self.move()
+
+    def render_rect(self, alpha: float = 1.0) -> pg.Rect:
+        """
+        Get the rectangle to draw at, interpolated between the previous and current
+        positions, and offset by any distance scrolled by the group as a whole.
+
+        Parameters
+        ----------
+        alpha : optional
+            Fraction of the way from the previous position to the current position
+            (default is 1, the current position).
+
+        Returns
+        -------
+        pg.Rect
+            Rectangle to draw at.
+        """
+        x_offset, y_offset = self._movement.offset(alpha)
+        if not (x_offset or y_offset):
+            return self.rect
 
-class Item(pg.sprite.Sprite):
+        return self.rect.move(round(x_offset), round(y_offset))
+
+
+class Item(Movable, pg.sprite.Sprite):
     """
     A wrapper for `pygame` sprite-type objects that are then can be moved on a `pygame` 'canvas'.
 
@@ -60,10 +134,10 @@ class Item(pg.sprite.Sprite):
         Move as defined by the provided `Movement` type.
     update
         Hook used to execute `move` through a group.
+    render_rect
+        Get the rectangle to draw at, part way between positions.
     """
 
-    rect: pg.Rect
-
     def __init__(
         self,
         group: pg.sprite.Group,
@@ -100,13 +174,118 @@ class Item(pg.sprite.Sprite):
             f" {self._movement})"
         )
 
+
+class CompactItem(Movable):
+    """
+    Lightweight item held in an `ItemArray`, with slots rather than a `Sprite`'s
+    dictionaries, for groups holding many items, e.g. outline copies.
+
+    Attributes
+    ----------
+    content
+        The content of the item.
+    rect
+        The positioning rectangle of the item.
+    perimeter
+        The defined outer limits.
+    group
+        The group holding the item, or None once removed.
+
+    Methods
+    -------
+    move
+        Move as defined by the provided `Movement` type.
+    update
+        Hook used to execute `move` through a group.
+    render_rect
+        Get the rectangle to draw at, part way between positions.
+    kill
+        Remove from the group.
+    alive
+        Whether still in a group.
+    """
+
+    __slots__ = ("_movement", "content", "group", "perimeter", "rect")
+
+    def __init__(
+        self,
+        group: "ItemArray",
+        content: pg.Surface,
+        perimeter: pg.Rect,
+        movement: Movement | None = None,
+    ) -> None:
+        """
+        Initialise an item in a group, with render-capable content, a defined
+        perimeter and a `Movement` type.
+
+        Parameters
+        ----------
+        group
+            The group to which to add.
+        content
+            The `pygame`-type content that can be rendered.
+        perimeter
+            The outside limits of the `pygame` context, typically the size of the canvas/screen.
+        movement : optional
+            A method of moving.
+        """
+        self.content = content
+        self.rect = content.get_rect()
+        self.perimeter = perimeter
+        self._movement = movement or Movement()
+        self.group: ItemArray | None = None
+        group.add(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.group},"
+            f" {self.content},"
+            f" {self.perimeter},"
+            f" {self._movement})"
+        )
+
     def move(self) -> None:
-        """Move the instance using a `Movement` object, if defined."""
+        """Move the instance using a `Movement` object, telling the group it moved."""
         self._movement.move(self)
+        if self.group is not None:
+            self.group.moved()
 
-    def update(self, *_args, **_kwargs) -> None:
-        """Update the instance (move it)."""
-        self.move()
+    def kill(self) -> None:
+        """Remove from the group."""
+        if self.group is not None:
+            self.group.remove(self)
+
+    def alive(self) -> bool:
+        """Whether still in a group."""
+        return self.group is not None
+
+
+class MessageItem(CompactItem):
+    """
+    `CompactItem` showing a message, keeping what it was rendered from so it can be
+    rendered again.
+
+    Attributes
+    ----------
+    message_text
+        Text of the message.
+    font
+        Font the message is rendered with.
+    render_key
+        Settings the content was rendered with.
+    outlines
+        Outline copies drawn behind the message.
+    extent
+        Area covered by the message and its outlines.
+    """
+
+    __slots__ = ("extent", "font", "message_text", "outlines", "render_key")
+
+    message_text: str
+    font: pg.Font
+    render_key: tuple
+    outlines: list[CompactItem]
+    extent: pg.Rect
 
 
 class ScrollingMovement(Movement):
@@ -117,9 +296,11 @@ class ScrollingMovement(Movement):
     -------
     move
         Move in the direction specified at the set speed.
+    offset
+        Offset back along the direction of movement.
     """
 
-    _directions = {
+    _directions: ClassVar[dict[Direction, tuple[str, int]]] = {
         Direction.UP: ("y", -1),
         Direction.RIGHT: ("x", 1),
         Direction.DOWN: ("y", 1),
@@ -167,7 +348,7 @@ class ScrollingMovement(Movement):
             self._direction, self._directions[Direction.LEFT]
         )
 
-    def move(self, item: Item) -> None:
+    def move(self, item: Movable) -> None:
         """
         Move input in the direction defined, at the speed set.
 
@@ -180,6 +361,112 @@ class ScrollingMovement(Movement):
         new_position = getattr(rect, self._axis) + self._sign * self._speed
         setattr(rect, self._axis, new_position)
 
+    def offset(self, alpha: float) -> tuple[float, float]:
+        """
+        Offset from the current position back along the direction of movement, to
+        draw part way between the previous and current positions.
+
+        Parameters
+        ----------
+        alpha
+            Fraction of the way from the previous position to the current position.
+
+        Returns
+        -------
+        tuple[float, float]
+            Offset in pixels.
+        """
+        distance = (alpha - 1) * self._sign * self._speed
+
+        return (distance, 0) if self._axis == "x" else (0, distance)
+
+
+class GroupScrollingMovement(ScrollingMovement):
+    """
+    Scrolling shared by every item in a group, moving the group as a whole.
+
+    Rather than moving each item, the distance scrolled is kept once and applied
+    when items are drawn, so moving costs the same however many items there are.
+    Item positions are relative to where scrolling started.
+
+    Attributes
+    ----------
+    distance
+        Distance scrolled along the direction of movement, in pixels.
+
+    Methods
+    -------
+    advance
+        Scroll on by the speed.
+    move
+        Do nothing, items are not moved individually.
+    offset
+        Distance scrolled, part way back to the previous distance.
+    rebase
+        Take whole pixels out of the distance, to be added to item positions.
+    """
+
+    def __init__(self, speed: float = 0, direction: Direction = Direction.LEFT) -> None:
+        """
+        Initialise the scrolling with a set speed and direction, not yet scrolled.
+
+        Parameters
+        ----------
+        speed : optional
+            The speed of movement in pixels per frame (default is 0).
+        direction : optional
+            The direction of movement (default is 'left').
+        """
+        super().__init__(speed, direction)
+
+        self.distance = 0.0
+
+    def advance(self) -> None:
+        """Scroll on by the speed."""
+        self.distance += self._speed
+
+    def move(self, item: Movable) -> None:
+        """Do nothing, as items are drawn offset by the distance scrolled."""
+
+    def offset(self, alpha: float = 1.0) -> tuple[float, float]:
+        """
+        Offset from item positions to draw at, the distance scrolled, part way back
+        to the distance before the last advance.
+
+        Parameters
+        ----------
+        alpha : optional
+            Fraction of the way from the previous distance to the current distance
+            (default is 1, the current distance).
+
+        Returns
+        -------
+        tuple[float, float]
+            Offset in pixels.
+        """
+        distance = self._sign * (self.distance + (alpha - 1) * self._speed)
+
+        return (distance, 0) if self._axis == "x" else (0, distance)
+
+    def rebase(self) -> tuple[int, int]:
+        """
+        Take whole pixels scrolled out of the distance, so it does not grow without
+        bound, e.g. past what `pg.Rect` can hold.
+
+        An even number of pixels is taken, so offsets, rounded half to even, round
+        the same way after as before.
+
+        Returns
+        -------
+        tuple[int, int]
+            Offset to move item positions by, to be drawn in the same place.
+        """
+        shift = 2 * int(self.distance // 2)
+        self.distance -= shift
+        shift *= self._sign
+
+        return (shift, 0) if self._axis == "x" else (0, shift)
+
 
 class RandomMovement(Movement):
     """
@@ -191,7 +478,20 @@ class RandomMovement(Movement):
         Move randomly within a perimeter.
     """
 
-    def move(self, item: Item) -> None:
+    def __init__(self, rng: random.Random | None = None) -> None:
+        """
+        Initialise the random style of movement.
+
+        Parameters
+        ----------
+        rng : optional
+            Source of random positions (default is None, seeded from the system).
+        """
+        super().__init__()
+
+        self._rng = rng or random.Random()
+
+    def move(self, item: Movable) -> None:
         """
         Move input randomly within a perimeter.
 
@@ -200,5 +500,5 @@ class RandomMovement(Movement):
         item
             Object to move.
         """
-        item.rect.left = random.randint(0, item.perimeter.right - item.rect.width)
-        item.rect.top = random.randint(0, item.perimeter.bottom - item.rect.height)
+        item.rect.left = self._rng.randint(0, item.perimeter.right - item.rect.width)
+        item.rect.top = self._rng.randint(0, item.perimeter.bottom - item.rect.height)
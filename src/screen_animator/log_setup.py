@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 LOG_DIR = "logs"
@@ -7,13 +10,31 @@ LOG_FILE = f"{__package__}_{datetime.now().strftime('%Y%m%d%H%M')}.log"
 
 
 def setup_logging(logging_level):
+    """
+    Send log records through a queue, to be written by a separate thread.
+
+    Records are only formatted by the thread logging them, so a slow write, e.g. to
+    an SD card, cannot stall a frame. Records still queued are written on exit.
+
+    Parameters
+    ----------
+    logging_level
+        Name of level to log to file at, or any other value to only log warnings to
+        the console.
+
+    Returns
+    -------
+    QueueListener
+        Listener writing records from the queue.
+    """
     log = logging.getLogger(__package__)
 
     stream_handler = logging.StreamHandler()
     stream_handler.setLevel(logging.WARNING)
-    log.addHandler(stream_handler)
+    handlers: list[logging.Handler] = [stream_handler]
 
     logging_level = logging_level.upper()
+    log_path = None
     if logging_level in logging.getLevelNamesMapping():
         log.setLevel(logging_level)
         Path(LOG_DIR).mkdir(exist_ok=True)
@@ -23,11 +44,20 @@ def setup_logging(logging_level):
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         file_handler.setFormatter(formatter)
-        log.addHandler(file_handler)
+        handlers.append(file_handler)
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    if log_path is not None:
         log.info(50 * "=")
         log.info(
             "Logging to %s at %s level",
             log_path,
             logging.getLevelName(log.getEffectiveLevel()),
         )
+
+    return listener
@@ -0,0 +1,229 @@
+import logging
+import mmap
+import os
+import random
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from os import PathLike
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+NEWLINE = ord("\n")
+INDEX_CAPACITY = 1024
+
+
+class MessageSource(ABC):
+    """
+    Source of messages to choose from at random.
+
+    Methods
+    -------
+    choose
+        Choose a message at random.
+    close
+        Release anything held for reading messages.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of messages to choose from."""
+
+    @abstractmethod
+    def choose(self, rng: random.Random) -> str:
+        """
+        Choose a message at random.
+
+        Parameters
+        ----------
+        rng
+            Source of the random choice.
+
+        Returns
+        -------
+        str
+            The chosen message, or an empty string if there are none.
+        """
+
+    def close(self) -> None:
+        """Release anything held for reading messages."""
+
+
+class ListMessageSource(MessageSource):
+    """Messages given in the settings."""
+
+    def __init__(self, messages: Sequence[str]) -> None:
+        """
+        Store messages to choose from.
+
+        Parameters
+        ----------
+        messages
+            Messages to choose from.
+        """
+        self._messages = messages
+        log.info("Creating %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._messages)} messages)"
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def choose(self, rng: random.Random) -> str:
+        return rng.choice(self._messages) if self._messages else ""
+
+
+class FileMessageSource(MessageSource):
+    """
+    Messages read from a text file, one per line, for catalogues too large to keep
+    in the settings.
+
+    The file is memory-mapped, and only the start and end of each line are kept in
+    an index, so a message is read and decoded only when chosen, and choosing one
+    takes the same time however many there are. Blank lines are skipped, and so is
+    a last line without a newline, which may still be being written. Lines appended
+    to the file are indexed when the next message is chosen, scanning only what was
+    added since the last newline, into index arrays that double in capacity when
+    full, so a file that keeps growing is not copied on every append; if the file is
+    truncated or replaced, it is indexed again from the start.
+
+    Attributes
+    ----------
+    path
+        Path of the file of messages.
+
+    Methods
+    -------
+    choose
+        Choose a message at random.
+    refresh
+        Index lines added to the file since last indexed.
+    close
+        Close the file.
+    """
+
+    def __init__(self, path: str | PathLike) -> None:
+        """
+        Open and index the file of messages.
+
+        Parameters
+        ----------
+        path
+            Path of a UTF-8 text file, with one message per line.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        """
+        self.path = Path(path)
+        log.info("Creating %s", self)
+
+        self._file: BinaryIO | None = None
+        self._map: mmap.mmap | None = None
+        self._open()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def choose(self, rng: random.Random) -> str:
+        self.refresh()
+        if self._count == 0 or self._map is None:
+            return ""
+
+        index = rng.randrange(self._count)
+        start, end = int(self._starts[index]), int(self._ends[index])
+
+        return self._map[start:end].decode("utf-8", "replace").rstrip("\r")
+
+    def refresh(self) -> None:
+        """
+        Index lines added to the file since last indexed, or index the whole file
+        again if it was truncated or replaced.
+
+        If the file can no longer be read, the messages already indexed are kept.
+        """
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return
+
+        if (stat.st_dev, stat.st_ino) != self._identity or stat.st_size < self._size:
+            log.info("%s was replaced or truncated, indexing again", self.path)
+            try:
+                self._open()
+            except OSError:
+                log.exception("Cannot read %s", self.path)
+        elif stat.st_size > self._size:
+            self._index()
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        file = self.path.open("rb")
+        self.close()
+        self._file = file
+        stat = os.fstat(file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._starts = np.empty(INDEX_CAPACITY, dtype=np.int64)
+        self._ends = np.empty(INDEX_CAPACITY, dtype=np.int64)
+        self._count = 0
+        self._size = 0
+        self._scanned = 0
+        self._index()
+
+    def _index(self) -> None:
+        """
+        Index complete lines from the end of the last one indexed, keeping the size
+        indexed at the end of the last newline.
+        """
+        if self._file is None:
+            return
+        size = os.fstat(self._file.fileno()).st_size
+        if size == self._scanned:
+            return
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        self._scanned = size
+
+        data = np.frombuffer(self._map, dtype=np.uint8, offset=self._size)
+        ends = np.flatnonzero(data == NEWLINE) + self._size
+        del data
+        starts = np.concatenate(([self._size], ends + 1))[:-1]
+        lines = ends > starts
+        self._append(starts[lines], ends[lines])
+        if len(ends):
+            self._size = int(ends[-1]) + 1
+        log.debug("Indexed %s messages in %s", len(self), self.path)
+
+    def _append(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        """Add lines to the index, doubling its capacity if full."""
+        count = self._count + len(starts)
+        if count > len(self._starts):
+            capacity = max(2 * len(self._starts), count)
+            self._starts = self._grow(self._starts, capacity)
+            self._ends = self._grow(self._ends, capacity)
+        self._starts[self._count : count] = starts
+        self._ends[self._count : count] = ends
+        self._count = count
+
+    def _grow(self, index: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty(capacity, dtype=np.int64)
+        grown[: self._count] = index[: self._count]
+
+        return grown
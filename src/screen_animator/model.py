@@ -1,30 +1,98 @@
 import logging
-from collections.abc import Iterable, Callable
+from collections.abc import Iterable, Callable, Sequence, Set as AbstractSet
+from dataclasses import dataclass
 
 import pygame as pg
 
-from screen_animator.settings import SettingsManager
-from screen_animator.item_groups import ItemGroup
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+from screen_animator.settings import Color, SettingsManager
+from screen_animator.item_groups import ItemGroup, TimeableItemGroup, group_items
+from screen_animator.items import Movable
+from screen_animator.scheduling import Scheduler
 from screen_animator.speed_changer import SpeedChanger, Speeder
 
 log = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    State of the model at one frame, to be drawn while the model carries on updating.
+
+    Attributes
+    ----------
+    bg
+        Background color.
+    items
+        Each item, with its content and a copy of the rect to draw it at.
+    """
+
+    bg: Color
+    items: tuple[tuple[Movable, pg.Surface, pg.Rect], ...]
+
+    @classmethod
+    def capture(
+        cls,
+        bg: Sequence[int],
+        item_groups: Iterable[ItemGroup | pg.sprite.AbstractGroup],
+        alpha: float = 1.0,
+    ) -> "Snapshot":
+        """
+        Capture the items in groups as they would be drawn.
+
+        Content surfaces are not copied, as items replace rather than change them.
+
+        Parameters
+        ----------
+        bg
+            Background color.
+        item_groups
+            Groups of items to capture.
+        alpha : optional
+            Fraction of the way from the previous state to the current state to
+            place items at (default is 1, the current state).
+
+        Returns
+        -------
+        Snapshot
+            Background color, and each item with its content and position.
+        """
+        red, green, blue = bg
+
+        return cls(
+            (red, green, blue),
+            tuple(
+                (item, item.content, pg.Rect(item.render_rect(alpha)))
+                for item_group in item_groups
+                for item in group_items(item_group)
+            ),
+        )
+
+
 class Model:
     """
     Main engine for `screen_animator`.
 
+    Groups are updated every step, except timed groups, which are registered with a
+    scheduler and only updated when their time difference has passed.
+
     Attributes
     ----------
     item_groups:
         List of aspects to create and update.
-    update_event_type:
-        `int` value for update event type.
+    next_deadline
+        Clock ticks when a timed group is next updated.
+    moving
+        Whether any group is moving every step.
 
     Methods
     -------
     update
         Update the model.
+    snapshot
+        Capture the state of the model to be drawn.
+    apply_settings
+        Update groups for settings changed by a reload.
     """
 
     def __init__(
@@ -32,6 +100,7 @@ class Model:
         settings_manager: SettingsManager,
         item_group_types: Iterable[Callable[[SettingsManager, pg.Rect], ItemGroup]],
         perimeter: pg.Rect,
+        stats: FrameStats | None = None,
     ) -> None:
         """
         Set-up some initial parameters for the model.
@@ -44,27 +113,39 @@ class Model:
             Class handles for elements of the model.
         perimeter
             Outer boundary the model can operate within.
+        stats : optional
+            Records time taken to update each group (default is None, not recorded).
         """
         self._settings_manager = settings_manager
         self._item_group_types = item_group_types
         self._perimeter = perimeter
+        self._stats = stats or NullFrameStats()
         log.info("Creating %s", self)
 
         self.item_groups = [
             group(self._settings_manager, self._perimeter)
             for group in self._item_group_types
         ]
+        self._scheduler = Scheduler(self._settings_manager.clock)
         for item_group in self.item_groups:
             item_group.create()
+            if isinstance(item_group, TimeableItemGroup):
+                self._scheduler.register(item_group)
+        self._stages = {
+            item_group: f"model.{item_group.name}" for item_group in self.item_groups
+        }
+        self._stepped_groups = [
+            item_group
+            for item_group in self.item_groups
+            if not isinstance(item_group, TimeableItemGroup)
+        ]
 
-        self.update_event_type = pg.event.custom_type()
-        self._speed_changer = SpeedChanger(
-            *[
-                item_group
-                for item_group in self.item_groups
-                if isinstance(item_group, Speeder)
-            ]
-        )
+        self._speeders = [
+            item_group
+            for item_group in self.item_groups
+            if isinstance(item_group, Speeder)
+        ]
+        self._speed_changer = SpeedChanger(*self._speeders)
         log.info("%s initialization complete", type(self).__name__)
 
     def __repr__(self) -> str:
@@ -74,9 +155,63 @@ class Model:
     def speed_changer(self) -> SpeedChanger:
         return self._speed_changer
 
+    @property
+    def next_deadline(self) -> int | None:
+        """Clock ticks when a timed group is next updated, or None if none are timed."""
+        return self._scheduler.next_deadline
+
+    @property
+    def moving(self) -> bool:
+        """Whether any group is moving every step, e.g. scrolling text."""
+        return any(speeder.speed for speeder in self._speeders)
+
     def update(self) -> None:
-        """Update all aspects of the model."""
+        """Update timed groups that are due, then all other aspects of the model."""
+        for timed_group in self._scheduler.pop_due():
+            self._update_group(timed_group)
+        for item_group in self._stepped_groups:
+            self._update_group(item_group)
+
+    def _update_group(self, item_group: ItemGroup) -> None:
+        self._stats.begin(self._stages[item_group])
+        item_group.update()
+        self._stats.end()
+
+    def snapshot(self, alpha: float = 1.0) -> Snapshot:
+        """
+        Capture the state of the model to be drawn, e.g. in another thread.
+
+        Parameters
+        ----------
+        alpha : optional
+            Fraction of the way from the previous state to the current state to
+            place items at (default is 1, the current state).
+
+        Returns
+        -------
+        Snapshot
+            Background color, and each item with its content and position.
+        """
+        return Snapshot.capture(
+            self._settings_manager.state.bg_color, self.item_groups, alpha
+        )
+
+    def apply_settings(self, changed: AbstractSet[str]) -> None:
+        """
+        Tell each group which settings changed on reload, rescheduling timed groups
+        whose time difference changed.
+
+        Parameters
+        ----------
+        changed
+            Dotted path of each setting that changed, e.g. `messages.messages`.
+        """
         for item_group in self.item_groups:
-            item_group.update()
+            if not isinstance(item_group, TimeableItemGroup):
+                item_group.apply_settings(changed)
+                continue
 
-        pg.event.post(pg.Event(self.update_event_type))
+            time_diff = item_group.time_diff
+            item_group.apply_settings(changed)
+            if item_group.time_diff != time_diff:
+                self._scheduler.reschedule(item_group)
@@ -0,0 +1,350 @@
+import cProfile
+import logging
+import pstats
+import signal
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from os import PathLike
+from pathlib import Path
+from types import FrameType
+
+import pygame as pg
+
+from screen_animator.listener import Listener
+
+log = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL = 0.005
+TOP_ENTRIES = 20
+
+
+def frame_names(frame: FrameType | None) -> list[str]:
+    """
+    Describe each function in a stack, outermost first.
+
+    Parameters
+    ----------
+    frame
+        Innermost frame of the stack.
+
+    Returns
+    -------
+    list[str]
+        Function name, file name and line number where each function starts.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+
+    return names[::-1]
+
+
+class Profiler(ABC):
+    """
+    Interface for profilers of the main thread that can be started and stopped.
+
+    Time from every period of profiling is added together. Events are posted to the
+    `pygame` queue to stop profiling at the end of a window, or to toggle profiling
+    when a signal is received, so profiling is always started and stopped from the
+    main loop.
+
+    Attributes
+    ----------
+    running
+        Whether profiling is currently running.
+    toggle_event_type
+        Type of event that toggles profiling.
+    stop_event_type
+        Type of event that stops profiling.
+
+    Methods
+    -------
+    start
+        Start profiling.
+    stop
+        Stop profiling.
+    toggle
+        Start profiling if stopped, stop if running.
+    install_signal_handler
+        Toggle profiling when a signal is received.
+    dump
+        Write profile to file (sublasses to implement).
+    """
+
+    default_path: str
+
+    def __init__(self, window: float | None = None) -> None:
+        """
+        Set the length of each period of profiling.
+
+        Parameters
+        ----------
+        window : optional
+            Seconds to profile for after each start (default is None, profile until
+            stopped).
+        """
+        self._window = window
+        log.info("Creating %s", self)
+
+        self.running = False
+        self.toggle_event_type = pg.event.custom_type()
+        self.stop_event_type = pg.event.custom_type()
+        self._timer: threading.Timer | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._window})"
+
+    def start(self) -> None:
+        """Start profiling, posting a stop event after the window if set."""
+        if self.running:
+            return
+
+        log.info("Starting %s", self)
+        self.running = True
+        self._start()
+        if self._window is not None:
+            self._timer = threading.Timer(
+                self._window, pg.event.post, [pg.event.Event(self.stop_event_type)]
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def stop(self) -> None:
+        """Stop profiling."""
+        if not self.running:
+            return
+
+        log.info("Stopping %s", self)
+        self.running = False
+        self._stop()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def toggle(self) -> None:
+        """Start profiling if stopped, stop if running."""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def install_signal_handler(self, signum: int | None = None) -> None:
+        """
+        Toggle profiling when a signal is received, where signals are supported.
+
+        Parameters
+        ----------
+        signum : optional
+            Signal to handle (default is None, `SIGUSR1` is used).
+        """
+        signum = signum or getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            log.warning("Signals not supported, profiling cannot be toggled by signal")
+            return
+
+        signal.signal(
+            signum,
+            lambda *_: pg.event.post(pg.event.Event(self.toggle_event_type)),
+        )
+        log.info("Profiling toggled by signal %s", signum)
+
+    @abstractmethod
+    def dump(self, path: str | PathLike) -> None:
+        """
+        Write profile to file and print a summary.
+
+        Parameters
+        ----------
+        path
+            Path of file to write.
+        """
+
+    @abstractmethod
+    def _start(self) -> None:
+        """Begin collecting profile."""
+
+    @abstractmethod
+    def _stop(self) -> None:
+        """Stop collecting profile."""
+
+
+class CProfileProfiler(Profiler):
+    """
+    Deterministic profiler using `cProfile`, writing `pstats` files.
+
+    Methods
+    -------
+    dump
+        Write `pstats` file and print functions with the most cumulative time.
+    """
+
+    default_path = "profile.pstats"
+
+    def __init__(self, window: float | None = None) -> None:
+        super().__init__(window)
+        self._profile = cProfile.Profile()
+        self._profiled = False
+
+    def dump(self, path: str | PathLike) -> None:
+        """
+        Write `pstats` file and print functions with the most cumulative time.
+
+        Parameters
+        ----------
+        path
+            Path of file to write.
+        """
+        self.stop()
+        if not self._profiled:
+            log.warning("Nothing profiled, %s not written", path)
+            return
+
+        self._profile.dump_stats(path)
+        log.info("Profile written to %s", path)
+        pstats.Stats(self._profile).sort_stats("cumulative").print_stats(TOP_ENTRIES)
+
+    def _start(self) -> None:
+        self._profile.enable()
+        self._profiled = True
+
+    def _stop(self) -> None:
+        self._profile.disable()
+
+
+class SamplingProfiler(Profiler):
+    """
+    Statistical profiler sampling the main thread stack, writing collapsed stacks.
+
+    Samples are taken in wall-clock time, so include time spent waiting, e.g. for
+    the next frame. Collapsed stacks, one line of `;` separated functions followed by
+    the number of samples, can be read by flame graph tools.
+
+    Methods
+    -------
+    dump
+        Write collapsed stacks and print the most sampled functions.
+    """
+
+    default_path = "profile.collapsed"
+
+    def __init__(
+        self, window: float | None = None, interval: float = SAMPLE_INTERVAL
+    ) -> None:
+        """
+        Set the length of each period of profiling, and how often to sample.
+
+        Parameters
+        ----------
+        window : optional
+            Seconds to profile for after each start (default is None, profile until
+            stopped).
+        interval : optional
+            Seconds between samples (default is 0.005).
+        """
+        super().__init__(window)
+        self._interval = interval
+        self._thread_id = threading.main_thread().ident
+        self._stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def dump(self, path: str | PathLike) -> None:
+        """
+        Write collapsed stacks and print the most sampled functions.
+
+        Parameters
+        ----------
+        path
+            Path of file to write.
+        """
+        self.stop()
+        Path(path).write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self._stacks.items())
+        )
+        log.info("Profile written to %s", path)
+
+        functions: Counter[str] = Counter()
+        for stack, count in self._stacks.items():
+            functions[stack.rsplit(";", 1)[-1]] += count
+        total = self._stacks.total()
+        if not total:
+            log.warning("Nothing sampled in %s", path)
+            return
+
+        print(f"Profile of {total} samples, most sampled functions:")
+        for function, count in functions.most_common(TOP_ENTRIES):
+            print(f"{count / total:>7.1%}  {function}")
+
+    def _start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._sample, name="SamplingProfiler", daemon=True
+        )
+        self._thread.start()
+
+    def _stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _sample(self) -> None:
+        ident = self._thread_id
+        if ident is None:
+            return
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(ident)
+            if frame is not None:
+                self._stacks[";".join(frame_names(frame))] += 1
+
+
+class ToggleProfilerAction(Listener):
+    """
+    Custom listener to start or stop profiling.
+
+    Methods
+    -------
+    notify
+        Start profiling if stopped, stop if running.
+    """
+
+    def __init__(self, profiler: Profiler) -> None:
+        """Store profiler to toggle."""
+        self._profiler = profiler
+        log.info("Created %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._profiler})"
+
+    def notify(self) -> None:
+        """Start profiling if stopped, stop if running."""
+        self._profiler.toggle()
+
+
+class StopProfilerAction(Listener):
+    """
+    Custom listener to stop profiling.
+
+    Methods
+    -------
+    notify
+        Stop profiling.
+    """
+
+    def __init__(self, profiler: Profiler) -> None:
+        """Store profiler to stop."""
+        self._profiler = profiler
+        log.info("Created %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._profiler})"
+
+    def notify(self) -> None:
+        """Stop profiling."""
+        self._profiler.stop()
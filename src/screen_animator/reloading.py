@@ -0,0 +1,304 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from os import PathLike
+from pathlib import Path
+
+import pygame as pg
+
+from screen_animator.listener import Listener
+from screen_animator.model import Model
+from screen_animator.settings import SettingsManager
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL = 1.0
+SETTLE_TIME = 0.2
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class FileWatcher(ABC):
+    """
+    Watches files from a separate thread, posting an event when any of them change.
+
+    Changes close together, e.g. an editor writing a file in several steps, or
+    several files saved at once, are posted as one event once no more have been
+    seen for `SETTLE_TIME`.
+
+    Attributes
+    ----------
+    event_type
+        Type of the `pygame` event posted when files change.
+
+    Methods
+    -------
+    start
+        Start watching in a separate thread.
+    stop
+        Stop watching.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str | PathLike],
+        interval: float = POLL_INTERVAL,
+        settle: float = SETTLE_TIME,
+    ) -> None:
+        """
+        Set the files to watch.
+
+        Parameters
+        ----------
+        paths
+            Paths of the files to watch.
+        interval : optional
+            Most seconds to wait before checking whether watching was stopped
+            (default is 1).
+        settle : optional
+            Seconds without changes before changes are posted (default is 0.2).
+        """
+        self._paths = [Path(path).absolute() for path in paths]
+        self._interval = interval
+        self._settle = settle
+        log.info("Creating %s", self)
+
+        self.event_type = pg.event.custom_type()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({[str(path) for path in self._paths]}, {self._interval}, {self._settle})"
+
+    def start(self) -> None:
+        """Start watching in a separate thread."""
+        log.info("Starting %s", self)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching, and wait for the thread to finish."""
+        log.info("Stopping %s", self)
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close()
+
+    def _watch(self) -> None:
+        while not self._stopped.is_set():
+            if not self._changed(self._interval):
+                continue
+            while not self._stopped.wait(self._settle) and self._changed(0):
+                pass
+            log.info("Files changed: %s", [str(path) for path in self._paths])
+            pg.event.post(pg.event.Event(self.event_type))
+
+    @abstractmethod
+    def _changed(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for a change, returning whether any was seen."""
+
+    def _close(self) -> None:
+        """Release anything held for watching."""
+
+
+class InotifyWatcher(FileWatcher):
+    """
+    Watches files with Linux inotify, so the thread sleeps until a file changes.
+
+    The directories holding the files are watched, rather than the files
+    themselves, so files replaced by editors saving to a new file and renaming it
+    are still seen.
+    """
+
+    _mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(
+        self,
+        paths: Iterable[str | PathLike],
+        interval: float = POLL_INTERVAL,
+        settle: float = SETTLE_TIME,
+    ) -> None:
+        """
+        Set up inotify watches for the directories holding the files.
+
+        Parameters
+        ----------
+        paths
+            Paths of the files to watch.
+        interval : optional
+            Most seconds to wait before checking whether watching was stopped
+            (default is 1).
+        settle : optional
+            Seconds without changes before changes are posted (default is 0.2).
+
+        Raises
+        ------
+        OSError
+            If inotify is not available.
+        """
+        super().__init__(paths, interval, settle)
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "Cannot initialise inotify")
+        self._watched: set[tuple[int, bytes]] = set()
+        for path in self._paths:
+            descriptor = libc.inotify_add_watch(
+                self._fd, os.fsencode(path.parent), self._mask
+            )
+            if descriptor < 0:
+                errno = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(errno, f"Cannot watch {path.parent}")
+            self._watched.add((descriptor, os.fsencode(path.name)))
+
+    def _changed(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+
+        changed = False
+        while True:
+            try:
+                buffer = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buffer):
+                descriptor, _, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+                offset += INOTIFY_EVENT.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                changed = changed or (descriptor, name) in self._watched
+
+    def _close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher(FileWatcher):
+    """
+    Watches files by checking their device, inode, modification time and size every
+    interval, where inotify is not available, so a file replaced by another of the
+    same size and modification time is still seen to change.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str | PathLike],
+        interval: float = POLL_INTERVAL,
+        settle: float = SETTLE_TIME,
+    ) -> None:
+        """
+        Record the current state of the files.
+
+        Parameters
+        ----------
+        paths
+            Paths of the files to watch.
+        interval : optional
+            Seconds between checks (default is 1).
+        settle : optional
+            Seconds without changes before changes are posted (default is 0.2).
+        """
+        super().__init__(paths, interval, settle)
+        self._states = self._stat()
+
+    def _changed(self, timeout: float) -> bool:
+        if timeout > 0 and self._stopped.wait(timeout):
+            return False
+
+        states = self._stat()
+        changed = states != self._states
+        self._states = states
+
+        return changed
+
+    def _stat(self) -> list[tuple[int, int, int, int] | None]:
+        states: list[tuple[int, int, int, int] | None] = []
+        for path in self._paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                states.append(None)
+            else:
+                states.append(
+                    (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                )
+
+        return states
+
+
+def watch_files(
+    paths: Iterable[str | PathLike], interval: float = POLL_INTERVAL
+) -> FileWatcher:
+    """
+    Create a watcher for files, using inotify where available, polling otherwise.
+
+    Parameters
+    ----------
+    paths
+        Paths of the files to watch.
+    interval : optional
+        Seconds between checks when polling (default is 1).
+
+    Returns
+    -------
+    FileWatcher
+        Watcher for the files, not yet started.
+    """
+    paths = list(paths)
+    try:
+        return InotifyWatcher(paths, interval)
+    except OSError as error:
+        log.info("Polling for changes, as inotify is not available: %s", error)
+        return PollingWatcher(paths, interval)
+
+
+class ReloadSettingsAction(Listener):
+    """
+    Custom listener to reload settings, and update the model for those changed.
+
+    Invalid settings are logged and ignored, carrying on with the current settings.
+
+    Methods
+    -------
+    notify
+        Reload settings.
+    """
+
+    def __init__(self, settings_manager: SettingsManager, model: Model) -> None:
+        """Store settings manager to reload, and model to update."""
+        self._settings_manager = settings_manager
+        self._model = model
+        log.info("Created %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_manager}, {self._model})"
+
+    def notify(self) -> None:
+        """Reload settings, updating the model for any changed."""
+        try:
+            changed = self._settings_manager.reload()
+        except (OSError, ValueError):
+            log.exception("Cannot reload settings, keeping current settings")
+            return
+
+        if changed:
+            self._model.apply_settings(changed)
@@ -0,0 +1,240 @@
+import logging
+import threading
+
+import pygame as pg
+
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+from screen_animator.model import Model, Snapshot
+from screen_animator.view import View
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_TIMEOUT = 0.1
+
+
+class SnapshotBuffer:
+    """
+    Double buffer passing the latest snapshot of the model to the render thread.
+
+    The model publishes into the back slot while the render thread draws the front
+    one. A snapshot published before the previous one is taken replaces it, so the
+    render thread always draws the latest state and the model is never held up.
+
+    Attributes
+    ----------
+    dropped
+        Number of snapshots replaced before being taken.
+    closed
+        Whether the buffer has been closed.
+
+    Methods
+    -------
+    publish
+        Make a snapshot the latest to be drawn.
+    take
+        Wait for and return the latest snapshot.
+    close
+        Wake any waiting thread, with no more snapshots to come.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty buffer."""
+        log.info("Creating %s", self)
+
+        self.dropped = 0
+        self.closed = False
+        self._back: Snapshot | None = None
+        self._condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def publish(self, snapshot: Snapshot) -> bool:
+        """
+        Make a snapshot the latest to be drawn.
+
+        Parameters
+        ----------
+        snapshot
+            State of the model to draw.
+
+        Returns
+        -------
+        bool
+            Whether a snapshot not yet taken was replaced.
+        """
+        with self._condition:
+            dropped = self._back is not None
+            self.dropped += dropped
+            self._back = snapshot
+            self._condition.notify()
+
+        return dropped
+
+    def take(self, timeout: float | None = None) -> Snapshot | None:
+        """
+        Wait for the latest snapshot, removing it from the buffer.
+
+        Parameters
+        ----------
+        timeout : optional
+            Seconds to wait for a snapshot (default is None, wait until one is
+            published or the buffer is closed).
+
+        Returns
+        -------
+        Snapshot or None
+            Latest snapshot, or None if none was published in time or the buffer is
+            closed.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._back is not None or self.closed, timeout
+            )
+            front, self._back = self._back, None
+
+        return front
+
+    def close(self) -> None:
+        """Wake any waiting thread, with no more snapshots to come."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class SnapshotPublisher:
+    """
+    Stands in for the view in the main loop, publishing snapshots of the model for
+    the render thread instead of drawing.
+
+    Methods
+    -------
+    update
+        Publish a snapshot of the model, if changed.
+    close
+        Close the buffer, so the render thread stops waiting for snapshots.
+    """
+
+    def __init__(
+        self, model: Model, buffer: SnapshotBuffer, stats: FrameStats | None = None
+    ) -> None:
+        """
+        Set the model to capture and where to publish it.
+
+        Parameters
+        ----------
+        model
+            Model to capture.
+        buffer
+            Buffer to publish snapshots into.
+        stats : optional
+            Records time taken to capture snapshots, and snapshots dropped (default
+            is None, not recorded).
+        """
+        self._model = model
+        self._buffer = buffer
+        self._stats = stats or NullFrameStats()
+        log.info("Creating %s", self)
+
+        self._snapshot: Snapshot | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._model}, {self._buffer})"
+
+    def update(self, alpha: float = 1.0) -> bool:
+        """
+        Publish a snapshot of the model, unless it is the same as the last published.
+
+        Parameters
+        ----------
+        alpha : optional
+            Fraction of the way from the previous model state to the current state to
+            capture items at (default is 1, the current state).
+
+        Returns
+        -------
+        bool
+            Whether a snapshot was published.
+        """
+        self._stats.begin("snapshot")
+        snapshot = self._model.snapshot(alpha)
+        self._stats.end()
+        if snapshot == self._snapshot:
+            self._stats.count("view.skipped")
+            return False
+
+        if self._buffer.publish(snapshot):
+            self._stats.count("snapshots_dropped")
+        self._snapshot = snapshot
+
+        return True
+
+    def close(self) -> None:
+        """Close the buffer, so the render thread stops waiting for snapshots."""
+        self._buffer.close()
+
+
+class RenderThread(threading.Thread):
+    """
+    Draws the latest snapshot of the model in a separate thread, so presenting frames
+    overlaps with updating the model.
+
+    `pygame` releases the GIL while blitting and writing frames, so the two run in
+    parallel on multi-core devices. The view must write frames to a sink, as a
+    window must be drawn from the thread that created it. Any error while drawing is
+    logged and quits the app from the main loop.
+
+    Methods
+    -------
+    run
+        Draw snapshots until stopped.
+    stop
+        Stop drawing, wait for the thread to finish, and close the view.
+    """
+
+    def __init__(
+        self, view: View, buffer: SnapshotBuffer, stats: FrameStats | None = None
+    ) -> None:
+        """
+        Set the view to draw with and where to take snapshots from.
+
+        Parameters
+        ----------
+        view
+            View drawing snapshots.
+        buffer
+            Buffer to take snapshots from.
+        stats : optional
+            Records frames drawn, separately from the main loop (default is None,
+            not recorded).
+        """
+        super().__init__(name=type(self).__name__, daemon=True)
+        self._view = view
+        self._buffer = buffer
+        self._stats = stats or NullFrameStats()
+        log.info("Creating %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._view}, {self._buffer})"
+
+    def run(self) -> None:
+        """Draw snapshots until the buffer is closed."""
+        log.info("Starting %s", self)
+        try:
+            while not self._buffer.closed:
+                snapshot = self._buffer.take(SNAPSHOT_TIMEOUT)
+                if snapshot is None:
+                    continue
+                self._view.draw(snapshot)
+                self._stats.end_frame()
+        except Exception:
+            log.exception("Error drawing in %s", self)
+            pg.event.post(pg.event.Event(pg.QUIT))
+
+    def stop(self) -> None:
+        """Stop drawing, wait for the thread to finish, and close the view."""
+        log.info("Stopping %s", self)
+        self._buffer.close()
+        if self.is_alive():
+            self.join()
+        self._view.close()
@@ -0,0 +1,126 @@
+import heapq
+import itertools
+import logging
+from collections.abc import Sequence
+
+from screen_animator.item_groups import TimeableItemGroup
+from screen_animator.timing import Clock
+
+log = logging.getLogger(__name__)
+
+MAX_DISPATCH_PER_STEP = 1
+
+
+class Scheduler:
+    """
+    Decides when timed groups are next updated, from a heap of their deadlines.
+
+    Only the earliest deadline is checked each step, so the cost does not grow with
+    the number of groups waiting. Groups due on the same step are spread over
+    consecutive steps, in deadline order, so their updates do not all land on one
+    frame. Each group is next due its time difference after it was updated.
+
+    Attributes
+    ----------
+    next_deadline
+        Clock ticks when the next group is due.
+
+    Methods
+    -------
+    register
+        Add a group, due its time difference from now.
+    pop_due
+        Take the groups to update now, scheduling each again.
+    reschedule
+        Replace the deadline of a group, e.g. when its time difference changes.
+    """
+
+    def __init__(self, clock: Clock, max_dispatch: int = MAX_DISPATCH_PER_STEP) -> None:
+        """
+        Create an empty schedule.
+
+        Parameters
+        ----------
+        clock
+            Source of time for deadlines.
+        max_dispatch : optional
+            Most groups to update in one step (default is 1).
+        """
+        self._clock = clock
+        self._max_dispatch = max_dispatch
+        log.info("Creating %s", self)
+
+        self._deadlines: list[tuple[int, int, TimeableItemGroup]] = []
+        self._order = itertools.count()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._clock}, {self._max_dispatch})"
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    @property
+    def next_deadline(self) -> int | None:
+        """Clock ticks when the next group is due, or None if there are none."""
+        return self._deadlines[0][0] if self._deadlines else None
+
+    def register(self, group: TimeableItemGroup) -> None:
+        """
+        Add a group, due its time difference from now.
+
+        Parameters
+        ----------
+        group
+            Group to update each time its time difference passes.
+        """
+        log.info("Scheduling %s every %s s", group.name, group.time_diff)
+        self._schedule(group, self._clock.get_ticks())
+
+    def pop_due(self) -> Sequence[TimeableItemGroup]:
+        """
+        Take the groups whose deadline has passed, up to the most for one step,
+        scheduling each again from now.
+
+        Returns
+        -------
+        Sequence[TimeableItemGroup]
+            Groups to update, earliest deadline first.
+        """
+        time = self._clock.get_ticks()
+        if not self._deadlines or self._deadlines[0][0] > time:
+            return ()
+
+        due: list[TimeableItemGroup] = []
+        while (
+            self._deadlines
+            and self._deadlines[0][0] <= time
+            and len(due) < self._max_dispatch
+        ):
+            deadline, _, group = heapq.heappop(self._deadlines)
+            log.debug("Updating %s, %s ms after deadline", group.name, time - deadline)
+            due.append(group)
+        for group in due:
+            self._schedule(group, time)
+
+        return due
+
+    def reschedule(self, group: TimeableItemGroup) -> None:
+        """
+        Replace the deadline of a group with one its time difference from now, e.g.
+        when its time difference changes.
+
+        Parameters
+        ----------
+        group
+            Group already registered.
+        """
+        log.info("Rescheduling %s every %s s", group.name, group.time_diff)
+        self._deadlines = [entry for entry in self._deadlines if entry[2] is not group]
+        heapq.heapify(self._deadlines)
+        self._schedule(group, self._clock.get_ticks())
+
+    def _schedule(self, group: TimeableItemGroup, time: int) -> None:
+        heapq.heappush(
+            self._deadlines,
+            (time + round(group.time_diff * 1000), next(self._order), group),
+        )
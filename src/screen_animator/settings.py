@@ -1,7 +1,16 @@
 from pathlib import Path
+import json
 import random
+import re
 import logging
-from collections.abc import Iterable, MutableMapping
+from collections.abc import (
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Set as AbstractSet,
+)
+from dataclasses import dataclass, field
 from os import PathLike
 from typing import Any
 
@@ -9,6 +18,12 @@ import pygame as pg
 from mergedeep import merge
 
 from screen_animator.image_loading import ImageLoader
+from screen_animator.message_sources import (
+    FileMessageSource,
+    ListMessageSource,
+    MessageSource,
+)
+from screen_animator.timing import Clock, SystemClock
 
 try:
     import tomllib
@@ -17,6 +32,279 @@ except ModuleNotFoundError:
 
 log = logging.getLogger(__name__)
 
+COLOR_SETTINGS = frozenset({"colors", "messages.outline_colors"})
+FONT_SETTINGS = frozenset(
+    {"messages.typeface", "messages.sizes", "messages.bold", "messages.italic"}
+)
+MESSAGE_SOURCE_SETTINGS = frozenset({"messages.messages", "messages.file"})
+
+_MISSING = object()
+
+
+def diff_settings(
+    old: Mapping[str, Any], new: Mapping[str, Any], prefix: str = ""
+) -> set[str]:
+    """
+    Find the settings added, removed or changed between two dictionaries of settings.
+
+    Parameters
+    ----------
+    old
+        Settings before.
+    new
+        Settings after.
+    prefix : optional
+        Path of the table being compared, ending with a dot (default is "", the
+        top level).
+
+    Returns
+    -------
+    set[str]
+        Dotted path of each setting that differs, e.g. `messages.messages`.
+    """
+    changed = set()
+    for key in old.keys() | new.keys():
+        path = f"{prefix}{key}"
+        old_value, new_value = old.get(key, _MISSING), new.get(key, _MISSING)
+        if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+            changed |= diff_settings(old_value, new_value, f"{path}.")
+        elif old_value != new_value:
+            changed.add(path)
+
+    return changed
+
+
+def _copy_settings(settings: Any) -> Any:
+    """Copy tables and lists of settings, so the copy is not changed along with them."""
+    match settings:
+        case Mapping():
+            return {key: _copy_settings(value) for key, value in settings.items()}
+        case list():
+            return [_copy_settings(item) for item in settings]
+        case _:
+            return settings
+
+
+Color = tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class MessageSettings:
+    """
+    Settings for the scrolling messages, from the `messages` table.
+
+    Attributes
+    ----------
+    messages
+        Messages to choose from.
+    separator
+        Text added after each message.
+    typeface
+        Name of the font to render messages with.
+    sizes
+        Smallest and largest font size to choose from.
+    bold
+        Whether the font is bold.
+    italic
+        Whether the font is italic.
+    anti_aliasing
+        Whether messages are rendered with anti-aliasing.
+    scroll_speed
+        Pixels scrolled per second.
+    outline_width
+        Width of the outline in pixels, 0 for no outline.
+    outline_copies
+        Number of copies of the message drawn to make the outline.
+    outline_colors
+        Outline colors to choose from, only one if a single color was given.
+    start_middle
+        Whether messages start in the middle, rather than at a random height.
+    file
+        Path of a text file of messages, one per line, to choose from instead of
+        `messages`, or None.
+    """
+
+    messages: Sequence[str]
+    separator: str
+    typeface: str
+    sizes: tuple[int, ...]
+    bold: bool
+    italic: bool
+    anti_aliasing: bool
+    scroll_speed: int
+    outline_width: int
+    outline_copies: int
+    outline_colors: tuple[Color, ...]
+    start_middle: bool
+    file: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ImageSettings:
+    """
+    Settings for the randomly moving images, from the `images` table.
+
+    Attributes
+    ----------
+    sources
+        Path and width of each image.
+    number
+        Number of copies of each image.
+    reposition_attempts
+        Attempts to place each image without overlapping others, negative for no
+        limit.
+    """
+
+    sources: tuple[tuple[str, int], ...]
+    number: int
+    reposition_attempts: int
+
+
+@dataclass(frozen=True, slots=True)
+class TimingSettings:
+    """
+    Settings for timings, from the `timings` table.
+
+    Attributes
+    ----------
+    fps
+        Target frames per second.
+    image_change_time
+        Seconds between images moving.
+    color_change_time
+        Seconds between colors changing.
+    """
+
+    fps: float
+    image_change_time: float
+    color_change_time: float
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSettings:
+    """
+    Validated settings compiled into attributes, to be read without looking up
+    nested dictionaries by name, e.g. every frame.
+
+    Settings only read when starting, e.g. `governor`, are left in the dictionary.
+
+    Attributes
+    ----------
+    colors
+        Colors to choose the background and text colors from.
+    messages
+        Settings for the scrolling messages.
+    images
+        Settings for the randomly moving images.
+    timings
+        Settings for timings.
+
+    Methods
+    -------
+    compile
+        Compile a dictionary of validated settings.
+    """
+
+    colors: tuple[Color, ...]
+    messages: MessageSettings
+    images: ImageSettings
+    timings: TimingSettings
+
+    @classmethod
+    def compile(cls, settings: Mapping[str, Any]) -> "CompiledSettings":
+        """
+        Compile a dictionary of validated settings.
+
+        Parameters
+        ----------
+        settings
+            Settings validated by `SettingsImporter`, with colors as tuples.
+
+        Returns
+        -------
+        CompiledSettings
+            The same settings as attributes.
+        """
+        messages_dict = settings["messages"]
+        images_dict = settings["images"]
+        timings_dict = settings["timings"]
+        messages = messages_dict.get("messages", ())
+        outline_colors = messages_dict["outline_colors"]
+
+        return cls(
+            tuple(settings["colors"]),
+            MessageSettings(
+                messages if isinstance(messages, str) else tuple(messages),
+                messages_dict["separator"],
+                messages_dict["typeface"],
+                tuple(messages_dict["sizes"]),
+                messages_dict["bold"],
+                messages_dict["italic"],
+                messages_dict["anti-aliasing"],
+                messages_dict["scroll_speed"],
+                messages_dict["outline_width"],
+                messages_dict["outline_copies"],
+                cls._compile_colors(outline_colors),
+                messages_dict["start_middle"],
+                messages_dict.get("file"),
+            ),
+            ImageSettings(
+                tuple(tuple(source) for source in images_dict["sources"]),
+                images_dict["number"],
+                images_dict["reposition_attempts"],
+            ),
+            TimingSettings(
+                timings_dict["fps"],
+                timings_dict["image_change_time"],
+                timings_dict["color_change_time"],
+            ),
+        )
+
+    @staticmethod
+    def _compile_colors(colors: Sequence[Any]) -> tuple[Color, ...]:
+        """Colors to choose from, a single color being the only one."""
+        match colors:
+            case (int() as red, int() as green, int() as blue):
+                return ((red, green, blue),)
+            case _:
+                return tuple(tuple(color) for color in colors)
+
+
+@dataclass(slots=True)
+class SettingsState:
+    """
+    Settings chosen or measured while running, kept apart from the compiled
+    settings as they change while the animation runs.
+
+    Attributes
+    ----------
+    bg_color
+        Background color.
+    color
+        Text color.
+    outline_color
+        Text outline color.
+    font
+        Font messages are rendered with.
+    size
+        Size of the font.
+    images
+        Images loaded from the sources.
+    fps_actual
+        Frames per second measured.
+    quality
+        Description of the quality set by the governor, if any.
+    """
+
+    bg_color: Color = (0, 0, 0)
+    color: Color = (255, 255, 255)
+    outline_color: Color = (0, 0, 0)
+    font: pg.font.Font | None = None
+    size: int = 0
+    images: list[pg.Surface] = field(default_factory=list)
+    fps_actual: float = 0.0
+    quality: str | None = None
+
 
 class SettingsImporter:
     """
@@ -73,7 +361,6 @@ class SettingsImporter:
             case {
                 "colors": list(),
                 "messages": {
-                    "messages": list() | str(),
                     "separator": str(),
                     "typeface": str(),
                     "sizes": list(),
@@ -96,11 +383,23 @@ class SettingsImporter:
                     "image_change_time": int() | float(),
                     "color_change_time": int() | float(),
                 },
-            }:
+            } if self._has_message_source(self._settings["messages"]):
                 log.info("Validation successful")
             case _:
                 raise ValueError(f"Invalid configuration {self._settings}")
 
+    @staticmethod
+    def _has_message_source(messages_dict: Mapping[str, Any]) -> bool:
+        """Whether messages are given, as a list, a messages file, or both."""
+        messages = messages_dict.get("messages")
+        file = messages_dict.get("file")
+
+        return (
+            (messages is not None or file is not None)
+            and (messages is None or isinstance(messages, list | str))
+            and (file is None or isinstance(file, str))
+        )
+
     def _convert_colors_to_tuples(self, input_item):
         match input_item:
             case [int(), int(), int()] | [int(), int()] | [str(), int()]:
@@ -116,10 +415,86 @@ class SettingsImporter:
                 return input_item
 
 
+class SettingsExporter:
+    """
+    Exports settings to a TOML file, e.g. as a layer to read after other files.
+
+    Methods
+    -------
+    export_settings
+        Writes the settings to a TOML file.
+    """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def export_settings(
+        self, settings: Mapping[str, Any], settings_file: str | PathLike
+    ) -> None:
+        """
+        Writes the settings to a TOML file.
+
+        Parameters
+        ----------
+        settings
+            Settings to write, containing only strings, numbers, booleans, and lists
+            and dictionaries of these.
+        settings_file
+            Path to the TOML file to write.
+        """
+        log.info("Writing settings to %s", settings_file)
+        Path(settings_file).write_text(self._to_toml(settings))
+
+    def _to_toml(self, settings: Mapping[str, Any]) -> str:
+        sections = self._to_toml_sections(settings, [])
+
+        return "\n\n".join("\n".join(section) for section in sections if section) + "\n"
+
+    def _to_toml_sections(
+        self, settings: Mapping[str, Any], table: list[str]
+    ) -> list[list[str]]:
+        section = [f"[{'.'.join(table)}]"] if table else []
+        tables = []
+        for key, value in settings.items():
+            key = key if re.fullmatch(r"[\w-]+", key) else json.dumps(key)
+            if isinstance(value, Mapping):
+                tables.extend(self._to_toml_sections(value, [*table, key]))
+            else:
+                section.append(f"{key} = {self._to_toml_value(value)}")
+
+        return [section, *tables]
+
+    def _to_toml_value(self, value: Any) -> str:
+        match value:
+            case bool():
+                return "true" if value else "false"
+            case int() | float() | str():
+                return json.dumps(value)
+            case list() | tuple():
+                return f"[{', '.join(self._to_toml_value(item) for item in value)}]"
+            case _:
+                raise ValueError(f"Cannot write {value!r} to TOML")
+
+
 class SettingsManager:
     """
     Reads in settings, manipulates, and provides provisions for generating dynamic settings.
 
+    The dictionary of settings is compiled into `config` for reading, and must be
+    compiled again after changing it in place. Colors, font and other settings
+    chosen while running are kept in `state`.
+
+    Attributes
+    ----------
+    rng
+        Source of random choices for the animation.
+    clock
+        Source of time for the animation.
+    config
+        Settings compiled into attributes.
+    state
+        Settings chosen or measured while running.
+
     Methods
     -------
     set_colors
@@ -128,11 +503,21 @@ class SettingsManager:
         Create string with combined random message and separator
     set_font
         Create the `pygame` font instance for rendering text.
+    compile
+        Compile the dictionary of settings again, after changing it.
+    reload
+        Import settings again, applying only those changed.
     """
 
     _settings: MutableMapping[str, Any]
 
-    def __init__(self, settings_files: Iterable[str | PathLike]) -> None:
+    def __init__(
+        self,
+        settings_files: Iterable[str | PathLike],
+        render_scale: float = 1.0,
+        seed: int | None = None,
+        clock: Clock | None = None,
+    ) -> None:
         """
         Import settings from specified file and set initial settings.
 
@@ -140,16 +525,33 @@ class SettingsManager:
         ----------
         settings_files
             Paths to settings files.
+        render_scale : optional
+            Fraction of the display resolution being rendered at, used to scale sizes
+            given in pixels (default is 1.0, no scaling).
+        seed : optional
+            Seed for random choices, for a repeatable animation (default is None,
+            seeded from the system).
+        clock : optional
+            Source of time for the animation (default is None, real time is used).
         """
         self._settings_files = settings_files
+        self._render_scale = render_scale
+        self._seed = seed
+        self.rng = random.Random(seed)
+        self.clock = clock or SystemClock()
+        self._images: dict[tuple[str, int], pg.Surface] = {}
         self._import_settings()
+        self._scale_settings(self._settings)
+        self._imported = _copy_settings(self._settings)
+        self.config = CompiledSettings.compile(self._settings)
+        self.state = SettingsState(fps_actual=self.config.timings.fps)
         self.set_colors()
         self.set_font()
         self._load_images()
-        self._settings["timings"]["fps_actual"] = self._settings["timings"]["fps"]
+        self._message_source = self._create_message_source(self.config.messages)
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self._settings_files})"
+        return f"{type(self).__name__}({self._settings_files}, {self._render_scale}, {self._seed}, {self.clock})"
 
     @property
     def settings(self) -> MutableMapping[str, Any]:
@@ -159,24 +561,22 @@ class SettingsManager:
     def set_colors(self) -> None:
         """Set background, text, and text outline colors from the available options
         in the settings provided."""
-        if self._settings.get("bg") is None:
-            self._settings["bg"] = {}
-        self._settings["bg"]["color"] = random.choice(self._settings["colors"])
-        log.debug("Set background color as: %s", self._settings["bg"]["color"])
-
-        messages_dict = self._settings["messages"]
-        messages_dict["color"] = random.choice(self._settings["colors"])
-        while messages_dict["color"] == self._settings["bg"]["color"]:
-            messages_dict["color"] = random.choice(self._settings["colors"])
-        log.debug("Set text color as: %s", messages_dict["color"])
-
-        match messages_dict["outline_colors"]:
-            case (int(), int(), int()) as outline_color:
-                pass
-            case outline_colors:
-                outline_color = random.choice(outline_colors)
-        messages_dict["outline_color"] = outline_color
-        log.debug("Set outline color as: %s", messages_dict["outline_color"])
+        colors, state = self.config.colors, self.state
+        state.bg_color = self.rng.choice(colors)
+        log.debug("Set background color as: %s", state.bg_color)
+
+        state.color = self.rng.choice(colors)
+        while state.color == state.bg_color:
+            state.color = self.rng.choice(colors)
+        log.debug("Set text color as: %s", state.color)
+
+        outline_colors = self.config.messages.outline_colors
+        state.outline_color = (
+            outline_colors[0]
+            if len(outline_colors) == 1
+            else self.rng.choice(outline_colors)
+        )
+        log.debug("Set outline color as: %s", state.outline_color)
 
     def generate_message_text(self) -> str:
         """
@@ -187,37 +587,140 @@ class SettingsManager:
         str
             The selected message.
         """
-        messages_dict = self._settings["messages"]
+        message = self._message_source.choose(self.rng)
+
+        return f"{message}{self.config.messages.separator}"
 
-        return f"{random.choice(messages_dict['messages'])}{messages_dict['separator']}"
+    def set_font(self) -> pg.font.Font:
+        """
+        Create the `pygame` font instance for rendering messages.
 
-    def set_font(self) -> None:
-        """Create the `pygame` font instance for rendering messages."""
+        Returns
+        -------
+        pg.font.Font
+            The font created, also kept as `state.font`.
+        """
         log.debug("Setting `pygame` font for text rendering")
-        messages_dict = self._settings["messages"]
-        messages_dict["size"] = random.randint(
-            min(messages_dict["sizes"]), max(messages_dict["sizes"])
-        )
-        messages_dict["font"] = pg.font.Font(
+        messages = self.config.messages
+        self.state.size = self.rng.randint(min(messages.sizes), max(messages.sizes))
+        self.state.font = font = pg.font.Font(
             pg.font.match_font(
-                messages_dict["typeface"],
-                bold=messages_dict["bold"],
-                italic=messages_dict["italic"],
+                messages.typeface, bold=messages.bold, italic=messages.italic
             ),
-            messages_dict["size"],
+            self.state.size,
         )
 
+        return font
+
+    def compile(self) -> None:
+        """Compile the dictionary of settings again, after changing it in place."""
+        self.config = CompiledSettings.compile(self._settings)
+
+    def reload(self) -> AbstractSet[str]:
+        """
+        Import the settings files again, applying only the settings that changed.
+
+        Colors and font in use are kept unless the options they are chosen from
+        changed, and only images not already loaded are loaded.
+
+        Returns
+        -------
+        AbstractSet[str]
+            Dotted path of each setting that changed, e.g. `messages.messages`.
+
+        Raises
+        ------
+        ValueError
+            If the settings are not valid, in which case none are changed.
+        OSError
+            If a settings file cannot be read, in which case none are changed.
+        """
+        imported = SettingsImporter().import_settings(self._settings_files)
+        self._scale_settings(imported)
+        changed = diff_settings(self._imported, imported)
+        log.info("Settings changed on reload: %s", sorted(changed))
+        if changed & MESSAGE_SOURCE_SETTINGS:
+            message_source = self._create_message_source(
+                CompiledSettings.compile(imported).messages
+            )
+            self._message_source.close()
+            self._message_source = message_source
+        for path in changed:
+            self._apply_setting(path, imported)
+        self._imported = _copy_settings(imported)
+        self.compile()
+        if changed & COLOR_SETTINGS:
+            self.set_colors()
+        if changed & FONT_SETTINGS:
+            self.set_font()
+        if "images.sources" in changed:
+            self._load_images()
+
+        return changed
+
+    def _apply_setting(self, path: str, imported: Mapping[str, Any]) -> None:
+        """Copy one setting from those imported, or remove it if no longer there."""
+        *tables, key = path.split(".")
+        settings = self._settings
+        for table in tables:
+            imported = imported[table]
+            settings = settings.setdefault(table, {})
+        if key in imported:
+            settings[key] = _copy_settings(imported[key])
+        else:
+            settings.pop(key, None)
+
+    def _create_message_source(self, messages: MessageSettings) -> MessageSource:
+        if messages.file is not None:
+            return FileMessageSource(messages.file)
+
+        return ListMessageSource(messages.messages)
+
     def _import_settings(self) -> None:
         importer = SettingsImporter()
         self._settings = importer.import_settings(self._settings_files)
 
+    def _scale_settings(self, settings: MutableMapping[str, Any]) -> None:
+        if self._render_scale == 1:
+            return
+
+        log.info("Scaling pixel sizes in settings by %s", self._render_scale)
+        messages_dict = settings["messages"]
+        messages_dict["sizes"] = tuple(
+            self._scale_length(size) for size in messages_dict["sizes"]
+        )
+        if messages_dict["scroll_speed"] > 0:
+            messages_dict["scroll_speed"] = self._scale_length(
+                messages_dict["scroll_speed"]
+            )
+        if messages_dict["outline_width"] > 0:
+            messages_dict["outline_width"] = self._scale_length(
+                messages_dict["outline_width"]
+            )
+
+    def _scale_length(self, length: int) -> int:
+        return max(1, round(length * self._render_scale))
+
     def _load_images(self):
-        images_dict = self._settings["images"]
-        if len(images_dict["sources"]) >= 1:
+        sources = self.config.images.sources
+        self.state.images = []
+        images = {}
+        if len(sources) >= 1:
             log.info("Loading and scaling images for rendering")
-            images_dict["images"] = []
             image_loader = ImageLoader()
-            for image_src, width in images_dict["sources"]:
-                image = image_loader.load_image(image_src, width)
+            for image_src, width in sources:
+                image = self._images.get((image_src, width))
+                if image is not None:
+                    log.debug("Reusing %s, already loaded", image_src)
+                elif width > 0:
+                    image = image_loader.load_image(
+                        image_src, self._scale_length(width)
+                    )
+                else:
+                    image = image_loader.load_image(image_src, width)
+                    if image is not None and self._render_scale != 1:
+                        image = pg.transform.scale_by(image, self._render_scale)
                 if image is not None:
-                    images_dict["images"].append(image)
+                    images[image_src, width] = image
+                    self.state.images.append(image)
+        self._images = images
@@ -0,0 +1,226 @@
+import logging
+import mmap
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from os import PathLike
+from pathlib import Path
+from typing import ClassVar
+
+import numpy as np
+import pygame as pg
+
+log = logging.getLogger(__name__)
+
+
+def _to_rgb565(pixels: np.ndarray) -> np.ndarray:
+    red, green, blue = (pixels[..., channel].astype(np.uint16) for channel in range(3))
+    packed = ((red >> 3) << 11) | ((green >> 2) << 5) | (blue >> 3)
+
+    return packed.astype("<u2").view(np.uint8)
+
+
+def _to_bytes(order: tuple[int, ...], padded: bool) -> Callable:
+    def convert(pixels: np.ndarray) -> np.ndarray:
+        height, width = pixels.shape[:2]
+        converted = np.zeros((height, width, 4 if padded else 3), np.uint8)
+        converted[..., :3] = pixels[..., order]
+
+        return converted
+
+    return convert
+
+
+class FrameSink(ABC):
+    """
+    Interface for destinations of composed frames, used in place of the display.
+
+    Methods
+    -------
+    write
+        Write changed areas of a frame (sublasses to implement).
+    close
+        Release any resources held.
+    """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def write(self, frame: pg.Surface, rects: Sequence[pg.Rect]) -> None:
+        """
+        Write a composed frame.
+
+        Parameters
+        ----------
+        frame
+            Composed frame.
+        rects
+            Areas of the frame changed since the last frame written.
+        """
+
+    def close(self) -> None:
+        """Release any resources held."""
+
+
+class NullSink(FrameSink):
+    """
+    Discards frames, for rendering off-screen without any output.
+
+    Methods
+    -------
+    write
+        Do nothing with the frame.
+    """
+
+    def write(self, frame: pg.Surface, rects: Sequence[pg.Rect]) -> None:
+        """Discard the frame."""
+
+
+class FramebufferSink(FrameSink):
+    """
+    Writes frames to a memory-mapped framebuffer device, or regular file.
+
+    Pixel formats are named as in Linux DRM, i.e. packed little-endian, so `XRGB8888`
+    is stored in memory as blue, green, red, then padding.
+
+    Methods
+    -------
+    write
+        Convert changed rows of a frame and copy into the framebuffer.
+    close
+        Unmap and close the framebuffer.
+    """
+
+    pixel_formats: ClassVar[
+        dict[str, tuple[int, Callable[[np.ndarray], np.ndarray]]]
+    ] = {
+        "RGB565": (2, _to_rgb565),
+        "RGB888": (3, _to_bytes((2, 1, 0), False)),
+        "BGR888": (3, _to_bytes((0, 1, 2), False)),
+        "XRGB8888": (4, _to_bytes((2, 1, 0), True)),
+        "XBGR8888": (4, _to_bytes((0, 1, 2), True)),
+    }
+    _bits_per_pixel_formats: ClassVar[dict[int, str]] = {
+        16: "RGB565",
+        24: "RGB888",
+        32: "XRGB8888",
+    }
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        size: tuple[int, int] | None = None,
+        pixel_format: str | None = None,
+        stride: int | None = None,
+    ) -> None:
+        """
+        Open and map the framebuffer.
+
+        Geometry not provided is read from `/sys/class/graphics` for framebuffer
+        devices. Other paths are regular files, created if they do not exist, and
+        extended to fit the frame if they are too small.
+
+        Parameters
+        ----------
+        path
+            Path to framebuffer device or file.
+        size : optional
+            Width and height of framebuffer in pixels.
+        pixel_format : optional
+            Pixel format of framebuffer, one of `pixel_formats`.
+        stride : optional
+            Bytes per row of framebuffer (default is width multiplied by bytes per pixel).
+        """
+        self._path = Path(path)
+        log.info("Creating %s", self)
+
+        size, bits_per_pixel, stride = self._read_geometry(size, stride)
+        pixel_format = pixel_format or self._bits_per_pixel_formats.get(
+            bits_per_pixel, "XRGB8888"
+        )
+        if pixel_format not in self.pixel_formats:
+            raise ValueError(f"Unsupported pixel format {pixel_format}")
+
+        self.size = size
+        self.pixel_format = pixel_format
+        self._bytes_per_pixel, self._convert = self.pixel_formats[pixel_format]
+        self.stride = stride or size[0] * self._bytes_per_pixel
+
+        length = self.stride * size[1]
+        if not self._path.is_char_device():
+            self._path.touch()
+        self._file = self._path.open("r+b")
+        if self._path.is_file() and self._path.stat().st_size < length:
+            self._file.truncate(length)
+        self._map = mmap.mmap(self._file.fileno(), length)
+        self._rows = np.frombuffer(self._map, np.uint8).reshape(size[1], self.stride)
+        log.info(
+            "Mapped %s as %sx%s %s with stride %s",
+            self._path,
+            *size,
+            pixel_format,
+            self.stride,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self._path)!r})"
+
+    def write(self, frame: pg.Surface, rects: Sequence[pg.Rect]) -> None:
+        """
+        Convert the changed rows of a frame and copy them into the framebuffer.
+
+        Parameters
+        ----------
+        frame
+            Composed frame, no larger than the framebuffer.
+        rects
+            Areas of the frame changed since the last frame written.
+        """
+        width = min(frame.get_width(), self.size[0])
+        row_bytes = width * self._bytes_per_pixel
+        pixels = pg.surfarray.pixels3d(frame)
+        for top, bottom in self._row_spans(
+            rects, min(frame.get_height(), self.size[1])
+        ):
+            converted = self._convert(pixels[:width, top:bottom].transpose(1, 0, 2))
+            self._rows[top:bottom, :row_bytes] = converted.reshape(bottom - top, -1)
+        del pixels
+
+    def close(self) -> None:
+        """Unmap and close the framebuffer."""
+        log.info("Closing %s", self)
+        del self._rows
+        self._map.close()
+        self._file.close()
+
+    @staticmethod
+    def _row_spans(rects: Sequence[pg.Rect], height: int) -> list[tuple[int, int]]:
+        spans: list[tuple[int, int]] = []
+        for top, bottom in sorted(
+            (max(rect.top, 0), min(rect.bottom, height)) for rect in rects
+        ):
+            if top >= bottom:
+                continue
+            if spans and top <= spans[-1][1]:
+                spans[-1] = spans[-1][0], max(spans[-1][1], bottom)
+            else:
+                spans.append((top, bottom))
+
+        return spans
+
+    def _read_geometry(
+        self, size: tuple[int, int] | None, stride: int | None
+    ) -> tuple[tuple[int, int], int, int | None]:
+        sys_path = Path("/sys/class/graphics", self._path.name)
+        if not sys_path.is_dir():
+            if size is None:
+                raise ValueError(f"Size required for framebuffer {self._path}")
+            return size, 0, stride
+
+        if size is None:
+            width, height = (sys_path / "virtual_size").read_text().strip().split(",")
+            size = int(width), int(height)
+        bits_per_pixel = int((sys_path / "bits_per_pixel").read_text())
+        stride = stride or int((sys_path / "stride").read_text())
+
+        return size, bits_per_pixel, stride
@@ -0,0 +1,132 @@
+import logging
+from abc import ABC, abstractmethod
+
+import pygame as pg
+
+log = logging.getLogger(__name__)
+
+
+class Clock(ABC):
+    """
+    Interface for the source of time for the animation.
+
+    Methods
+    -------
+    tick
+        Mark the start of a new frame (sublasses to implement).
+    get_fps
+        Get the frame rate achieved (sublasses to implement).
+    get_ticks
+        Get the time elapsed (sublasses to implement).
+    """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abstractmethod
+    def tick(self, fps: float = 0) -> int:
+        """
+        Mark the start of a new frame, limiting the frame rate if required.
+
+        Parameters
+        ----------
+        fps : optional
+            Target frame rate (default is 0, no limit).
+
+        Returns
+        -------
+        int
+            Milliseconds since the previous tick.
+        """
+
+    @abstractmethod
+    def get_fps(self) -> float:
+        """Frame rate achieved over recent ticks."""
+
+    @abstractmethod
+    def get_ticks(self) -> int:
+        """Milliseconds elapsed since the clock started."""
+
+
+class SystemClock(Clock):
+    """
+    Real time as measured by `pygame`.
+
+    Methods
+    -------
+    tick
+        Wait until the next frame is due.
+    get_fps
+        Get the frame rate achieved.
+    get_ticks
+        Get the time elapsed since `pygame` started.
+    """
+
+    def __init__(self) -> None:
+        self._clock = pg.time.Clock()
+
+    def tick(self, fps: float = 0) -> int:
+        """Wait until the next frame is due, returning milliseconds since last tick."""
+        return self._clock.tick(fps)
+
+    def get_fps(self) -> float:
+        """Frame rate achieved over recent ticks."""
+        return self._clock.get_fps()
+
+    def get_ticks(self) -> int:
+        """Milliseconds elapsed since `pygame` started."""
+        return pg.time.get_ticks()
+
+
+class SimulatedClock(Clock):
+    """
+    Simulated time, advancing by exactly one frame per tick without waiting.
+
+    Allows the animation to be stepped deterministically, and as fast as possible.
+
+    Methods
+    -------
+    tick
+        Advance time by one frame.
+    get_fps
+        Get the frame rate being simulated.
+    get_ticks
+        Get the simulated time elapsed.
+    """
+
+    def __init__(self, fps: float = 0) -> None:
+        """
+        Start simulated time at zero.
+
+        Parameters
+        ----------
+        fps : optional
+            Frame rate simulated when ticks do not specify a frame rate (default is 0,
+            time does not advance).
+        """
+        self._fps = fps
+        self._time = 0.0
+        log.info("Creating %s", self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._fps})"
+
+    def tick(self, fps: float = 0) -> int:
+        """Advance time by one frame, returning milliseconds since last tick."""
+        self._fps = fps or self._fps
+        if self._fps <= 0:
+            return 0
+
+        time = self._time + 1000 / self._fps
+        elapsed = int(time) - int(self._time)
+        self._time = time
+
+        return elapsed
+
+    def get_fps(self) -> float:
+        """Frame rate being simulated."""
+        return float(self._fps)
+
+    def get_ticks(self) -> int:
+        """Simulated milliseconds elapsed."""
+        return int(self._time)
@@ -1,19 +1,255 @@
 import logging
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import Any, Protocol
 
 import pygame as pg
+from pygame._sdl2.video import Renderer, Texture
 
-from .listener import Listener
-from screen_animator.model import Model
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+from screen_animator.item_groups import ItemGroup, group_items
+from screen_animator.items import Movable
+from screen_animator.model import Model, Snapshot
+from screen_animator.settings import SettingsState
+from screen_animator.sinks import FrameSink
 
 log = logging.getLogger(__name__)
 
 
-class View(Listener):
+class ModelView(Protocol):
+    """Draws the model for the main loop, or passes it on to be drawn."""
+
+    def update(self, alpha: float = 1.0) -> bool: ...
+
+    def close(self) -> None: ...
+
+
+class DrawList:
+    """
+    Content and position of each item to draw, in order, kept up to date in place.
+
+    Content is converted once for as long as it is displayed, e.g. rotated or
+    uploaded as a texture, and positions are updated in place, so frames where the
+    same items are drawn allocate almost nothing. Positions are rotated with the
+    display if required.
+
+    Items entirely outside the display, e.g. a message before it scrolls on, are
+    culled, left out of the blits, and moving them does not count as a change.
+
+    Attributes
+    ----------
+    blits
+        Converted content and position of each item on the display, in drawing
+        order.
+    dirty_rects
+        Areas changed by the last update, if tracked.
+    drawn
+        Number of items in the blits after the last update.
+    culled
+        Number of items left out of the blits by the last update.
+
+    Methods
+    -------
+    update
+        Bring the list up to date with the items to draw.
+    """
+
+    def __init__(
+        self,
+        perimeter: pg.Rect,
+        convert: Callable[[pg.Surface], Any] | None = None,
+        rotated: bool = False,
+        track_dirty: bool = False,
+    ) -> None:
+        """
+        Set how content is converted and positioned.
+
+        Parameters
+        ----------
+        perimeter
+            Outer perimeter of the display.
+        convert : optional
+            Converts content to what is drawn (default is None, content is drawn
+            as it is).
+        rotated : optional
+            Whether positions are rotated with the display (default is False).
+        track_dirty : optional
+            Whether to record the areas changed by each update (default is False).
+        """
+        self._perimeter = perimeter
+        self._convert = convert
+        self._rotated = rotated
+        self._track_dirty = track_dirty
+
+        self.blits: list[tuple[Any, pg.Rect]] = []
+        self.drawn = 0
+        self.culled = 0
+        self.dirty_rects: list[pg.Rect] = []
+        self._dirty_pool: list[pg.Rect] = []
+        self._dirty_count = 0
+        self._records: dict[Movable, list] = {}
+        self._converted: dict[pg.Surface, Any] = {}
+        self._bg: tuple[int, int, int] | None = None
+        self._frame = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._perimeter}, {self._convert}, {self._rotated}, {self._track_dirty})"
+
+    def update(
+        self,
+        bg: tuple[int, int, int],
+        items: Iterable[tuple[Movable, pg.Surface, pg.Rect]],
+    ) -> bool:
+        """
+        Bring the list up to date with the items to draw.
+
+        Parameters
+        ----------
+        bg
+            Background color.
+        items
+            Each item, with its content and the rect to draw it at, in order.
+
+        Returns
+        -------
+        bool
+            Whether anything has changed since the last update.
+        """
+        self._frame += 1
+        frame = self._frame
+        redraw_all = changed = bg != self._bg
+        self._bg = bg
+        track_dirty = self._track_dirty and not redraw_all
+        self._dirty_count = 0
+        prune = False
+        perimeter = self._perimeter
+        seen = count = 0
+        for item, content, rect in items:
+            seen += 1
+            record = self._records.get(item)
+            if record is None:
+                target = pg.Rect(self._position(rect), rect.size)
+                record = self._records[item] = [
+                    content,
+                    (self._converted_content(content), target),
+                    frame,
+                ]
+                visible = perimeter.colliderect(target)
+                if visible and track_dirty:
+                    self._mark_dirty(target)
+            else:
+                record[2] = frame
+                target = record[1][1]
+                content_changed = record[0] is not content
+                if content_changed:
+                    record[0] = content
+                    record[1] = (self._converted_content(content), target)
+                    prune = True
+                x, y = self._position(rect)
+                moved = (
+                    target.x != x
+                    or target.y != y
+                    or target.width != rect.width
+                    or target.height != rect.height
+                )
+                if moved or content_changed:
+                    visible = perimeter.colliderect(x, y, rect.width, rect.height)
+                    changed = changed or visible
+                    if track_dirty:
+                        if visible:
+                            self._mark_dirty(x, y, rect.width, rect.height)
+                        if perimeter.colliderect(target):
+                            self._mark_dirty(target)
+                    target.update(x, y, rect.width, rect.height)
+                else:
+                    visible = perimeter.colliderect(target)
+            if not visible:
+                continue
+
+            blit = record[1]
+            if count == len(self.blits):
+                self.blits.append(blit)
+                changed = True
+            elif self.blits[count] is not blit:
+                self.blits[count] = blit
+                changed = True
+            count += 1
+
+        if count < len(self.blits):
+            del self.blits[count:]
+            changed = True
+        if seen < len(self._records):
+            for item, record in list(self._records.items()):
+                if record[2] != frame:
+                    del self._records[item]
+                    if track_dirty and perimeter.colliderect(record[1][1]):
+                        self._mark_dirty(record[1][1])
+            prune = True
+        self.drawn = count
+        self.culled = seen - count
+        if prune:
+            self._converted = {
+                record[0]: record[1][0] for record in self._records.values()
+            }
+
+        if redraw_all:
+            self._mark_dirty(self._perimeter)
+        del self.dirty_rects[self._dirty_count :]
+
+        return changed
+
+    def _mark_dirty(self, *rect: Any) -> None:
+        """Record a changed area, given as for `pg.Rect`, reusing earlier rects."""
+        count = self._dirty_count
+        if count == len(self._dirty_pool):
+            self._dirty_pool.append(pg.Rect(*rect))
+        else:
+            self._dirty_pool[count].update(*rect)
+        if count == len(self.dirty_rects):
+            self.dirty_rects.append(self._dirty_pool[count])
+        else:
+            self.dirty_rects[count] = self._dirty_pool[count]
+        self._dirty_count += 1
+
+    def _converted_content(self, content: pg.Surface) -> Any:
+        if self._convert is None:
+            return content
+
+        converted = self._converted.get(content)
+        if converted is None:
+            converted = self._converted[content] = self._convert(content)
+
+        return converted
+
+    def _position(self, rect: pg.Rect) -> tuple[int, int]:
+        """Top-left of the rect on the display, rotated if required."""
+        if self._rotated:
+            return (
+                self._perimeter.right - rect.right,
+                self._perimeter.bottom - rect.bottom,
+            )
+
+        return rect.x, rect.y
+
+
+def _items(
+    item_groups: Iterable[ItemGroup | pg.sprite.AbstractGroup], alpha: float
+) -> Iterator[tuple[Movable, pg.Surface, pg.Rect]]:
+    """Each item in groups with its content and rect to draw at, without copying."""
+    for item_group in item_groups:
+        for item in group_items(item_group):
+            yield item, item.content, item.render_rect(alpha)
+
+
+class View:
     """
     Display for the `screen_animator` model.
 
+    Items are kept in a `DrawList`, so nothing is drawn when nothing has changed,
+    items off the display are not blitted, and content is rotated once rather than
+    rotating the whole display every frame. Items drawn and culled are counted in
+    frame stats.
+
     Attributes
     ----------
     perimeter
@@ -22,9 +258,11 @@ class View(Listener):
     Methods
     -------
     update
-        Update the display.
-    notify
-        Tell the display to update.
+        Update the display, if changed.
+    draw
+        Update the display from a snapshot of the model, if changed.
+    close
+        Close the sink, if any.
     """
 
     perimeter: pg.Rect
@@ -33,8 +271,10 @@ class View(Listener):
         self,
         model: Model,
         display: pg.Surface,
-        settings: Mapping[str, Any],
+        state: SettingsState,
         rotated: bool = False,
+        sink: FrameSink | None = None,
+        stats: FrameStats | None = None,
     ) -> None:
         """
         Set-up some initial parameters for the display.
@@ -44,39 +284,219 @@ class View(Listener):
         model
             Model to be displayed.
         display
-            `pygame` display.
-        settings
-            User-defined settings.
+            `pygame` display, or an off-screen surface if a sink is used.
+        state
+            Settings chosen while running, with the background color.
         rotated : optional
             Flips the display across the horizontal axis (default is False, not flipped).
+        sink : optional
+            Destination for composed frames instead of the `pygame` display (default
+            is None, the `pygame` display is used).
+        stats : optional
+            Records time taken by each stage of drawing (default is None, not
+            recorded).
         """
         self._model = model
         self._display = display
-        self._settings = settings
+        self._state = state
         self._rotated = rotated
+        self._sink = sink
+        self._stats = stats or NullFrameStats()
         log.info("Creating %s", self)
 
+        self.perimeter = self._display.get_rect()
+        self._draw_list = DrawList(
+            self.perimeter,
+            _rotate if self._rotated else None,
+            self._rotated,
+            self._sink is not None,
+        )
         self._set_bg()
         log.info("%s initialization complete", type(self).__name__)
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self._model}, {self._display}, {type(self._settings).__name__}(), {self._rotated})"
+        return f"{type(self).__name__}({self._model}, {self._display}, {type(self._state).__name__}(), {self._rotated}, {self._sink})"
 
-    def update(self) -> None:
-        """Update the display."""
-        self._set_bg()
-        for group in self._model.item_groups:
-            for item in group.sprites():
-                self._display.blit(item.content, item.rect)
+    def update(self, alpha: float = 1.0) -> bool:
+        """
+        Update the display, unless nothing has changed since it was last updated.
 
-        if self._rotated:
-            self._display.blit(pg.transform.rotate(self._display, 180), (0, 0))
+        Parameters
+        ----------
+        alpha : optional
+            Fraction of the way from the previous model state to the current state to
+            draw items at (default is 1, the current state).
 
-        pg.display.flip()
+        Returns
+        -------
+        bool
+            Whether the display was updated.
+        """
+        return self._draw(self._state.bg_color, _items(self._model.item_groups, alpha))
 
-    def notify(self) -> None:
-        """Notify view of change to the model."""
-        self.update()
+    def draw(self, snapshot: Snapshot) -> bool:
+        """
+        Update the display from a snapshot of the model, e.g. in another thread,
+        unless nothing has changed since it was last updated.
+
+        Parameters
+        ----------
+        snapshot
+            State of the model to draw.
+
+        Returns
+        -------
+        bool
+            Whether the display was updated.
+        """
+        return self._draw(snapshot.bg, snapshot.items)
+
+    def close(self) -> None:
+        """Close the sink frames are written to, if any."""
+        if self._sink is not None:
+            self._sink.close()
+
+    def _draw(
+        self,
+        bg: tuple[int, int, int],
+        items: Iterable[tuple[Movable, pg.Surface, pg.Rect]],
+    ) -> bool:
+        self._stats.begin("view.track")
+        changed = self._draw_list.update(bg, items)
+        self._stats.end()
+        self._stats.count("view.drawn", self._draw_list.drawn)
+        self._stats.count("view.culled", self._draw_list.culled)
+        if not changed:
+            self._stats.count("view.skipped")
+            return False
+
+        self._stats.begin("view.fill")
+        self._display.fill(bg)
+        self._stats.end()
+
+        self._stats.begin("view.blit")
+        self._display.fblits(self._draw_list.blits)
+        self._stats.end()
+
+        self._stats.begin("view.flip")
+        if self._sink is None:
+            pg.display.flip()
+        else:
+            self._sink.write(self._display, self._draw_list.dirty_rects)
+        self._stats.end()
+
+        return True
 
     def _set_bg(self) -> None:
-        self._display.fill(self._settings["bg"]["color"])
+        self._display.fill(self._state.bg_color)
+
+
+class RendererView:
+    """
+    Display for the `screen_animator` model, drawn with an SDL2 `Renderer`.
+
+    Item content is uploaded to the renderer as textures, which are reused for as long
+    as the content is displayed. Rotation is applied when textures are copied.
+
+    Methods
+    -------
+    update
+        Update the display, if changed.
+    close
+        Release anything held for drawing.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        renderer: Renderer,
+        state: SettingsState,
+        rotated: bool = False,
+        stats: FrameStats | None = None,
+    ) -> None:
+        """
+        Set-up some initial parameters for the display.
+
+        Parameters
+        ----------
+        model
+            Model to be displayed.
+        renderer
+            SDL2 renderer for the display window.
+        state
+            Settings chosen while running, with the background color.
+        rotated : optional
+            Flips the display across the horizontal axis (default is False, not flipped).
+        stats : optional
+            Records time taken by each stage of drawing (default is None, not
+            recorded).
+        """
+        self._model = model
+        self._renderer = renderer
+        self._state = state
+        self._rotated = rotated
+        self._stats = stats or NullFrameStats()
+        log.info("Creating %s", self)
+
+        self._draw_list = DrawList(
+            self._renderer.get_viewport(),
+            partial(Texture.from_surface, self._renderer),
+            self._rotated,
+        )
+        self._set_bg()
+        log.info("%s initialization complete", type(self).__name__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._model}, {self._renderer}, {type(self._state).__name__}(), {self._rotated})"
+
+    def update(self, alpha: float = 1.0) -> bool:
+        """
+        Update the display, only uploading content not already held as a texture,
+        unless nothing has changed since it was last updated.
+
+        Parameters
+        ----------
+        alpha : optional
+            Fraction of the way from the previous model state to the current state to
+            draw items at (default is 1, the current state).
+
+        Returns
+        -------
+        bool
+            Whether the display was updated.
+        """
+        bg = self._state.bg_color
+        self._stats.begin("view.track")
+        changed = self._draw_list.update(bg, _items(self._model.item_groups, alpha))
+        self._stats.end()
+        self._stats.count("view.drawn", self._draw_list.drawn)
+        self._stats.count("view.culled", self._draw_list.culled)
+        if not changed:
+            self._stats.count("view.skipped")
+            return False
+
+        self._stats.begin("view.fill")
+        self._set_bg(bg)
+        self._stats.end()
+
+        self._stats.begin("view.blit")
+        for texture, rect in self._draw_list.blits:
+            texture.draw(dstrect=rect, flip_x=self._rotated, flip_y=self._rotated)
+        self._stats.end()
+
+        self._stats.begin("view.flip")
+        self._renderer.present()
+        self._stats.end()
+
+        return True
+
+    def close(self) -> None:
+        """Nothing to release, as textures are freed with the renderer."""
+
+    def _set_bg(self, bg: tuple[int, int, int] | None = None) -> None:
+        self._renderer.draw_color = pg.Color(bg or self._state.bg_color)
+        self._renderer.clear()
+
+
+def _rotate(content: pg.Surface) -> pg.Surface:
+    return pg.transform.rotate(content, 180)
@@ -0,0 +1,141 @@
+import logging
+import sys
+import threading
+import traceback
+from time import perf_counter
+
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+from screen_animator.settings import SettingsManager
+
+log = logging.getLogger(__name__)
+
+STALL_MULTIPLE = 4.0
+MIN_FRAME_TIME = 1 / 60
+
+
+class StallWatchdog:
+    """
+    Watches the main loop from a separate thread, logging the stack of the main
+    thread when a frame takes far longer than the target frame time.
+
+    Each stall is logged once while it is happening, with the stage running if frame
+    stats are recorded, then again with its duration once the next frame finishes.
+
+    Attributes
+    ----------
+    stalls
+        Number of stalls detected.
+
+    Methods
+    -------
+    start
+        Start watching in a separate thread.
+    stop
+        Stop watching.
+    heartbeat
+        Mark the end of a frame.
+    idle
+        Mark the start of a wait that is not a stall.
+    """
+
+    def __init__(
+        self,
+        settings_manager: SettingsManager,
+        multiple: float = STALL_MULTIPLE,
+        stats: FrameStats | None = None,
+    ) -> None:
+        """
+        Set how long a frame can take before it is considered stalled.
+
+        Parameters
+        ----------
+        settings_manager
+            Manages settings, with the target FPS.
+        multiple : optional
+            Multiple of the target frame time a frame can take before it is
+            considered stalled (default is 4).
+        stats : optional
+            Records the stage currently running (default is None, not recorded).
+        """
+        self._settings_manager = settings_manager
+        self._multiple = multiple
+        self._stats = stats or NullFrameStats()
+        log.info("Creating %s", self)
+
+        self.stalls = 0
+        self._thread_id = threading.main_thread().ident
+        self._last_beat = perf_counter()
+        self._stalled = False
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._settings_manager}, {self._multiple}, {self._stats})"
+
+    @property
+    def threshold(self) -> float:
+        """Seconds a frame can take before it is considered stalled."""
+        fps = self._settings_manager.config.timings.fps
+        frame_time = 1 / fps if fps > 0 else MIN_FRAME_TIME
+
+        return frame_time * self._multiple
+
+    def start(self) -> None:
+        """Start watching in a separate thread."""
+        log.info("Starting %s with threshold %.3f s", self, self.threshold)
+        self._last_beat = perf_counter()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="StallWatchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching."""
+        log.info("Stopping %s", self)
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def heartbeat(self) -> None:
+        """Mark the end of a frame, logging the duration of any stall just ended."""
+        with self._lock:
+            now = perf_counter()
+            if self._stalled:
+                self._stalled = False
+                log.warning("Frame stall ended after %.3f s", now - self._last_beat)
+            self._last_beat = now
+
+    def idle(self, seconds: float) -> None:
+        """
+        Mark the start of a wait for the next change, so it is not taken for a stall.
+
+        Parameters
+        ----------
+        seconds
+            Longest time the wait can take.
+        """
+        with self._lock:
+            self._last_beat = max(self._last_beat, perf_counter() + seconds)
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.threshold / 4):
+            with self._lock:
+                if self._stalled or perf_counter() - self._last_beat <= self.threshold:
+                    continue
+                self._stalled = True
+                self.stalls += 1
+            self._log_stall()
+
+    def _log_stall(self) -> None:
+        ident = self._thread_id
+        frame = sys._current_frames().get(ident) if ident is not None else None
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        log.warning(
+            "Frame stalled for over %.3f s in stage %s, main thread stack:\n%s",
+            self.threshold,
+            self._stats.current_stage,
+            stack,
+        )
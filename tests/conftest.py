@@ -106,3 +106,42 @@ def example_settings_manager(
     settings_manager = SettingsManager("")
 
     return settings_manager
+
+
+@pytest.fixture
+def example_settings_file(tmp_path) -> str:
+    """Provide path to an example TOML settings file, with an image to load."""
+    image_path = tmp_path / "pic.bmp"
+    pg.image.save(pg.Surface((20, 10)), image_path)
+    settings_path = tmp_path / "inputs.toml"
+    settings_path.write_text(
+        f"""\
+colors = [[255, 0, 0], [0, 255, 0], [0, 0, 255]]
+
+[messages]
+messages = ["TEST MESSAGE 1!", "TEST MESSAGE 2!"]
+separator = "    "
+typeface = "freeserif"
+sizes = [40, 40]
+bold = true
+italic = false
+anti-aliasing = false
+scroll_speed = 240
+outline_width = 3
+outline_copies = 4
+outline_colors = [[0, 0, 0], [255, 255, 255]]
+start_middle = true
+
+[images]
+sources = [["{image_path.as_posix()}", -1]]
+number = 3
+reposition_attempts = 10
+
+[timings]
+fps = 30
+image_change_time = 2
+color_change_time = 5
+"""
+    )
+
+    return str(settings_path)
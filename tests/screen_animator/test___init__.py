@@ -1,7 +1,7 @@
 import pytest
 import pygame as pg
 
-from screen_animator import _set_display_size
+from screen_animator import _set_display_size, _create_renderer
 
 
 class TestSetDisplaySize:
@@ -22,3 +22,38 @@ class TestSetDisplaySize:
     def test_set_display_size_none_input(self) -> None:
         """Display size when `None` input."""
         assert _set_display_size(None).size in pg.display.get_desktop_sizes()
+
+    @pytest.mark.parametrize(
+        "display_size, render_scale, output",
+        [((800, 400), 0.5, (400, 200)), ((800, 400), 0.25, (200, 100))],
+    )
+    def test_set_display_size_render_scale(
+        self,
+        display_size: tuple[int, int],
+        render_scale: float,
+        output: tuple[int, int],
+    ) -> None:
+        """Display size reduced by render scale."""
+        assert _set_display_size(display_size, render_scale).size == output
+
+    def test_set_display_size_render_scale_none_input(self) -> None:
+        """Display size reduced by render scale when `None` input."""
+        width, height = pg.display.get_desktop_sizes()[0]
+
+        assert _set_display_size(None, 0.5).size == (
+            round(width / 2),
+            round(height / 2),
+        )
+
+
+class TestCreateRenderer:
+    @pytest.mark.parametrize(
+        "render_scale, output", [(1.0, (800, 400)), (0.5, (400, 200))]
+    )
+    def test_create_renderer_viewport(
+        self, render_scale: float, output: tuple[int, int]
+    ) -> None:
+        """Renderer viewport matches display size reduced by render scale."""
+        renderer = _create_renderer((800, 400), render_scale)
+
+        assert renderer.get_viewport().size == output
@@ -0,0 +1,111 @@
+import pytest
+
+from screen_animator.benchmark import (
+    SCENARIO_AXES,
+    BenchmarkRunner,
+    Scenario,
+    build_scenarios,
+    check_allocations,
+    compare,
+)
+
+
+@pytest.fixture
+def example_results() -> dict:
+    """Provide example benchmark results for a single scenario."""
+    return {
+        "scenarios": {
+            "base": {"startup_s": 1.0, "frame_ms": {"p50": 10.0, "p95": 20.0}}
+        }
+    }
+
+
+class TestBuildScenarios:
+    def test_one_at_a_time_number(self) -> None:
+        """Base scenario, plus one scenario for every other option."""
+        scenarios = build_scenarios()
+
+        assert len(scenarios) == 1 + sum(
+            len(options) - 1 for options in SCENARIO_AXES.values()
+        )
+
+    def test_full_number(self) -> None:
+        """One scenario for every combination of options."""
+        expected = 1
+        for options in SCENARIO_AXES.values():
+            expected *= len(options)
+
+        assert len(build_scenarios(True)) == expected
+
+    def test_names_unique(self) -> None:
+        """Scenarios can be identified by name."""
+        names = [scenario.name for scenario in build_scenarios(True)]
+
+        assert len(set(names)) == len(names)
+
+    def test_varies_one_option(self) -> None:
+        """Scenarios differ from the base in the named option only."""
+        scenarios = {scenario.name: scenario for scenario in build_scenarios()}
+
+        assert scenarios["base"].settings["messages"]["outline_copies"] == 12
+        assert scenarios["outline_360"].settings["messages"]["outline_copies"] == 360
+        assert (
+            scenarios["outline_360"].settings["images"]
+            == scenarios["base"].settings["images"]
+        )
+        assert scenarios["rotated"].rotated and not scenarios["base"].rotated
+
+
+class TestBenchmarkRunner:
+    def test_run(self, example_settings_file: str) -> None:
+        """Startup and frame times measured for each scenario."""
+        results = BenchmarkRunner([example_settings_file], 5, 2, (200, 100)).run(
+            [Scenario("small", {"messages": {"outline_copies": 0}})]
+        )
+        result = results["scenarios"]["small"]
+
+        assert result["startup_s"] > 0
+        assert result["frame_ms"]["count"] == 5
+        assert "view.blit" in result["stages"]
+        assert "allocated_bytes" not in result
+
+
+class TestCompare:
+    def test_no_regression(self, example_results: dict) -> None:
+        """Results within the threshold are not regressions."""
+        results = {
+            "scenarios": {
+                "base": {"startup_s": 1.05, "frame_ms": {"p50": 10.5, "p95": 20.0}}
+            }
+        }
+
+        assert compare(results, example_results) == []
+
+    def test_regression(self, example_results: dict) -> None:
+        """Results beyond the threshold are regressions."""
+        results = {
+            "scenarios": {
+                "base": {"startup_s": 1.0, "frame_ms": {"p50": 10.0, "p95": 25.0}}
+            }
+        }
+
+        assert len(compare(results, example_results)) == 1
+
+    def test_new_scenario_ignored(self, example_results: dict) -> None:
+        """Scenarios missing from the baseline are not compared."""
+        results = {
+            "scenarios": {
+                "new": {"startup_s": 9.0, "frame_ms": {"p50": 90.0, "p95": 90.0}}
+            }
+        }
+
+        assert compare(results, example_results) == []
+
+
+class TestCheckAllocations:
+    @pytest.mark.parametrize("p95, output", [(1000.0, 0), (5000.0, 1)])
+    def test_check_allocations(self, p95: float, output: int) -> None:
+        """Scenarios allocating more than the bound per frame are reported."""
+        results = {"scenarios": {"base": {"allocated_bytes": {"p95": p95}}}}
+
+        assert len(check_allocations(results, 4096)) == output
@@ -0,0 +1,96 @@
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from screen_animator.calibration import Calibrator
+
+
+@pytest.fixture
+def example_unreachable_fps_file(tmp_path: Path) -> str:
+    """Provide path to a settings layer with an FPS target no device can hold."""
+    settings_path = tmp_path / "fast.toml"
+    settings_path.write_text("[timings]\nfps = 1000000\n")
+
+    return str(settings_path)
+
+
+class TestCalibrator:
+    def test_quality_steps(self) -> None:
+        """Outline copies halved, then anti-aliasing turned off, then sizes reduced."""
+        steps = Calibrator._quality_steps(
+            {
+                "outline_copies": 4,
+                "outline_width": 3,
+                "anti-aliasing": True,
+                "sizes": (40, 60),
+            }
+        )
+
+        assert [description for description, _ in steps] == [
+            "as configured",
+            "outline copies 2",
+            "outline copies 1",
+            "outline copies 0",
+            "anti-aliasing off",
+            "sizes [30, 45]",
+            "sizes [20, 30]",
+        ]
+        assert steps[-1][1] == {
+            "messages": {
+                "outline_copies": 0,
+                "anti-aliasing": False,
+                "sizes": [20, 30],
+            }
+        }
+
+    def test_quality_steps_no_outline(self) -> None:
+        """Outline copies not stepped if no outline drawn."""
+        steps = Calibrator._quality_steps(
+            {
+                "outline_copies": 4,
+                "outline_width": 0,
+                "anti-aliasing": False,
+                "sizes": (40, 40),
+            }
+        )
+
+        assert len(steps) == 3
+
+    def test_calibrate_target_held(self, example_settings_file: str) -> None:
+        """Settings unchanged if target FPS held as configured."""
+        calibrator = Calibrator([example_settings_file], (200, 100), 3)
+        calibrated = calibrator.calibrate()
+
+        assert len(calibrator.steps) == 1
+        assert calibrated == {
+            "messages": {
+                "outline_copies": 4,
+                "anti-aliasing": False,
+                "sizes": [40, 40],
+            },
+            "timings": {"fps": 30},
+        }
+
+    def test_calibrate_target_lowered(
+        self, example_settings_file: str, example_unreachable_fps_file: str
+    ) -> None:
+        """Lowest quality used, with target FPS lowered, if target not held."""
+        calibrator = Calibrator(
+            [example_settings_file, example_unreachable_fps_file], (200, 100), 3
+        )
+        calibrated = calibrator.calibrate()
+
+        assert len(calibrator.steps) == 6
+        assert calibrated["messages"]["sizes"] == [20, 20]
+        assert 1 <= calibrated["timings"]["fps"] < 1000000
+
+    def test_write(self, tmp_path: Path, example_settings_file: str) -> None:
+        """Calibrated settings written as a TOML layer."""
+        settings_path = tmp_path / "calibration.toml"
+        calibrated = Calibrator([example_settings_file], (200, 100), 3).write(
+            settings_path
+        )
+
+        with settings_path.open("rb") as settings_file:
+            assert tomllib.load(settings_file) == calibrated
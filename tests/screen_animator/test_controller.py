@@ -1,7 +1,19 @@
+import time
+import tracemalloc
+from types import SimpleNamespace
+
 import pytest
+import pygame as pg
 
-from screen_animator.controller import EventManager
+from screen_animator import ITEM_GROUP_TYPES
+from screen_animator.benchmark import MAX_FRAME_ALLOCATION
+from screen_animator.controller import MAX_STEPS_PER_FRAME, Controller, EventManager
+from screen_animator.headless import HeadlessRenderer
+from screen_animator.instrumentation import FrameStats
+from screen_animator.item_groups import FpsCounterItemGroup
 from screen_animator.listener import Listener
+from screen_animator.settings import SettingsState, TimingSettings
+from screen_animator.timing import Clock
 
 
 @pytest.fixture
@@ -83,3 +95,230 @@ class TestEventManager:
                 (key,) not in event_manager._listeners,
             ]
         )
+
+
+class ListClock(Clock):
+    """Clock where each tick takes the next time from a list."""
+
+    def __init__(self, elapsed: list[int]) -> None:
+        self._elapsed = iter(elapsed)
+
+    def tick(self, fps: float = 0) -> int:
+        return next(self._elapsed) if fps else 0
+
+    def get_fps(self) -> float:
+        return 0.0
+
+    def get_ticks(self) -> int:
+        return 0
+
+
+class CountingModel:
+    """Model counting updates."""
+
+    def __init__(self, next_deadline: int | None = None, moving: bool = False) -> None:
+        self.updates = 0
+        self.next_deadline = next_deadline
+        self.moving = moving
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+class RecordingView:
+    """View recording updates to the model drawn, and interpolation fractions."""
+
+    def __init__(self, model: CountingModel, drawn: bool = True) -> None:
+        self._model = model
+        self._drawn = drawn
+        self.frames: list[tuple[int, float]] = []
+
+    def update(self, alpha: float = 1.0) -> bool:
+        self.frames.append((self._model.updates, alpha))
+
+        return self._drawn
+
+
+class RecordingCollector:
+    """Collector recording the work time of each frame."""
+
+    def __init__(self) -> None:
+        self.work_times: list[float] = []
+
+    def collect(self, work_time: float) -> None:
+        self.work_times.append(work_time)
+
+
+class TestController:
+    @pytest.fixture
+    def example_settings(self) -> SimpleNamespace:
+        """Provide stand-in settings manager with a target of 50 FPS, i.e. 20 ms frames."""
+        return SimpleNamespace(
+            config=SimpleNamespace(timings=TimingSettings(50, 2, 15)),
+            state=SettingsState(),
+        )
+
+    def run(
+        self,
+        settings: SimpleNamespace,
+        elapsed: list[int],
+        model: CountingModel | None = None,
+        drawn: bool = True,
+        idle: bool = False,
+        collector: RecordingCollector | None = None,
+    ) -> list[tuple[int, float]]:
+        """Run controller for as many frames as times elapsed, returning frames drawn."""
+        model = model or CountingModel()
+        view = RecordingView(model, drawn)
+        controller = Controller(
+            settings,
+            model,
+            view,
+            ListClock(elapsed),
+            idle=idle,
+            collector=collector,
+        )
+
+        class QuitAfterFrames:
+            frames = 0
+
+            def manage_events(self) -> None:
+                self.frames += 1
+                if self.frames == len(elapsed):
+                    controller.quit()
+
+        controller.run(QuitAfterFrames())
+
+        return view.frames
+
+    def test_one_step_per_frame(self, example_settings: SimpleNamespace) -> None:
+        """Model updated once per frame when drawing keeps up."""
+        frames = self.run(example_settings, [20, 20, 20])
+
+        assert frames == [(1, 0), (2, 0), (3, 0)]
+
+    def test_catches_up(self, example_settings: SimpleNamespace) -> None:
+        """Model updated by all steps due when drawing falls behind."""
+        frames = self.run(example_settings, [20, 60, 20])
+
+        assert [updates for updates, _ in frames] == [1, 4, 5]
+
+    def test_interpolates(self, example_settings: SimpleNamespace) -> None:
+        """Fraction of a step left over passed to the view."""
+        frames = self.run(example_settings, [25, 10, 5])
+
+        assert frames == [
+            (1, pytest.approx(0.25)),
+            (1, pytest.approx(0.75)),
+            (2, pytest.approx(0)),
+        ]
+
+    def test_drops_time_when_far_behind(
+        self, example_settings: SimpleNamespace
+    ) -> None:
+        """Model updated no more than the maximum steps, dropping time beyond."""
+        frames = self.run(example_settings, [1000, 20])
+
+        assert frames == [
+            (MAX_STEPS_PER_FRAME, pytest.approx(0)),
+            (MAX_STEPS_PER_FRAME + 1, pytest.approx(0)),
+        ]
+
+    def test_no_target_fps(self, example_settings: SimpleNamespace) -> None:
+        """Model updated once per frame without a target FPS."""
+        example_settings.config.timings = TimingSettings(0, 2, 15)
+        frames = self.run(example_settings, [0, 0])
+
+        assert frames == [(1, 1.0), (2, 1.0)]
+
+    def test_idle_waits_until_deadline(self, example_settings: SimpleNamespace) -> None:
+        """Loop waits until the next deadline when nothing was drawn."""
+        pg.event.clear()
+        start = time.perf_counter()
+        self.run(example_settings, [20, 20], CountingModel(50), False, True)
+
+        assert time.perf_counter() - start >= 0.045
+
+    def test_idle_woken_by_event(self, example_settings: SimpleNamespace) -> None:
+        """Event ends the wait, and is left to be handled."""
+        pg.event.clear()
+        pg.event.post(pg.event.Event(pg.USEREVENT))
+        start = time.perf_counter()
+        self.run(example_settings, [20, 20], CountingModel(1000), False, True)
+
+        assert time.perf_counter() - start < 0.5
+        assert pg.event.get(pg.USEREVENT)
+
+    def test_no_idle_when_drawn(self, example_settings: SimpleNamespace) -> None:
+        """Loop does not wait when frames are drawn."""
+        start = time.perf_counter()
+        self.run(example_settings, [20, 20], CountingModel(1000), True, True)
+
+        assert time.perf_counter() - start < 0.5
+
+    def test_no_idle_when_moving(self, example_settings: SimpleNamespace) -> None:
+        """Loop does not wait while moving slower than a pixel a frame, interpolating."""
+        start = time.perf_counter()
+        frames = self.run(
+            example_settings, [5, 5, 5, 5, 5], CountingModel(1000, True), False, True
+        )
+
+        assert time.perf_counter() - start < 0.5
+        assert frames == [
+            (0, pytest.approx(0.25)),
+            (0, pytest.approx(0.5)),
+            (0, pytest.approx(0.75)),
+            (1, pytest.approx(0)),
+            (1, pytest.approx(0.25)),
+        ]
+
+    def test_collector_told_each_frame(self, example_settings: SimpleNamespace) -> None:
+        """Collector told how long each frame took to work on."""
+        collector = RecordingCollector()
+        self.run(example_settings, [20, 20, 20], collector=collector)
+
+        assert len(collector.work_times) == 3
+        assert all(0 <= work_time < 0.5 for work_time in collector.work_times)
+
+    @pytest.mark.parametrize("rotated", [False, True])
+    def test_steady_state_allocations(
+        self, rotated: bool, example_settings_file: str
+    ) -> None:
+        """Frames allocate almost nothing once the animation is running."""
+        stats = FrameStats(allocations=True)
+        renderer = HeadlessRenderer(
+            [example_settings_file],
+            (200, 100),
+            ITEM_GROUP_TYPES + [FpsCounterItemGroup],
+            rotated,
+            seed=0,
+            stats=stats,
+        )
+        settings_manager = renderer.settings_manager
+        controller = Controller(
+            settings_manager,
+            renderer.model,
+            renderer.view,
+            settings_manager.clock,
+            stats,
+        )
+        event_manager = EventManager([], [], stats)
+
+        class QuitAfterFrames:
+            frames = 0
+
+            def manage_events(self) -> None:
+                event_manager.manage_events()
+                self.frames += 1
+                if self.frames == 60:
+                    stats.reset()
+                elif self.frames == 180:
+                    controller.quit()
+
+        try:
+            controller.run(QuitAfterFrames())
+        finally:
+            tracemalloc.stop()
+        allocated = stats.summary()["stages"]["allocated_bytes"]
+
+        assert allocated["p95"] <= MAX_FRAME_ALLOCATION
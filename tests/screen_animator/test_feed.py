@@ -0,0 +1,161 @@
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from screen_animator.feed import MAX_LINE, MessageFeed, MessageQueue, send_messages
+from screen_animator.settings import SettingsManager
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 2) -> bool:
+    """Wait for a condition to hold, returning whether it did."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+
+    return True
+
+
+class TestMessageQueue:
+    def test_get_priority_order(self) -> None:
+        """Higher priority messages are taken first, in the order put otherwise."""
+        queue = MessageQueue()
+        for text, priority in [("A", 0), ("B", 1), ("C", 0), ("D", 1)]:
+            queue.put(text, priority)
+
+        assert [queue.get_nowait() for _ in range(4)] == ["B", "D", "A", "C"]
+        assert queue.get_nowait() is None
+
+    def test_put_full_waits(self) -> None:
+        """Message is not added while the queue is full."""
+        queue = MessageQueue(1)
+        queue.put("A")
+
+        assert not queue.put("B", timeout=0.01)
+        assert len(queue) == 1
+
+    def test_get_makes_space(self) -> None:
+        """Message waiting to be put is added once one is taken."""
+        queue = MessageQueue(1)
+        queue.put("A")
+        threading.Timer(0.01, queue.get_nowait).start()
+
+        assert queue.put("B", timeout=1)
+        assert queue.get_nowait() == "B"
+
+    def test_close_wakes_put(self) -> None:
+        """Closing returns from a waiting put, without adding the message."""
+        queue = MessageQueue(1)
+        queue.put("A")
+        threading.Timer(0.01, queue.close).start()
+
+        assert not queue.put("B")
+        assert len(queue) == 1
+
+
+class TestMessageFeed:
+    @pytest.fixture
+    def example_dir(self) -> Iterator[Path]:
+        """Provide a directory with a short path, as socket paths are limited."""
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    @pytest.fixture
+    def example_feed(
+        self, example_dir: Path, example_settings_manager: SettingsManager
+    ) -> Iterator[MessageFeed]:
+        """Provide started `MessageFeed` listening on a socket, holding two messages."""
+        feed = MessageFeed(example_settings_manager, example_dir / "feed.sock", 2, 0.05)
+        feed.start()
+        yield feed
+        feed.stop()
+
+    def test_socket_messages(self, example_feed: MessageFeed) -> None:
+        """Messages sent to the socket are queued, with the separator."""
+        send_messages(example_feed.path, ["Breaking"])
+        assert wait_until(lambda: len(example_feed.queue) == 1)
+        separator = example_feed._settings_manager.config.messages.separator
+
+        assert example_feed.get() == f"Breaking{separator}"
+
+    def test_socket_priority(self, example_feed: MessageFeed) -> None:
+        """Higher priority messages are taken first."""
+        send_messages(example_feed.path, ["Later"])
+        send_messages(example_feed.path, ["Sooner"], priority=1)
+        assert wait_until(lambda: len(example_feed.queue) == 2)
+
+        assert example_feed.get().startswith("Sooner")
+
+    @pytest.mark.parametrize(
+        "lines", [b"plain\n", b'{"text": "plain"}\n', b"plain", b"\n{bad\nplain\n"]
+    )
+    def test_socket_lines(self, lines: bytes, example_feed: MessageFeed) -> None:
+        """Plain text and JSON lines are messages, ignoring blank and invalid lines."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(example_feed.path))
+            client.sendall(lines)
+        assert wait_until(lambda: len(example_feed.queue) == 1)
+
+        assert example_feed.get().startswith("plain")
+        assert example_feed.get() is None
+
+    @pytest.mark.parametrize("length", [MAX_LINE + 1, 3 * MAX_LINE])
+    def test_socket_long_line(self, length: int, example_feed: MessageFeed) -> None:
+        """Line longer than the limit is dropped whole, up to the next newline."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(example_feed.path))
+            client.sendall(b"x" * length + b"y\nplain\n")
+        assert wait_until(lambda: len(example_feed.queue) == 1)
+        time.sleep(0.1)
+
+        assert example_feed.get().startswith("plain")
+        assert example_feed.get() is None
+
+    def test_backpressure(self, example_feed: MessageFeed) -> None:
+        """Reading stops while the queue is full, carrying on once messages are taken."""
+        sender = threading.Thread(
+            target=send_messages, args=(example_feed.path, ["A", "B", "C", "D"])
+        )
+        sender.start()
+        assert wait_until(lambda: len(example_feed.queue) == 2)
+        time.sleep(0.1)
+
+        assert len(example_feed.queue) == 2
+        texts = [example_feed.get()[0] for _ in range(2)]
+        assert wait_until(lambda: len(example_feed.queue) == 2)
+        texts += [example_feed.get()[0] for _ in range(2)]
+        sender.join(1)
+        assert texts == ["A", "B", "C", "D"]
+
+    def test_stop_removes_socket(self, example_feed: MessageFeed) -> None:
+        """Socket file is removed once stopped."""
+        example_feed.stop()
+
+        assert not example_feed.path.exists()
+
+    def test_fifo(
+        self, example_dir: Path, example_settings_manager: SettingsManager
+    ) -> None:
+        """Messages written to a named pipe are queued, from more than one writer."""
+        path = example_dir / "feed.fifo"
+        os.mkfifo(path)
+        feed = MessageFeed(example_settings_manager, path, interval=0.05)
+        feed.start()
+        try:
+            for text in ["One", "Two"]:
+                with open(path, "w") as fifo:
+                    fifo.write(f"{text}\n")
+            assert wait_until(lambda: len(feed.queue) == 2)
+        finally:
+            feed.stop()
+
+        assert path.exists()
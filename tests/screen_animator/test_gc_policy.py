@@ -0,0 +1,91 @@
+import gc
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+
+from screen_animator.gc_policy import FrameCollector
+from screen_animator.instrumentation import FrameStats
+from screen_animator.settings import TimingSettings
+
+
+@pytest.fixture
+def example_settings() -> SimpleNamespace:
+    """Provide stand-in settings manager with a target of 50 FPS, i.e. 20 ms frames."""
+    return SimpleNamespace(config=SimpleNamespace(timings=TimingSettings(50, 2, 15)))
+
+
+@pytest.fixture
+def example_stats() -> FrameStats:
+    """Provide empty `FrameStats`."""
+    return FrameStats()
+
+
+@pytest.fixture
+def example_collector(
+    example_settings: SimpleNamespace, example_stats: FrameStats
+) -> Iterator[FrameCollector]:
+    """Provide started `FrameCollector`, stopped afterwards."""
+    collector = FrameCollector(example_settings, example_stats)
+    collector.start()
+    yield collector
+    collector.stop()
+
+
+def make_garbage_due(multiple: float = 1) -> list[list]:
+    """Allocate enough objects for the youngest generation to be due."""
+    return [[] for _ in range(int(gc.get_threshold()[0] * multiple) + 100)]
+
+
+class TestFrameCollector:
+    def test_start_freezes(self, example_collector: FrameCollector) -> None:
+        """Objects loaded before starting are frozen, with automatic collection off."""
+        assert gc.get_freeze_count() > 0
+        assert not gc.isenabled()
+
+    def test_stop_restores(self, example_settings: SimpleNamespace) -> None:
+        """Automatic collection is turned back on, with objects unfrozen."""
+        collector = FrameCollector(example_settings)
+        collector.start()
+        collector.stop()
+
+        assert gc.get_freeze_count() == 0
+        assert gc.isenabled()
+
+    def test_collect_nothing_due(self, example_collector: FrameCollector) -> None:
+        """Nothing is collected before any generation is due."""
+        assert example_collector.collect(0.0) is None
+
+    def test_collect_time_to_spare(
+        self, example_collector: FrameCollector, example_stats: FrameStats
+    ) -> None:
+        """Generation due is collected when the frame finished early, and timed."""
+        garbage = make_garbage_due()
+        generation = example_collector.collect(0.001)
+        example_stats.end_frame()
+
+        assert generation == 0
+        assert gc.get_count()[0] < len(garbage)
+        assert "gc" in example_stats.summary()["stages"]
+
+    def test_collect_no_time_to_spare(self, example_collector: FrameCollector) -> None:
+        """Generation due is not collected when its last pause does not fit."""
+        example_collector.pauses[0] = 0.01
+        garbage = make_garbage_due()
+
+        assert example_collector.collect(0.015) is None
+        assert gc.get_count()[0] >= len(garbage)
+
+    def test_collect_overdue(self, example_settings: SimpleNamespace) -> None:
+        """Generation far past its threshold is collected without time to spare."""
+        collector = FrameCollector(example_settings, max_deferral=2)
+        collector.start()
+        try:
+            collector.pauses[0] = 1.0
+            garbage = make_garbage_due(2)
+            generation = collector.collect(0.02)
+        finally:
+            collector.stop()
+
+        assert generation == 0
+        assert len(garbage) > 0
@@ -0,0 +1,144 @@
+import pytest
+
+from screen_animator.governor import CountKnob, QualityGovernor, SwitchKnob
+from screen_animator.settings import SettingsManager
+
+
+def observe(governor: QualityGovernor, load: float, frames: int) -> None:
+    """Record frames at a given load, as a fraction of the frame time at 30 FPS."""
+    for _ in range(frames):
+        governor.observe(load / 30)
+
+
+class TestCountKnob:
+    @pytest.mark.parametrize(
+        "minimum, steps, expected", [(0, 1, 6), (0, 2, 3), (0, 5, 0), (4, 5, 4)]
+    )
+    def test_step_down(self, minimum: int, steps: int, expected: int) -> None:
+        """Count halved, no lower than minimum."""
+        settings_dict = {"count": 12}
+        knob = CountKnob("count", settings_dict, "count", minimum)
+        for _ in range(steps):
+            knob.step_down()
+
+        assert settings_dict["count"] == expected
+
+    def test_step_up(self) -> None:
+        """Count doubled back up, no higher than original value."""
+        settings_dict = {"count": 12}
+        knob = CountKnob("count", settings_dict, "count")
+        for _ in range(5):
+            knob.step_down()
+        changes = [knob.step_up() for _ in range(6)]
+
+        assert settings_dict["count"] == 12
+        assert changes == [True, True, True, True, True, False]
+
+
+class TestSwitchKnob:
+    @pytest.mark.parametrize("original", [True, False])
+    def test_step_down_up(self, original: bool) -> None:
+        """Switch turned off, then back to original value."""
+        settings_dict = {"switch": original}
+        knob = SwitchKnob("switch", settings_dict, "switch")
+        changed_down = knob.step_down()
+        value_down = settings_dict["switch"]
+        changed_up = knob.step_up()
+
+        assert not value_down
+        assert settings_dict["switch"] == original
+        assert changed_down == changed_up == original
+
+
+class TestQualityGovernor:
+    @pytest.fixture
+    def example_governor(
+        self, example_settings_manager: SettingsManager
+    ) -> QualityGovernor:
+        """Provide example `QualityGovernor` with anti-aliasing on."""
+        example_settings_manager.settings["messages"]["anti-aliasing"] = True
+        example_settings_manager.compile()
+
+        return QualityGovernor(example_settings_manager)
+
+    def test_knob_order(self, example_governor: QualityGovernor) -> None:
+        """Outline stepped down first, then anti-aliasing, then images."""
+        assert [knob.name for knob in example_governor.knobs] == [
+            "outline",
+            "aa",
+            "images",
+        ]
+
+    def test_anti_aliasing_fixed(
+        self, example_settings_manager: SettingsManager
+    ) -> None:
+        """Anti-aliasing not stepped down if not allowed in settings."""
+        example_settings_manager.settings["governor"] = {"anti_aliasing": False}
+        governor = QualityGovernor(example_settings_manager)
+
+        assert "aa" not in [knob.name for knob in governor.knobs]
+
+    def test_quality_reported(self, example_governor: QualityGovernor) -> None:
+        """Quality reported alongside actual FPS."""
+        assert (
+            example_governor._settings_manager.state.quality
+            == "outline 12, aa on, images 10"
+        )
+
+    def test_high_load_steps_down(
+        self, example_governor: QualityGovernor, example_settings_dict_with_tuples
+    ) -> None:
+        """Quality stepped down one step at a time when frames take too long."""
+        observe(example_governor, 1.5, 30)
+        settings = example_settings_dict_with_tuples
+        settings_manager = example_governor._settings_manager
+
+        assert settings["messages"]["outline_copies"] == 6
+        assert settings_manager.config.messages.outline_copies == 6
+        assert settings_manager.state.quality == "outline 6, aa on, images 10"
+
+    def test_settles_after_step(
+        self, example_governor: QualityGovernor, example_settings_dict_with_tuples
+    ) -> None:
+        """Quality not changed again until changes have settled."""
+        observe(example_governor, 1.5, 30 + 60 + 29)
+
+        assert example_settings_dict_with_tuples["messages"]["outline_copies"] == 6
+
+    def test_steps_down_in_order(
+        self, example_governor: QualityGovernor, example_settings_dict_with_tuples
+    ) -> None:
+        """Anti-aliasing turned off once outline copies at minimum."""
+        observe(example_governor, 1.5, 4 * 90 + 30)
+        messages_dict = example_settings_dict_with_tuples["messages"]
+
+        assert messages_dict["outline_copies"] == 0
+        assert not messages_dict["anti-aliasing"]
+        assert example_settings_dict_with_tuples["images"]["number"] == 10
+
+    def test_steps_up_in_reverse_order(
+        self, example_governor: QualityGovernor, example_settings_dict_with_tuples
+    ) -> None:
+        """Images restored first when load drops."""
+        observe(example_governor, 1.5, 6 * 90)
+        images_down = example_settings_dict_with_tuples["images"]["number"]
+        observe(example_governor, 0.1, 30)
+        settings = example_settings_dict_with_tuples
+
+        assert images_down == 5
+        assert settings["images"]["number"] == 10
+        assert not settings["messages"]["anti-aliasing"]
+
+    @pytest.mark.parametrize("load", [0.7, 0.9])
+    def test_steady_load_unchanged(
+        self,
+        load: float,
+        example_governor: QualityGovernor,
+    ) -> None:
+        """Quality unchanged while load within limits."""
+        observe(example_governor, load, 300)
+
+        assert (
+            example_governor._settings_manager.state.quality
+            == "outline 12, aa on, images 10"
+        )
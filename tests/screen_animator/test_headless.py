@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pygame as pg
+
+from screen_animator.headless import HeadlessRenderer
+from screen_animator.instrumentation import FrameStats
+
+
+class TestHeadlessRenderer:
+    @pytest.fixture
+    def example_headless_renderer(self, example_settings_file: str) -> HeadlessRenderer:
+        """Provide example `HeadlessRenderer` with small frames."""
+        return HeadlessRenderer([example_settings_file], (200, 100))
+
+    def test_init_dummy_driver(
+        self, example_headless_renderer: HeadlessRenderer
+    ) -> None:
+        """`pygame` uses the dummy video driver."""
+        assert pg.display.get_driver() == "dummy"
+
+    @pytest.mark.parametrize("frames, every, output", [(1, 1, 1), (5, 1, 5), (6, 2, 3)])
+    def test_capture_number(
+        self,
+        frames: int,
+        every: int,
+        output: int,
+        example_headless_renderer: HeadlessRenderer,
+    ) -> None:
+        """Correct number of frames captured."""
+        captured = example_headless_renderer.capture(frames, every)
+
+        assert len(captured) == output
+
+    def test_capture_shape(self, example_headless_renderer: HeadlessRenderer) -> None:
+        """Frames are captured as arrays of height, width and color."""
+        captured = example_headless_renderer.capture(1)
+
+        assert captured[0].shape == (100, 200, 3)
+
+    def test_capture_scrolls(self, example_headless_renderer: HeadlessRenderer) -> None:
+        """Consecutive frames differ as the message scrolls."""
+        captured = example_headless_renderer.capture(10, 5)
+
+        assert not np.array_equal(captured[0], captured[1])
+
+    def test_save(
+        self, tmp_path: Path, example_headless_renderer: HeadlessRenderer
+    ) -> None:
+        """Frames are saved as images."""
+        paths = example_headless_renderer.save(4, tmp_path / "frames", 2)
+
+        assert [pg.image.load(path).get_size() for path in paths] == [(200, 100)] * 2
+
+    def test_capture_seed_repeatable(self, example_settings_file: str) -> None:
+        """Frames are identical when rendered with the same seed."""
+        captures = [
+            HeadlessRenderer([example_settings_file], (200, 100), seed=7).capture(
+                100, 25
+            )
+            for _ in range(2)
+        ]
+
+        assert all(
+            np.array_equal(frame_1, frame_2) for frame_1, frame_2 in zip(*captures)
+        )
+
+    def test_step_stats(self, example_settings_file: str) -> None:
+        """Time is recorded for each stage of each frame, but not timed groups not due."""
+        stats = FrameStats()
+        renderer = HeadlessRenderer([example_settings_file], (200, 100), stats=stats)
+        renderer.step(3)
+
+        assert {
+            "model.LeftScrollingTextItemGroup",
+            "view.fill",
+            "view.blit",
+            "view.flip",
+            "frame",
+        } <= set(stats.summary()["stages"])
+        assert "model.RandomImagesItemGroup" not in stats.summary()["stages"]
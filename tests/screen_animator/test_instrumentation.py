@@ -0,0 +1,142 @@
+import json
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from screen_animator import instrumentation
+from screen_animator.instrumentation import FrameStats, NullFrameStats
+
+
+@pytest.fixture
+def patch_perf_counter(monkeypatch) -> Iterator[float]:
+    """Patch timer so each reading is 1.5 milliseconds after the previous."""
+    times = (count * 0.0015 for count in range(1_000_000))
+    monkeypatch.setattr(instrumentation, "perf_counter", lambda: next(times))
+
+
+class TestFrameStats:
+    def test_end_frame_stage_time(self, patch_perf_counter) -> None:
+        """Time is recorded for a stage."""
+        stats = FrameStats()
+        stats.begin("stage")
+        stats.end()
+        stats.end_frame()
+
+        assert stats.summary()["stages"]["stage"]["max"] == pytest.approx(1.5)
+
+    def test_end_frame_nested_stage_time(self, patch_perf_counter) -> None:
+        """Time in nested stages is not counted against the outer stage."""
+        stats = FrameStats()
+        stats.begin("outer")
+        stats.begin("inner")
+        stats.end()
+        stats.end()
+        stats.end_frame()
+        stages = stats.summary()["stages"]
+
+        assert (stages["outer"]["max"], stages["inner"]["max"]) == pytest.approx(
+            (3, 1.5)
+        )
+
+    def test_end_frame_repeated_stage_time(self, patch_perf_counter) -> None:
+        """Time for a stage run more than once in a frame is added together."""
+        stats = FrameStats()
+        for _ in range(3):
+            stats.begin("stage")
+            stats.end()
+        stats.end_frame()
+
+        assert stats.summary()["stages"]["stage"]["max"] == pytest.approx(4.5)
+
+    def test_current_stage(self) -> None:
+        """Current stage is the innermost stage running."""
+        stats = FrameStats()
+        stats.begin("outer")
+        stats.begin("inner")
+        current_stages = [stats.current_stage]
+        stats.end()
+        current_stages.append(stats.current_stage)
+        stats.end()
+        current_stages.append(stats.current_stage)
+
+        assert current_stages == ["inner", "outer", None]
+
+    def test_count(self) -> None:
+        """Counts are added together for a frame and not converted."""
+        stats = FrameStats()
+        stats.count("items", 3)
+        stats.count("items", 2)
+        stats.end_frame()
+        summary = stats.summary()["stages"]["items"]
+
+        assert (summary["max"], summary["unit"]) == (5, "count")
+
+    @pytest.mark.parametrize("frames, output", [(5, 5), (10, 10), (25, 10)])
+    def test_summary_ring_buffer(self, frames: int, output: int) -> None:
+        """Only the most recent frames are stored."""
+        stats = FrameStats(10)
+        for _ in range(frames):
+            stats.end_frame()
+
+        assert stats.summary()["stages"]["frame"]["count"] == output
+
+    def test_summary_percentiles(self) -> None:
+        """Percentiles are calculated from stored values."""
+        stats = FrameStats()
+        for value in range(1, 101):
+            stats.count("value", value)
+            stats.end_frame()
+        summary = stats.summary()["stages"]["value"]
+
+        assert (summary["p50"], summary["p95"], summary["p99"]) == pytest.approx(
+            (50.5, 95.05, 99.01)
+        )
+
+    def test_summary_histogram(self, patch_perf_counter) -> None:
+        """Histogram counts values in each bin."""
+        stats = FrameStats()
+        for _ in range(4):
+            stats.begin("stage")
+            stats.end()
+            stats.end_frame()
+        histogram = stats.summary()["stages"]["stage"]["histogram"]
+
+        assert (sum(histogram), max(histogram)) == (4, 4)
+
+    def test_allocations(self) -> None:
+        """Memory allocated during a frame is counted, even if freed."""
+        stats = FrameStats(allocations=True)
+        try:
+            stats.end_frame()
+            data = bytearray(100_000)
+            del data
+            stats.end_frame()
+        finally:
+            tracemalloc.stop()
+        summary = stats.summary()["stages"]["allocated_bytes"]
+
+        assert summary["count"] == 2
+        assert summary["max"] >= 100_000
+
+    def test_dump(self, tmp_path: Path) -> None:
+        """Summary is written to JSON file."""
+        stats = FrameStats()
+        stats.end_frame()
+        path = tmp_path / "stats.json"
+        stats.dump(path)
+
+        assert json.loads(path.read_text())["frames"] == 1
+
+
+class TestNullFrameStats:
+    def test_end_frame_nothing_recorded(self) -> None:
+        """Nothing is recorded."""
+        stats = NullFrameStats()
+        stats.begin("stage")
+        stats.count("items")
+        stats.end()
+        stats.end_frame()
+
+        assert stats.summary()["stages"] == {}
@@ -1,16 +1,19 @@
 import math
-import time
+from typing import Any
 
 import pytest
 import pygame as pg
 
+from screen_animator.feed import MessageFeed
 from screen_animator.settings import SettingsManager
 from screen_animator.item_groups import (
-    TimedItemGroup,
+    ItemArray,
     LeftScrollingTextItemGroup,
     RandomImagesItemGroup,
     ColorChangeItemGroup,
+    collides_any,
 )
+from screen_animator.items import CompactItem
 
 
 @pytest.fixture
@@ -22,7 +25,7 @@ def example_settings_manager(
 ) -> SettingsManager:
     """Provide example `SettingsManager`."""
     settings_manager = example_settings_manager
-    settings_manager.settings["images"]["images"] = [
+    settings_manager.state.images = [
         example_content
         for _ in range(len(example_settings_dict_with_tuples["images"]["sources"]))
     ]
@@ -30,6 +33,82 @@ def example_settings_manager(
     return settings_manager
 
 
+def change_setting(
+    settings_manager: SettingsManager, table: str, key: str, value: Any
+) -> None:
+    """Change a setting in place, compiling the settings again."""
+    settings_manager.settings[table][key] = value
+    settings_manager.compile()
+
+
+class TestItemArray:
+    @pytest.fixture
+    def example_item_array(
+        self, example_content: pg.Surface, example_perimeter: pg.Rect
+    ) -> ItemArray:
+        """Provide example `ItemArray` with three items."""
+        item_array = ItemArray()
+        for x in range(3):
+            item = CompactItem(item_array, example_content, example_perimeter)
+            item.rect.x = 10 * x
+
+        return item_array
+
+    def test_positions(self, example_item_array: ItemArray) -> None:
+        """Positions gathered from each item, in order."""
+        positions = example_item_array.positions
+
+        assert positions["x"].tolist() == [0, 10, 20]
+        assert positions["width"].tolist() == [20, 20, 20]
+
+    def test_remove_keeps_order(self, example_item_array: ItemArray) -> None:
+        """Removing items keeps the order of the others, and their positions."""
+        item_array = example_item_array
+        first, second, third = item_array.sprites()
+        item_array.remove(second)
+
+        assert list(item_array) == [first, third]
+        assert item_array.positions["x"].tolist() == [0, 20]
+        assert second not in item_array
+
+    def test_add_from_other_group(self, example_item_array: ItemArray) -> None:
+        """Item added to another group is taken from its group."""
+        item = example_item_array.sprites()[0]
+        other = ItemArray()
+        other.add(item)
+
+        assert item.group is other
+        assert len(example_item_array) == 2
+
+    def test_empty(self, example_item_array: ItemArray) -> None:
+        """All items removed."""
+        item_array = example_item_array
+        items = item_array.sprites()
+        item_array.empty()
+
+        assert len(item_array) == 0
+        assert not any(item.alive() for item in items)
+
+
+class TestCollidesAny:
+    @pytest.mark.parametrize(
+        "rect, output",
+        [
+            (pg.Rect(15, 5, 10, 10), True),
+            (pg.Rect(20, 0, 10, 10), False),
+            (pg.Rect(0, 10, 10, 10), False),
+            (pg.Rect(5, 5, 0, 10), False),
+        ],
+    )
+    def test_collides_any(self, rect: pg.Rect, output: bool) -> None:
+        """Overlap found as `pg.Rect.colliderect` would."""
+        item_array = ItemArray()
+        CompactItem(item_array, pg.Surface((20, 10)), pg.Rect(0, 0, 100, 50))
+
+        assert collides_any(rect, item_array.positions) is output
+        assert item_array.sprites()[0].rect.colliderect(rect) is output
+
+
 class TestLeftScrollingTextItemGroup:
     @pytest.fixture
     def example_left_scrolling_text_item_group(
@@ -46,7 +125,7 @@ class TestLeftScrollingTextItemGroup:
     ) -> None:
         """No outlines are created."""
         item_group = example_left_scrolling_text_item_group
-        item_group._settings["messages"]["outline_width"] = 0
+        change_setting(item_group._settings_manager, "messages", "outline_width", 0)
 
         for _ in range(num_of_items):
             item_group.create()
@@ -96,12 +175,78 @@ class TestLeftScrollingTextItemGroup:
         example_settings_dict_with_tuples: dict,
     ) -> None:
         """`Item` placed in correct starting y-position, dependent on settings."""
-        example_settings_dict_with_tuples["messages"]["start_middle"] = True
         item_group = example_left_scrolling_text_item_group
+        change_setting(item_group._settings_manager, "messages", "start_middle", True)
         item_group.create()
 
         assert item_group.sprites()[-1].rect.centery == example_perimeter.centery
 
+    @pytest.fixture
+    def example_feed(
+        self, tmp_path, example_settings_manager: SettingsManager
+    ) -> MessageFeed:
+        """Provide `MessageFeed`, not started, with three messages waiting."""
+        feed = MessageFeed(example_settings_manager, tmp_path / "feed.sock")
+        for text in ["FEED 1", "FEED 2", "FEED 3"]:
+            feed.queue.put(text)
+
+        return feed
+
+    def test_update_prerenders_feed(
+        self,
+        example_feed: MessageFeed,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """One feed message is rendered each update, until enough are rendered."""
+        item_group = LeftScrollingTextItemGroup(
+            example_settings_manager, example_perimeter, example_feed
+        )
+        item_group.update()
+        rendered = len(item_group._prerendered)
+        item_group.update()
+        item_group.update()
+
+        assert rendered == 1
+        assert len(item_group._prerendered) == 2
+        assert len(example_feed.queue) == 1
+
+    def test_create_from_feed(
+        self,
+        example_feed: MessageFeed,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Feed message rendered is shown next, without rendering it again."""
+        item_group = LeftScrollingTextItemGroup(
+            example_settings_manager, example_perimeter, example_feed
+        )
+        item_group.update()
+        rendered = item_group._prerendered[0]
+        item_group.create()
+
+        assert item_group._messages[-1].content is rendered.content
+        assert item_group._messages[-1].message_text == "FEED 1"
+
+    def test_create_from_feed_colors_changed(
+        self,
+        example_feed: MessageFeed,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Feed message is rendered again if colors changed since it was rendered."""
+        item_group = LeftScrollingTextItemGroup(
+            example_settings_manager, example_perimeter, example_feed
+        )
+        item_group.update()
+        rendered = item_group._prerendered[0]
+        example_settings_manager.state.color = (1, 2, 3)
+        item_group.create()
+        message = item_group._messages[-1]
+
+        assert message.content is not rendered.content
+        assert message.render_key == item_group._render_key(message.font)
+
     @pytest.mark.parametrize("repeat", range(5))
     def test_create_position_y_not_start_middle(
         self,
@@ -111,8 +256,8 @@ class TestLeftScrollingTextItemGroup:
         example_settings_dict_with_tuples: dict,
     ) -> None:
         """`Item` placed in correct starting y-position, dependent on settings."""
-        example_settings_dict_with_tuples["messages"]["start_middle"] = False
         item_group = example_left_scrolling_text_item_group
+        change_setting(item_group._settings_manager, "messages", "start_middle", False)
         items = []
         for _ in range(5):
             item_group.create()
@@ -132,7 +277,7 @@ class TestLeftScrollingTextItemGroup:
     ) -> None:
         """New `Item` is created once previous has fully emerged."""
         item_group = example_left_scrolling_text_item_group
-        item_group._settings["messages"]["outline_width"] = 0
+        change_setting(item_group._settings_manager, "messages", "outline_width", 0)
         item_group.create()
         item = item_group.sprites()[0]
         width = item.rect.width
@@ -161,6 +306,103 @@ class TestLeftScrollingTextItemGroup:
 
         assert len(item_group.sprites()) == 0
 
+    def test_update_distance_rebased(
+        self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
+    ) -> None:
+        """Distance scrolled is kept small, so messages near the `pg.Rect` limit
+        still scroll in, rather than being replaced every update."""
+        item_group = example_left_scrolling_text_item_group
+        movement = item_group._scrolling_movement
+        movement.distance = 2**31 - 100
+        render_xs = []
+        for _ in range(5):
+            item_group.update()
+            render_xs.append(item_group._messages[0].render_rect().x)
+
+        assert len(item_group._messages) == 1
+        assert render_xs == sorted(render_xs, reverse=True)
+        assert render_xs[0] > render_xs[-1]
+        assert movement.distance < item_group._perimeter.width
+
+    def test_rebase_drawn_in_place(
+        self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
+    ) -> None:
+        """Messages and outlines are drawn in place once the distance is rebased."""
+        item_group = example_left_scrolling_text_item_group
+        item_group.create()
+        movement = item_group._scrolling_movement
+        movement.speed = 7.5
+        for _ in range(9):
+            movement.advance()
+        render_rects = [item.render_rect() for item in item_group]
+        extent = item_group._messages[0].extent.move(round(movement.offset()[0]), 0)
+        item_group._rebase()
+
+        assert movement.distance < 2
+        assert [item.render_rect() for item in item_group] == render_rects
+        assert (
+            item_group._messages[0].extent.move(round(movement.offset()[0]), 0)
+            == extent
+        )
+
+    def test_update_items_not_moved(
+        self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
+    ) -> None:
+        """Group scrolls as a whole, with item positions unchanged."""
+        item_group = example_left_scrolling_text_item_group
+        item_group.create()
+        item = item_group.sprites()[-1]
+        x = item.rect.x
+        item._movement.speed = 10
+        item_group.update()
+        item_group.update()
+
+        assert item.rect.x == x
+        assert item.render_rect().x == x - 20
+
+    def test_update_message_rendered_once(
+        self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
+    ) -> None:
+        """Message only rendered again when its color changes."""
+        item_group = example_left_scrolling_text_item_group
+        change_setting(item_group._settings_manager, "messages", "outline_width", 0)
+        item_group.create()
+        item = item_group.sprites()[0]
+        content = item.content
+        item_group.update()
+        unchanged = item.content is content
+        item_group._settings_manager.state.color = (1, 2, 3)
+        item_group.update()
+
+        assert unchanged
+        assert item.content is not content
+
+    def test_apply_settings_messages_changed(
+        self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
+    ) -> None:
+        """Messages on screen are replaced with one new message."""
+        item_group = example_left_scrolling_text_item_group
+        item_group.create()
+        item_group.create()
+        messages = item_group._messages.copy()
+        item_group.apply_settings({"messages.messages"})
+
+        assert len(item_group._messages) == 1
+        assert item_group._messages[0] not in messages
+
+    def test_apply_settings_speed_changed(
+        self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
+    ) -> None:
+        """Speed follows the scroll speed, without replacing messages."""
+        item_group = example_left_scrolling_text_item_group
+        item_group.create()
+        messages = item_group._messages.copy()
+        change_setting(item_group._settings_manager, "messages", "scroll_speed", 60)
+        item_group.apply_settings({"messages.scroll_speed"})
+
+        assert item_group.speed == 2
+        assert item_group._messages == messages
+
     def test_generate_message(
         self, example_left_scrolling_text_item_group: LeftScrollingTextItemGroup
     ) -> None:
@@ -168,7 +410,7 @@ class TestLeftScrollingTextItemGroup:
         assert isinstance(
             example_left_scrolling_text_item_group._generate_message(
                 "Test",
-                example_left_scrolling_text_item_group._settings["messages"]["font"],
+                example_left_scrolling_text_item_group._settings_manager.state.font,
             ),
             pg.Surface,
         )
@@ -181,7 +423,10 @@ class TestLeftScrollingTextItemGroup:
     ) -> None:
         """Outlines are created for `Item`."""
         item_group = example_left_scrolling_text_item_group
-        item_group._set_outline("Test", example_perimeter.midright)
+        outline_text = item_group._generate_message(
+            "Test", item_group._settings_manager.state.font
+        )
+        item_group._set_outline(outline_text, example_perimeter.midright)
 
         assert (
             len(item_group.sprites())
@@ -226,41 +471,77 @@ class TestRandomImagesItemGroup:
             [item_group._perimeter.contains(image) for image in item_group.sprites()]
         )
 
+    @pytest.mark.parametrize("number", [0, 3, 20])
+    def test_update_number_changed(
+        self,
+        number: int,
+        example_random_images_item_group: RandomImagesItemGroup,
+        example_settings_manager: SettingsManager,
+    ) -> None:
+        """Images created again if number of images changed."""
+        item_group = example_random_images_item_group
+        item_group.create()
+        change_setting(example_settings_manager, "images", "number", number)
+        item_group.update()
+
+        assert len(item_group.sprites()) == number * len(
+            example_settings_manager.state.images
+        )
+
+    def test_apply_settings_images_changed(
+        self,
+        example_random_images_item_group: RandomImagesItemGroup,
+        example_settings_manager: SettingsManager,
+    ) -> None:
+        """Images are created again when image settings change."""
+        item_group = example_random_images_item_group
+        item_group.create()
+        images = example_settings_manager.state.images = [pg.Surface((20, 10))]
+        item_group.apply_settings({"images.sources"})
+
+        assert [image.content for image in item_group] == images * (
+            example_settings_manager.config.images.number
+        )
+
+    def test_apply_settings_time_diff(
+        self,
+        example_random_images_item_group: RandomImagesItemGroup,
+        example_settings_manager: SettingsManager,
+    ) -> None:
+        """Time difference follows the image change time."""
+        item_group = example_random_images_item_group
+        change_setting(example_settings_manager, "timings", "image_change_time", 7)
+        item_group.apply_settings({"timings.image_change_time"})
+
+        assert item_group.time_diff == 7
+
 
 class TestColorChangeItemGroup:
     @pytest.fixture
     def example_color_change_item_group(
         self, example_settings_manager: SettingsManager, example_perimeter: pg.Rect
-    ) -> TimedItemGroup:
+    ) -> ColorChangeItemGroup:
         """Provide example `ColorChangeGroup`."""
-        return TimedItemGroup(
-            example_settings_manager, example_perimeter, ColorChangeItemGroup
-        )
+        return ColorChangeItemGroup(example_settings_manager, example_perimeter)
 
-    def test_create(self, example_color_change_item_group: TimedItemGroup) -> None:
-        """Time is saved."""
+    def test_create(
+        self, example_color_change_item_group: ColorChangeItemGroup
+    ) -> None:
+        """No items are created."""
         item_group = example_color_change_item_group
         item_group.create()
 
-        assert isinstance(item_group._time, int)
+        assert len(item_group) == 0
 
-    @pytest.mark.slow
-    @pytest.mark.parametrize(
-        "sleep, output", [(1, True), (2, True), (3, True), (5, False), (8, False)]
-    )
     def test_update(
-        self,
-        sleep: int,
-        output: bool,
-        example_color_change_item_group: TimedItemGroup,
+        self, monkeypatch, example_color_change_item_group: ColorChangeItemGroup
     ) -> None:
-        """Time value updated after sufficient time elapsed."""
+        """Colors are set again."""
         item_group = example_color_change_item_group
-        item_group._wrapped_group._time_diff = 4
-        item_group.create()
-        time1 = item_group._time
-        time.sleep(sleep)
+        calls = []
+        monkeypatch.setattr(
+            item_group._settings_manager, "set_colors", lambda: calls.append(True)
+        )
         item_group.update()
-        time2 = item_group._time
 
-        assert (time1 == time2) is output
+        assert calls == [True]
@@ -1,7 +1,15 @@
 import pygame as pg
 import pytest
 
-from screen_animator.items import Item, ScrollingMovement, RandomMovement, Direction
+from screen_animator.item_groups import ItemArray
+from screen_animator.items import (
+    CompactItem,
+    Direction,
+    GroupScrollingMovement,
+    Item,
+    RandomMovement,
+    ScrollingMovement,
+)
 
 
 @pytest.fixture
@@ -19,6 +27,72 @@ class TestItem:
         """Content setter sets correctly."""
         assert example_item.rect == pg.Rect(0, 0, 20, 10)
 
+    @pytest.mark.parametrize("alpha", [0, 0.5, 1])
+    def test_render_rect_no_movement(self, alpha: float, example_item: Item) -> None:
+        """Items without continuous movement drawn at current position."""
+        assert example_item.render_rect(alpha) == example_item.rect
+
+    @pytest.mark.parametrize("alpha, x", [(0, 110), (0.5, 105), (1, 100)])
+    def test_render_rect_interpolated(
+        self,
+        alpha: float,
+        x: int,
+        example_content: pg.Surface,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Scrolling items drawn part way back towards their previous position."""
+        item = Item(
+            pg.sprite.Group(),
+            example_content,
+            example_perimeter,
+            ScrollingMovement(10, Direction.LEFT),
+        )
+        item.rect.x = 100
+
+        assert item.render_rect(alpha).x == x
+
+
+class TestCompactItem:
+    @pytest.fixture
+    def example_compact_item(
+        self, example_content: pg.Surface, example_perimeter: pg.Rect
+    ) -> CompactItem:
+        """Provide example `CompactItem` moving right, in a group."""
+        return CompactItem(
+            ItemArray(),
+            example_content,
+            example_perimeter,
+            ScrollingMovement(5, Direction.RIGHT),
+        )
+
+    def test_no_instance_dict(self, example_compact_item: CompactItem) -> None:
+        """Attributes are held in slots."""
+        assert not hasattr(example_compact_item, "__dict__")
+
+    def test_init_added_to_group(self, example_compact_item: CompactItem) -> None:
+        """Item is added to its group when created."""
+        item = example_compact_item
+
+        assert item.alive()
+        assert item.group.sprites() == [item]
+
+    def test_move_positions_updated(self, example_compact_item: CompactItem) -> None:
+        """Position in the group is updated after moving."""
+        item = example_compact_item
+        item.group.positions
+        item.update()
+
+        assert item.group.positions["x"][0] == 5
+
+    def test_kill(self, example_compact_item: CompactItem) -> None:
+        """Killed item is removed from its group."""
+        item = example_compact_item
+        group = item.group
+        item.kill()
+
+        assert not item.alive()
+        assert len(group) == 0
+
 
 class TestScrollingMovement:
     @pytest.mark.parametrize(
@@ -62,6 +136,66 @@ class TestScrollingMovement:
 
         assert getattr(item.rect, axis) == value
 
+    @pytest.mark.parametrize(
+        "direction, output",
+        [
+            (Direction.UP, (0, 2)),
+            (Direction.RIGHT, (-2, 0)),
+            (Direction.DOWN, (0, -2)),
+            (Direction.LEFT, (2, 0)),
+        ],
+    )
+    def test_offset(self, direction: Direction, output: tuple[float, float]) -> None:
+        """Offset back against the direction of movement."""
+        assert ScrollingMovement(8, direction).offset(0.75) == output
+
+
+class TestGroupScrollingMovement:
+    def test_advance_items_not_moved(self, example_item: Item) -> None:
+        """Advancing scrolls the distance without moving items."""
+        movement = GroupScrollingMovement(4, Direction.LEFT)
+        rect = example_item.rect.copy()
+        movement.advance()
+        movement.advance()
+        movement.move(example_item)
+
+        assert movement.distance == 8
+        assert example_item.rect == rect
+
+    @pytest.mark.parametrize("alpha, x", [(0, 96), (0.5, 94), (1, 92)])
+    def test_render_rect_offset(
+        self,
+        alpha: float,
+        x: int,
+        example_content: pg.Surface,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Items drawn offset by the distance scrolled, interpolated."""
+        movement = GroupScrollingMovement(4, Direction.LEFT)
+        item = Item(pg.sprite.Group(), example_content, example_perimeter, movement)
+        item.rect.x = 100
+        movement.advance()
+        movement.advance()
+
+        assert item.render_rect(alpha).x == x
+
+    @pytest.mark.parametrize("distance", [101.5, 102.5, 103.25, 2**31 - 100.5])
+    def test_rebase_drawn_in_place(
+        self,
+        distance: float,
+        example_content: pg.Surface,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Items moved by the rebase offset are drawn in the same place."""
+        movement = GroupScrollingMovement(1, Direction.LEFT)
+        item = Item(pg.sprite.Group(), example_content, example_perimeter, movement)
+        movement.distance = distance
+        render_rects = [item.render_rect(alpha) for alpha in (0, 0.5, 1)]
+        item.rect.move_ip(movement.rebase())
+
+        assert 0 <= movement.distance < 2
+        assert [item.render_rect(alpha) for alpha in (0, 0.5, 1)] == render_rects
+
 
 class TestRandomMovement:
     @pytest.mark.parametrize("repeat", range(5))
@@ -0,0 +1,62 @@
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+import pytest
+
+from screen_animator import log_setup
+
+
+@pytest.fixture
+def package_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> logging.Logger:
+    """Provide package logger, restored after logging is set up in a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    log = logging.getLogger("screen_animator")
+    handlers, level = log.handlers[:], log.level
+    yield log
+    log.handlers[:] = handlers
+    log.setLevel(level)
+
+
+class TestSetupLogging:
+    def test_queue_handler_only(self, package_log: logging.Logger) -> None:
+        """Records are only put on a queue by the thread logging them."""
+        listener = log_setup.setup_logging("DEBUG")
+        listener.stop()
+        atexit.unregister(listener.stop)
+
+        assert [type(handler) for handler in package_log.handlers] == [QueueHandler]
+
+    def test_written_by_listener(
+        self, package_log: logging.Logger, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Records are written to the log file by a separate thread."""
+        writer_threads = []
+        emit = logging.FileHandler.emit
+        monkeypatch.setattr(
+            logging.FileHandler,
+            "emit",
+            lambda handler, record: (
+                type(handler) is logging.FileHandler
+                and writer_threads.append(threading.current_thread()),
+                emit(handler, record),
+            ),
+        )
+        listener = log_setup.setup_logging("DEBUG")
+        package_log.debug("Test message")
+        listener.stop()
+        atexit.unregister(listener.stop)
+
+        assert "Test message" in Path(log_setup.LOG_DIR, log_setup.LOG_FILE).read_text()
+        assert writer_threads and threading.main_thread() not in writer_threads
+
+    def test_no_file_without_level(self, package_log: logging.Logger) -> None:
+        """Nothing written to file if no logging level set."""
+        listener = log_setup.setup_logging("")
+        package_log.warning("Test message")
+        listener.stop()
+        atexit.unregister(listener.stop)
+
+        assert not Path(log_setup.LOG_DIR).exists()
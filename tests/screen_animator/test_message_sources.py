@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+from screen_animator.message_sources import FileMessageSource, ListMessageSource
+
+
+def choose_all(source, count: int = 200) -> set[str]:
+    """Choose many messages, returning those seen."""
+    rng = random.Random(0)
+
+    return {source.choose(rng) for _ in range(count)}
+
+
+class TestListMessageSource:
+    def test_choose_matches_rng_choice(self) -> None:
+        """Messages are chosen as `random.choice` would, for repeatable animations."""
+        messages = ("A", "B", "C")
+
+        assert ListMessageSource(messages).choose(random.Random(1)) == random.Random(
+            1
+        ).choice(messages)
+
+    def test_choose_empty(self) -> None:
+        """Empty string is chosen when there are no messages."""
+        assert ListMessageSource([]).choose(random.Random()) == ""
+
+
+class TestFileMessageSource:
+    @pytest.fixture
+    def example_messages_path(self, tmp_path):
+        """Provide path to a text file with three messages and a blank line."""
+        path = tmp_path / "messages.txt"
+        path.write_bytes("ONE\n\nTWO\r\nTHRÉE\n".encode())
+
+        return path
+
+    def test_choose(self, example_messages_path) -> None:
+        """Every message is chosen, without line endings, skipping blank lines."""
+        source = FileMessageSource(example_messages_path)
+
+        assert len(source) == 3
+        assert choose_all(source) == {"ONE", "TWO", "THRÉE"}
+
+    def test_last_line_without_newline(self, tmp_path) -> None:
+        """Last line is not a message until a newline is written after it."""
+        path = tmp_path / "messages.txt"
+        path.write_text("ONE\nTWO")
+        source = FileMessageSource(path)
+
+        assert choose_all(source) == {"ONE"}
+        assert source._size == len("ONE\n")
+
+    def test_empty_file(self, tmp_path) -> None:
+        """Empty string is chosen when the file is empty."""
+        path = tmp_path / "messages.txt"
+        path.write_text("")
+
+        assert FileMessageSource(path).choose(random.Random()) == ""
+
+    def test_appended(self, example_messages_path) -> None:
+        """Lines appended are indexed, keeping the index of those before."""
+        source = FileMessageSource(example_messages_path)
+        starts = source._starts[:3].copy()
+        with open(example_messages_path, "ab") as file:
+            file.write(b"FOUR\nFI")
+        source.refresh()
+
+        assert len(source) == 4
+        assert (source._starts[:3] == starts).all()
+        assert choose_all(source) == {"ONE", "TWO", "THRÉE", "FOUR"}
+
+    def test_appended_index_grows(self, example_messages_path) -> None:
+        """Index doubles in capacity when full, keeping every line appended."""
+        source = FileMessageSource(example_messages_path)
+        capacity = len(source._starts)
+        for chunk in range(3):
+            with open(example_messages_path, "a") as file:
+                file.writelines(f"{chunk}-{line}\n" for line in range(capacity))
+            source.refresh()
+
+        last = len(source) - 1
+        start, end = source._starts[last], source._ends[last]
+
+        assert len(source) == 3 + 3 * capacity
+        assert len(source._starts) == 4 * capacity
+        assert source._map[start:end] == f"2-{capacity - 1}".encode()
+
+    def test_appended_partial_line_completed(self, example_messages_path) -> None:
+        """Line still being written is indexed again once complete."""
+        source = FileMessageSource(example_messages_path)
+        with open(example_messages_path, "ab") as file:
+            file.write(b"FI")
+            file.flush()
+            source.refresh()
+            partial = len(source)
+            file.write(b"VE\n")
+
+        assert partial == 3
+        assert choose_all(source) == {"ONE", "TWO", "THRÉE", "FIVE"}
+
+    def test_replaced(self, tmp_path, example_messages_path) -> None:
+        """File replaced by another is indexed again from the start."""
+        source = FileMessageSource(example_messages_path)
+        new_path = tmp_path / "new.txt"
+        new_path.write_text("NEW\n")
+        new_path.replace(example_messages_path)
+
+        assert choose_all(source) == {"NEW"}
+
+    def test_truncated(self, example_messages_path) -> None:
+        """File truncated is indexed again from the start."""
+        source = FileMessageSource(example_messages_path)
+        example_messages_path.write_text("NEW\n")
+
+        assert choose_all(source) == {"NEW"}
+
+    def test_removed_keeps_messages(self, example_messages_path) -> None:
+        """Messages already indexed are kept if the file is removed."""
+        source = FileMessageSource(example_messages_path)
+        example_messages_path.unlink()
+
+        assert choose_all(source) == {"ONE", "TWO", "THRÉE"}
+
+    def test_missing_raises(self, tmp_path) -> None:
+        """Raise `OSError` if the file cannot be read."""
+        with pytest.raises(OSError):
+            FileMessageSource(tmp_path / "missing.txt")
@@ -2,9 +2,34 @@ import pytest
 import pygame as pg
 
 from screen_animator.model import Model
-from screen_animator.item_groups import ItemGroup
+from screen_animator.item_groups import (
+    ItemGroup,
+    LeftScrollingTextItemGroup,
+    TimeableItemGroup,
+)
+from screen_animator.items import Item
 from screen_animator.settings import SettingsManager
 from screen_animator.speed_changer import SpeedChanger
+from screen_animator.timing import SimulatedClock
+
+
+class CountingGroup(TimeableItemGroup):
+    """Timed group counting updates, every second."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._time_diff = 1
+        self.updates = 0
+
+    def create(self) -> None:
+        pass
+
+    def update(self) -> None:
+        self.updates += 1
+
+    def apply_settings(self, changed) -> None:
+        if "timings.counting_time" in changed:
+            self._time_diff = 2
 
 
 class TestModel:
@@ -40,8 +65,61 @@ class TestModel:
             isinstance(item_group, ItemGroup) for item_group in model.item_groups
         )
 
-    def test_init_event_type_int(self, example_model: Model) -> None:
-        """Update event type is `int`."""
+    def test_snapshot_copies_rects(self, example_model: Model) -> None:
+        """Snapshot keeps item positions when the items later move."""
         model = example_model
+        group = pg.sprite.Group()
+        item = Item(group, pg.Surface((20, 10)), model._perimeter)
+        model.item_groups = [group]
+        snapshot = model.snapshot()
+        item.rect.x += 5
+
+        assert snapshot.items == ((item, item.content, pg.Rect(0, 0, 20, 10)),)
+        assert snapshot.bg == tuple(model._settings_manager.state.bg_color)
+
+    def test_update_timed_groups_when_due(
+        self,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+        patch_speed_changer_init,
+    ) -> None:
+        """Timed groups only updated once their time difference has passed."""
+        example_settings_manager.clock = clock = SimulatedClock(10)
+        model = Model(example_settings_manager, [CountingGroup], example_perimeter)
+        updates = []
+        for _ in range(25):
+            clock.tick()
+            model.update()
+            updates.append(model.item_groups[0].updates)
+
+        assert updates[8:11] == [0, 1, 1]
+        assert updates[-1] == 2
+        assert model.next_deadline == 3000
+
+    def test_apply_settings_reschedules(
+        self,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+        patch_speed_changer_init,
+    ) -> None:
+        """Timed groups whose time difference changed are due from now."""
+        example_settings_manager.clock = clock = SimulatedClock(10)
+        model = Model(example_settings_manager, [CountingGroup], example_perimeter)
+        for _ in range(5):
+            clock.tick()
+        model.apply_settings({"timings.counting_time"})
+
+        assert model.next_deadline == 2500
+
+    def test_moving(
+        self, example_settings_manager: SettingsManager, example_perimeter: pg.Rect
+    ) -> None:
+        """Model is moving while scrolling, and not once scrolling is stopped."""
+        model = Model(
+            example_settings_manager, [LeftScrollingTextItemGroup], example_perimeter
+        )
+        moving = model.moving
+        model.item_groups[0].speed = 0
 
-        assert isinstance(model.update_event_type, int)
+        assert moving
+        assert not model.moving
@@ -0,0 +1,126 @@
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+import pygame as pg
+
+from screen_animator.profiling import (
+    CProfileProfiler,
+    SamplingProfiler,
+    StopProfilerAction,
+    ToggleProfilerAction,
+    frame_names,
+)
+
+
+def busy(seconds: float) -> None:
+    """Keep the main thread busy for a time."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_frame_names_outermost_first() -> None:
+    """Stack described from the outermost function to the innermost."""
+
+    def inner():
+        import sys
+
+        return frame_names(sys._getframe())
+
+    names = inner()
+
+    assert names[-1].startswith("inner (test_profiling.py:")
+    assert names[-2].startswith("test_frame_names_outermost_first")
+
+
+class TestCProfileProfiler:
+    def test_dump(self, tmp_path: Path) -> None:
+        """Profiled functions written as `pstats` file."""
+        profiler = CProfileProfiler()
+        profiler.start()
+        busy(0.01)
+        profiler.dump(tmp_path / "profile.pstats")
+
+        functions = {
+            function[2]
+            for function in pstats.Stats(str(tmp_path / "profile.pstats")).stats
+        }
+
+        assert "busy" in functions
+
+    def test_dump_stops(self, tmp_path: Path) -> None:
+        """Profiling stops when dumped."""
+        profiler = CProfileProfiler()
+        profiler.start()
+        profiler.dump(tmp_path / "profile.pstats")
+
+        assert not profiler.running
+
+    def test_dump_nothing_profiled(self, tmp_path: Path) -> None:
+        """No file written if profiling never started."""
+        CProfileProfiler().dump(tmp_path / "profile.pstats")
+
+        assert not (tmp_path / "profile.pstats").exists()
+
+    def test_window_posts_stop_event(self) -> None:
+        """Stop event posted at end of window."""
+        profiler = CProfileProfiler(0.01)
+        pg.event.clear(profiler.stop_event_type)
+        profiler.start()
+        time.sleep(0.1)
+        profiler.stop()
+
+        assert pg.event.get(profiler.stop_event_type)
+
+
+class TestSamplingProfiler:
+    def test_dump(self, tmp_path: Path) -> None:
+        """Samples of main thread written as collapsed stacks."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        busy(0.1)
+        profiler.dump(tmp_path / "profile.collapsed")
+
+        lines = (tmp_path / "profile.collapsed").read_text().splitlines()
+        stacks = dict(line.rsplit(" ", 1) for line in lines)
+
+        assert any(
+            stack.split(";")[-1].startswith("busy (test_profiling.py:")
+            for stack in stacks
+        )
+        assert all(int(count) > 0 for count in stacks.values())
+
+    def test_stop_ends_sampling(self) -> None:
+        """No samples taken while stopped."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        busy(0.01)
+        profiler.stop()
+        samples = profiler._stacks.total()
+        busy(0.01)
+
+        assert profiler._stacks.total() == samples
+
+
+class TestProfilerActions:
+    def test_toggle(self) -> None:
+        """Toggling starts then stops profiling."""
+        profiler = CProfileProfiler()
+        action = ToggleProfilerAction(profiler)
+        action.notify()
+        running = profiler.running
+        action.notify()
+
+        assert running and not profiler.running
+
+    @pytest.mark.parametrize("running", [True, False])
+    def test_stop(self, running: bool) -> None:
+        """Profiling is stopped whether running or not."""
+        profiler = CProfileProfiler()
+        if running:
+            profiler.start()
+        StopProfilerAction(profiler).notify()
+
+        assert not profiler.running
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+import pygame as pg
+
+from screen_animator.reloading import (
+    InotifyWatcher,
+    PollingWatcher,
+    ReloadSettingsAction,
+    watch_files,
+)
+from screen_animator.settings import SettingsManager
+
+
+class RecordingModel:
+    """Model that records settings applied."""
+
+    def __init__(self) -> None:
+        self.applied: list[set[str]] = []
+
+    def apply_settings(self, changed: set[str]) -> None:
+        self.applied.append(set(changed))
+
+
+class TestFileWatcher:
+    @pytest.fixture
+    def example_file(self, tmp_path) -> str:
+        """Provide path to a file to watch."""
+        path = tmp_path / "inputs.toml"
+        path.write_text("a = 1\n")
+
+        return str(path)
+
+    def wait_for_event(self, event_type: int, timeout: int = 2000) -> bool:
+        """Wait up to a timeout in milliseconds for an event of a type to be posted."""
+        return pg.event.wait(timeout).type == event_type
+
+    @pytest.mark.parametrize("watcher_type", [PollingWatcher, InotifyWatcher])
+    def test_change_posts_event(self, watcher_type: type, example_file: str) -> None:
+        """Event is posted once the file changes."""
+        try:
+            watcher = watcher_type([example_file], 0.05, 0.01)
+        except OSError:
+            pytest.skip("inotify not available")
+        pg.event.clear()
+        watcher.start()
+        with open(example_file, "w") as file:
+            file.write("a = 22\n")
+        posted = self.wait_for_event(watcher.event_type)
+        watcher.stop()
+
+        assert posted
+
+    def test_polling_replaced_same_size_and_time(
+        self, tmp_path, example_file: str
+    ) -> None:
+        """File replaced by one of the same size and modification time is changed."""
+        watcher = PollingWatcher([example_file])
+        stat = os.stat(example_file)
+        new_path = tmp_path / "new.toml"
+        new_path.write_text("a = 2\n")
+        os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        new_path.replace(example_file)
+
+        assert watcher._changed(0)
+
+    def test_other_file_ignored(self, tmp_path, example_file: str) -> None:
+        """No event is posted when another file in the directory changes."""
+        watcher = watch_files([example_file], 0.05)
+        pg.event.clear()
+        watcher.start()
+        (tmp_path / "other.toml").write_text("b = 2\n")
+        posted = self.wait_for_event(watcher.event_type, 500)
+        watcher.stop()
+
+        assert not posted
+
+
+class TestReloadSettingsAction:
+    def test_notify_applies_changes(
+        self, example_settings_file: str, monkeypatch
+    ) -> None:
+        """Settings changed are applied to the model."""
+        model = RecordingModel()
+        settings_manager = SettingsManager([example_settings_file])
+        monkeypatch.setattr(settings_manager, "reload", lambda: {"timings.fps"})
+        ReloadSettingsAction(settings_manager, model).notify()
+
+        assert model.applied == [{"timings.fps"}]
+
+    def test_notify_invalid_ignored(self, example_settings_file: str) -> None:
+        """Invalid settings are ignored, leaving the model unchanged."""
+        model = RecordingModel()
+        settings_manager = SettingsManager([example_settings_file])
+        with open(example_settings_file, "w") as file:
+            file.write("colors = 1\n")
+        ReloadSettingsAction(settings_manager, model).notify()
+
+        assert model.applied == []
+        assert settings_manager.settings["colors"] == [
+            (255, 0, 0),
+            (0, 255, 0),
+            (0, 0, 255),
+        ]
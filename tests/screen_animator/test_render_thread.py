@@ -0,0 +1,141 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+import pygame as pg
+
+from screen_animator.instrumentation import FrameStats
+from screen_animator.model import Snapshot
+from screen_animator.render_thread import (
+    RenderThread,
+    SnapshotBuffer,
+    SnapshotPublisher,
+)
+
+
+def example_snapshot(bg: tuple[int, int, int] = (0, 0, 0)) -> Snapshot:
+    """Create snapshot with no items."""
+    return Snapshot(bg, ())
+
+
+class RecordingView:
+    """View that records the snapshots drawn, and whether it was closed."""
+
+    def __init__(self) -> None:
+        self.drawn: list[Snapshot] = []
+        self.drawn_event = threading.Event()
+        self.closed = False
+
+    def draw(self, snapshot: Snapshot) -> None:
+        self.drawn.append(snapshot)
+        self.drawn_event.set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FailingView:
+    """View that fails to draw."""
+
+    def draw(self, snapshot: Snapshot) -> None:
+        raise RuntimeError("Draw failed")
+
+    def close(self) -> None:
+        pass
+
+
+class TestSnapshotBuffer:
+    @pytest.fixture
+    def example_buffer(self) -> SnapshotBuffer:
+        """Provide empty `SnapshotBuffer`."""
+        return SnapshotBuffer()
+
+    def test_take_latest(self, example_buffer: SnapshotBuffer) -> None:
+        """Latest snapshot published is taken, replacing the one before."""
+        buffer = example_buffer
+        first, second = example_snapshot(), example_snapshot((255, 255, 255))
+
+        assert not buffer.publish(first)
+        assert buffer.publish(second)
+        assert buffer.take(0) is second
+        assert buffer.dropped == 1
+
+    def test_take_empty(self, example_buffer: SnapshotBuffer) -> None:
+        """Nothing is taken twice."""
+        buffer = example_buffer
+        buffer.publish(example_snapshot())
+        buffer.take(0)
+
+        assert buffer.take(0.01) is None
+
+    def test_close_wakes_take(self, example_buffer: SnapshotBuffer) -> None:
+        """Closing returns from a waiting take."""
+        buffer = example_buffer
+        threading.Timer(0.01, buffer.close).start()
+
+        assert buffer.take() is None
+        assert buffer.closed
+
+
+class TestSnapshotPublisher:
+    def test_update_publishes(self) -> None:
+        """Snapshot of the model is published, with dropped snapshots counted."""
+        snapshots = iter([example_snapshot(), example_snapshot((255, 255, 255))])
+        model = SimpleNamespace(snapshot=lambda alpha: next(snapshots))
+        buffer = SnapshotBuffer()
+        stats = FrameStats()
+        publisher = SnapshotPublisher(model, buffer, stats)
+        publisher.update()
+        publisher.update()
+        stats.end_frame()
+
+        assert buffer.take(0).bg == (255, 255, 255)
+        assert stats.summary()["stages"]["snapshots_dropped"]["max"] == 1
+
+    def test_update_unchanged_skipped(self) -> None:
+        """Snapshot the same as the last published is not published."""
+        model = SimpleNamespace(snapshot=lambda alpha: example_snapshot())
+        buffer = SnapshotBuffer()
+        publisher = SnapshotPublisher(model, buffer)
+
+        assert publisher.update()
+        assert not publisher.update()
+        assert buffer.dropped == 0
+
+    def test_close_closes_buffer(self) -> None:
+        """Closing the publisher closes the buffer, for the render thread to stop."""
+        buffer = SnapshotBuffer()
+        SnapshotPublisher(SimpleNamespace(), buffer).close()
+
+        assert buffer.closed
+
+
+class TestRenderThread:
+    def test_run_draws_snapshots(self) -> None:
+        """Snapshots published are drawn until stopped."""
+        view = RecordingView()
+        buffer = SnapshotBuffer()
+        stats = FrameStats()
+        render_thread = RenderThread(view, buffer, stats)
+        render_thread.start()
+        snapshot = example_snapshot()
+        buffer.publish(snapshot)
+        view.drawn_event.wait(1)
+        render_thread.stop()
+
+        assert view.drawn == [snapshot]
+        assert stats.frames == 1
+        assert not render_thread.is_alive()
+        assert view.closed
+
+    def test_run_error_quits(self) -> None:
+        """Error while drawing posts a quit event."""
+        pg.event.clear()
+        buffer = SnapshotBuffer()
+        render_thread = RenderThread(FailingView(), buffer)
+        render_thread.start()
+        buffer.publish(example_snapshot())
+        render_thread.join(1)
+
+        assert not render_thread.is_alive()
+        assert pg.event.get(pg.QUIT)
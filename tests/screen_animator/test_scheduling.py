@@ -0,0 +1,152 @@
+import time
+
+import pytest
+import pygame as pg
+
+from screen_animator.item_groups import ColorChangeItemGroup, TimeableItemGroup
+from screen_animator.scheduling import Scheduler
+from screen_animator.settings import SettingsManager
+from screen_animator.timing import SimulatedClock, SystemClock
+
+
+class TestScheduler:
+    @pytest.fixture
+    def example_clock(self) -> SimulatedClock:
+        """Provide clock simulating 30 FPS."""
+        return SimulatedClock(30)
+
+    @pytest.fixture
+    def example_group(
+        self, example_settings_manager: SettingsManager, example_perimeter: pg.Rect
+    ) -> ColorChangeItemGroup:
+        """Provide example `ColorChangeItemGroup` updated every 4 seconds."""
+        item_group = ColorChangeItemGroup(example_settings_manager, example_perimeter)
+        item_group._time_diff = 4
+
+        return item_group
+
+    def make_groups(
+        self,
+        settings_manager: SettingsManager,
+        perimeter: pg.Rect,
+        time_diffs: list[float],
+    ) -> list[TimeableItemGroup]:
+        """Create groups updated after each time difference."""
+        item_groups = []
+        for time_diff in time_diffs:
+            item_group = ColorChangeItemGroup(settings_manager, perimeter)
+            item_group._time_diff = time_diff
+            item_groups.append(item_group)
+
+        return item_groups
+
+    def test_register_next_deadline(
+        self, example_clock: SimulatedClock, example_group: ColorChangeItemGroup
+    ) -> None:
+        """Next deadline is time difference after registering."""
+        scheduler = Scheduler(example_clock)
+        scheduler.register(example_group)
+
+        assert scheduler.next_deadline == 4000
+
+    def test_next_deadline_empty(self, example_clock: SimulatedClock) -> None:
+        """No deadline when nothing is registered."""
+        assert Scheduler(example_clock).next_deadline is None
+
+    @pytest.mark.parametrize("frames, output", [(119, []), (120, [0])])
+    def test_pop_due_simulated_clock(
+        self,
+        frames: int,
+        output: list[int],
+        example_clock: SimulatedClock,
+        example_group: ColorChangeItemGroup,
+    ) -> None:
+        """Group due once sufficient simulated time elapsed."""
+        scheduler = Scheduler(example_clock)
+        scheduler.register(example_group)
+        for _ in range(frames):
+            example_clock.tick()
+
+        assert list(scheduler.pop_due()) == [example_group for _ in output]
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "sleep, output", [(1, False), (2, False), (3, False), (5, True), (8, True)]
+    )
+    def test_pop_due(
+        self, sleep: int, output: bool, example_group: ColorChangeItemGroup
+    ) -> None:
+        """Group due after sufficient time elapsed."""
+        scheduler = Scheduler(SystemClock())
+        scheduler.register(example_group)
+        time.sleep(sleep)
+
+        assert bool(scheduler.pop_due()) is output
+
+    def test_pop_due_rescheduled(
+        self, example_clock: SimulatedClock, example_group: ColorChangeItemGroup
+    ) -> None:
+        """Group is due again its time difference after it was taken."""
+        scheduler = Scheduler(example_clock)
+        scheduler.register(example_group)
+        for _ in range(150):
+            example_clock.tick()
+        scheduler.pop_due()
+
+        assert scheduler.next_deadline == example_clock.get_ticks() + 4000
+        assert len(scheduler) == 1
+
+    def test_pop_due_spread(
+        self,
+        example_clock: SimulatedClock,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Groups due on the same step are taken on consecutive steps, earliest first."""
+        item_groups = self.make_groups(
+            example_settings_manager, example_perimeter, [3, 2, 1]
+        )
+        scheduler = Scheduler(example_clock)
+        for item_group in item_groups:
+            scheduler.register(item_group)
+        for _ in range(90):
+            example_clock.tick()
+
+        assert [list(scheduler.pop_due()) for _ in range(4)] == [
+            [item_groups[2]],
+            [item_groups[1]],
+            [item_groups[0]],
+            [],
+        ]
+
+    def test_pop_due_max_dispatch(
+        self,
+        example_clock: SimulatedClock,
+        example_settings_manager: SettingsManager,
+        example_perimeter: pg.Rect,
+    ) -> None:
+        """Up to the most groups for one step are taken together."""
+        item_groups = self.make_groups(
+            example_settings_manager, example_perimeter, [1, 1, 1]
+        )
+        scheduler = Scheduler(example_clock, 2)
+        for item_group in item_groups:
+            scheduler.register(item_group)
+        for _ in range(30):
+            example_clock.tick()
+
+        assert scheduler.pop_due() == item_groups[:2]
+
+    def test_reschedule(
+        self, example_clock: SimulatedClock, example_group: ColorChangeItemGroup
+    ) -> None:
+        """Rescheduled group is due its new time difference from now, only once."""
+        scheduler = Scheduler(example_clock)
+        scheduler.register(example_group)
+        for _ in range(30):
+            example_clock.tick()
+        example_group._time_diff = 2
+        scheduler.reschedule(example_group)
+
+        assert scheduler.next_deadline == example_clock.get_ticks() + 2000
+        assert len(scheduler) == 1
@@ -1,7 +1,15 @@
 import pytest
 import pygame as pg
 
-from screen_animator.settings import SettingsImporter, SettingsManager
+import tomllib
+
+from screen_animator.settings import (
+    CompiledSettings,
+    SettingsExporter,
+    SettingsImporter,
+    SettingsManager,
+    diff_settings,
+)
 from screen_animator.image_loading import ImageLoader
 
 
@@ -23,6 +31,35 @@ class TestSettingsImporter:
 
         assert importer._validate_settings() is None
 
+    def test_validate_settings_file_not_str(self, example_settings_dict: dict) -> None:
+        """Raise `ValueError` if the messages file is not a path."""
+        example_settings_dict["messages"]["file"] = 1
+        importer = SettingsImporter()
+        importer._settings = example_settings_dict
+        with pytest.raises(ValueError):
+            importer._validate_settings()
+
+    def test_validate_settings_file_without_messages(
+        self, example_settings_dict: dict
+    ) -> None:
+        """Messages can be left out when a messages file is given."""
+        del example_settings_dict["messages"]["messages"]
+        example_settings_dict["messages"]["file"] = "messages.txt"
+        importer = SettingsImporter()
+        importer._settings = example_settings_dict
+
+        assert importer._validate_settings() is None
+
+    def test_validate_settings_no_messages_raises(
+        self, example_settings_dict: dict
+    ) -> None:
+        """Raise `ValueError` if neither messages nor a messages file are given."""
+        del example_settings_dict["messages"]["messages"]
+        importer = SettingsImporter()
+        importer._settings = example_settings_dict
+        with pytest.raises(ValueError):
+            importer._validate_settings()
+
     def test_convert_colors_to_tuples(
         self, example_settings_dict: dict, example_settings_dict_with_tuples: dict
     ) -> None:
@@ -35,25 +72,77 @@ class TestSettingsImporter:
         )
 
 
+class TestSettingsExporter:
+    def test_export_settings_round_trip(
+        self, tmp_path, example_settings_dict: dict
+    ) -> None:
+        """Exported settings are read back unchanged."""
+        settings_path = tmp_path / "exported.toml"
+        SettingsExporter().export_settings(example_settings_dict, settings_path)
+
+        with open(settings_path, "rb") as settings_file:
+            assert tomllib.load(settings_file) == example_settings_dict
+
+
+class TestCompiledSettings:
+    def test_compile(self, example_settings_dict_with_tuples: dict) -> None:
+        """Settings are read as attributes, with hyphenated names as underscores."""
+        settings = CompiledSettings.compile(example_settings_dict_with_tuples)
+
+        assert settings.colors[0] == (255, 0, 0)
+        assert settings.messages.anti_aliasing is False
+        assert settings.messages.sizes == (350, 350)
+        assert settings.images.sources[1] == ("pic2.bmp", -1)
+        assert settings.timings.fps == 30
+
+    def test_compile_frozen(self, example_settings_dict_with_tuples: dict) -> None:
+        """Compiled settings cannot be changed."""
+        settings = CompiledSettings.compile(example_settings_dict_with_tuples)
+
+        with pytest.raises(AttributeError):
+            settings.timings.fps = 60
+
+
+class TestDiffSettings:
+    def test_diff_settings_unchanged(self, example_settings_dict: dict) -> None:
+        """No settings differ from themselves."""
+        assert diff_settings(example_settings_dict, example_settings_dict) == set()
+
+    def test_diff_settings_nested(self, example_settings_dict: dict) -> None:
+        """Settings changed, added and removed in tables are found by dotted path."""
+        old = {"messages": {"separator": " ", "bold": True}, "colors": []}
+        new = {"messages": {"separator": "  ", "italic": True}, "colors": []}
+
+        assert diff_settings(old, new) == {
+            "messages.separator",
+            "messages.bold",
+            "messages.italic",
+        }
+
+
 class TestSettingsManager:
-    @pytest.mark.parametrize("group", ["bg", "messages"])
+    @pytest.mark.parametrize("attribute", ["bg_color", "color"])
     def test_set_colors(
-        self, group: pg.sprite.Group, example_settings_manager: SettingsManager
+        self, attribute: str, example_settings_manager: SettingsManager
     ) -> None:
         """Colors are set to a color option provided in settings."""
         settings_manager = example_settings_manager
         settings_manager.set_colors()
-        settings = settings_manager.settings
 
-        assert settings[group]["color"] in settings["colors"]
+        assert (
+            getattr(settings_manager.state, attribute)
+            in settings_manager.settings["colors"]
+        )
 
     def test_set_outline_color(self, example_settings_manager: SettingsManager) -> None:
         """Outline color set to color option provided in settings."""
         settings_manager = example_settings_manager
         settings_manager.set_colors()
-        messages_dict = settings_manager.settings["messages"]
 
-        assert messages_dict["outline_color"] in messages_dict["outline_colors"]
+        assert (
+            settings_manager.state.outline_color
+            in settings_manager.settings["messages"]["outline_colors"]
+        )
 
     def test_set_outline_colour_single_choice(
         self, example_settings_manager: SettingsManager
@@ -61,18 +150,20 @@ class TestSettingsManager:
         """Outline color set correctly when only a single option provided."""
         settings_manager = example_settings_manager
         outline_color = (0, 255, 0)
-        messages_dict = settings_manager.settings["messages"]
-        messages_dict["outline_colors"] = outline_color
+        settings_manager.settings["messages"]["outline_colors"] = outline_color
+        settings_manager.compile()
         settings_manager.set_colors()
 
-        assert messages_dict["outline_color"] == outline_color
+        assert settings_manager.config.messages.outline_colors == (outline_color,)
+        assert settings_manager.state.outline_color == outline_color
 
     def test_set_font(self, example_settings_manager: SettingsManager) -> None:
-        """`Font` instance created and added to settings."""
+        """`Font` instance created, returned and kept in the settings state."""
         settings_manager = example_settings_manager
-        settings_manager.set_font()
+        font = settings_manager.set_font()
 
-        assert isinstance(settings_manager.settings["messages"]["font"], pg.font.Font)
+        assert isinstance(font, pg.font.Font)
+        assert settings_manager.state.font is font
 
     @pytest.mark.parametrize("sizes", [(10, 10), (20, 30), (50, 50), (80, 130)])
     def test_set_font_size(
@@ -80,11 +171,11 @@ class TestSettingsManager:
     ) -> None:
         """Font size is between limits specified."""
         settings_manager = example_settings_manager
-        messages_dict = settings_manager.settings["messages"]
-        messages_dict["sizes"] = sizes
+        settings_manager.settings["messages"]["sizes"] = sizes
+        settings_manager.compile()
         settings_manager.set_font()
 
-        assert min(sizes) <= messages_dict["size"] <= max(sizes)
+        assert min(sizes) <= settings_manager.state.size <= max(sizes)
 
     @pytest.mark.parametrize("repeat", range(5))
     def test_generate_text(
@@ -110,19 +201,195 @@ class TestSettingsManager:
 
         assert isinstance(settings_manager.generate_message_text(), str)
 
+    def test_generate_text_from_file(
+        self, tmp_path, example_settings_file: str
+    ) -> None:
+        """Messages are chosen from the messages file, when one is given."""
+        messages_path = tmp_path / "messages.txt"
+        messages_path.write_text("FILE MESSAGE\n")
+        self.replace_setting(
+            example_settings_file,
+            "[messages]\n",
+            f'[messages]\nfile = "{messages_path.as_posix()}"\n',
+        )
+        settings_manager = SettingsManager([example_settings_file])
+
+        assert settings_manager.generate_message_text().startswith("FILE MESSAGE")
+
     def test_load_images(
         self,
         monkeypatch,
         example_settings_manager: SettingsManager,
         example_settings_dict_with_tuples: dict,
     ) -> None:
-        """Images are loaded and stored in settings."""
+        """Images are loaded and kept in the settings state."""
         monkeypatch.setattr(
             ImageLoader, "load_image", lambda x, y, z: pg.Surface((20, 10))
         )
         settings_manager = example_settings_manager
         settings_manager._load_images()
 
-        assert len(settings_manager.settings["images"]["images"]) == len(
+        assert len(settings_manager.state.images) == len(
             example_settings_dict_with_tuples["images"]["sources"]
         )
+
+    @pytest.mark.parametrize(
+        "render_scale, sizes, outline_width, scroll_speed",
+        [(1.0, (350, 350), 3, 240), (0.5, (175, 175), 2, 120), (0.25, (88, 88), 1, 60)],
+    )
+    def test_scale_settings(
+        self,
+        render_scale: float,
+        sizes: tuple[int, int],
+        outline_width: int,
+        scroll_speed: int,
+        example_settings_manager: SettingsManager,
+    ) -> None:
+        """Pixel sizes in settings are scaled by the render scale."""
+        settings_manager = SettingsManager("", render_scale)
+        messages_dict = settings_manager.settings["messages"]
+
+        assert (
+            messages_dict["sizes"],
+            messages_dict["outline_width"],
+            messages_dict["scroll_speed"],
+        ) == (sizes, outline_width, scroll_speed)
+
+    def test_scale_settings_static_text(
+        self, example_settings_manager: SettingsManager
+    ) -> None:
+        """Scroll speed of 0, for static text, is not scaled up to 1."""
+        example_settings_manager.settings["messages"]["scroll_speed"] = 0
+        settings_manager = SettingsManager("", 0.5)
+
+        assert settings_manager.settings["messages"]["scroll_speed"] == 0
+        assert settings_manager.config.messages.scroll_speed == 0
+
+    @pytest.mark.parametrize("width, output", [(64, 32), (-1, 10)])
+    def test_load_images_scaled(
+        self,
+        monkeypatch,
+        width: int,
+        output: int,
+        example_settings_manager: SettingsManager,
+    ) -> None:
+        """Images are loaded at a width matching the render scale."""
+        monkeypatch.setattr(
+            ImageLoader,
+            "load_image",
+            lambda x, y, z: pg.Surface((z if z > 0 else 20, 10)),
+        )
+        settings_manager = SettingsManager("", 0.5)
+        settings_manager.settings["images"]["sources"] = [("pic.bmp", width)]
+        settings_manager.compile()
+        settings_manager._load_images()
+
+        assert settings_manager.state.images[0].get_width() == output
+
+    @pytest.fixture
+    def example_reloadable_settings_manager(
+        self, example_settings_file: str
+    ) -> SettingsManager:
+        """Provide `SettingsManager` reading from a TOML file."""
+        return SettingsManager([example_settings_file])
+
+    def replace_setting(self, settings_file: str, old: str, new: str) -> None:
+        """Replace text in a settings file."""
+        with open(settings_file) as file:
+            text = file.read()
+        with open(settings_file, "w") as file:
+            file.write(text.replace(old, new))
+
+    def test_reload_unchanged(
+        self, example_reloadable_settings_manager: SettingsManager
+    ) -> None:
+        """Nothing changes when the settings files have not changed."""
+        settings_manager = example_reloadable_settings_manager
+        font = settings_manager.state.font
+
+        assert settings_manager.reload() == set()
+        assert settings_manager.state.font is font
+
+    def test_reload_messages(
+        self,
+        example_settings_file: str,
+        example_reloadable_settings_manager: SettingsManager,
+    ) -> None:
+        """New messages are applied, keeping the font, colors and images loaded."""
+        settings_manager = example_reloadable_settings_manager
+        state = settings_manager.state
+        font, color, images = state.font, state.bg_color, state.images
+        self.replace_setting(example_settings_file, "TEST MESSAGE 2!", "NEW!")
+
+        assert settings_manager.reload() == {"messages.messages"}
+        assert settings_manager.config.messages.messages == ("TEST MESSAGE 1!", "NEW!")
+        assert state.font is font
+        assert state.bg_color == color
+        assert state.images is images
+
+    def test_reload_font(
+        self,
+        example_settings_file: str,
+        example_reloadable_settings_manager: SettingsManager,
+    ) -> None:
+        """Font is created again when its size changes."""
+        settings_manager = example_reloadable_settings_manager
+        self.replace_setting(
+            example_settings_file, "sizes = [40, 40]", "sizes = [20, 20]"
+        )
+
+        assert settings_manager.reload() == {"messages.sizes"}
+        assert settings_manager.state.size == 20
+
+    def test_reload_images_reused(
+        self,
+        tmp_path,
+        example_settings_file: str,
+        example_reloadable_settings_manager: SettingsManager,
+    ) -> None:
+        """Only images not already loaded are loaded when sources change."""
+        settings_manager = example_reloadable_settings_manager
+        images = settings_manager.state.images
+        new_image_path = tmp_path / "new.bmp"
+        pg.image.save(pg.Surface((30, 10)), new_image_path)
+        self.replace_setting(
+            example_settings_file,
+            "-1]]",
+            f'-1], ["{new_image_path.as_posix()}", -1]]',
+        )
+
+        assert settings_manager.reload() == {"images.sources"}
+        assert settings_manager.state.images[0] is images[0]
+        assert settings_manager.state.images[1].get_width() == 30
+
+    def test_reload_messages_file(
+        self,
+        tmp_path,
+        example_settings_file: str,
+        example_reloadable_settings_manager: SettingsManager,
+    ) -> None:
+        """Messages are chosen from a messages file added on reload."""
+        settings_manager = example_reloadable_settings_manager
+        messages_path = tmp_path / "messages.txt"
+        messages_path.write_text("FILE MESSAGE\n")
+        self.replace_setting(
+            example_settings_file,
+            "[messages]\n",
+            f'[messages]\nfile = "{messages_path.as_posix()}"\n',
+        )
+
+        assert settings_manager.reload() == {"messages.file"}
+        assert settings_manager.generate_message_text().startswith("FILE MESSAGE")
+
+    def test_reload_invalid(
+        self,
+        example_settings_file: str,
+        example_reloadable_settings_manager: SettingsManager,
+    ) -> None:
+        """Invalid settings raise `ValueError`, leaving the settings unchanged."""
+        settings_manager = example_reloadable_settings_manager
+        self.replace_setting(example_settings_file, "fps = 30", 'fps = "fast"')
+
+        with pytest.raises(ValueError):
+            settings_manager.reload()
+        assert settings_manager.config.timings.fps == 30
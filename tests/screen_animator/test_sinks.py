@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+import pygame as pg
+
+from screen_animator.sinks import FramebufferSink
+
+
+@pytest.fixture
+def example_frame() -> pg.Surface:
+    """Provide example frame, black with a single colored pixel at (1, 2)."""
+    frame = pg.Surface((4, 3))
+    frame.fill((0, 0, 0))
+    frame.set_at((1, 2), (0x12, 0x34, 0x56))
+
+    return frame
+
+
+class TestFramebufferSink:
+    @pytest.fixture
+    def example_path(self, tmp_path: Path) -> Path:
+        """Provide path to an empty file to use as a framebuffer."""
+        path = tmp_path / "fb"
+        path.touch()
+
+        return path
+
+    def test_init_file_extended(self, example_path: Path) -> None:
+        """Regular file is extended to fit the framebuffer."""
+        sink = FramebufferSink(example_path, (4, 3), "XRGB8888")
+        sink.close()
+
+        assert example_path.stat().st_size == 4 * 3 * 4
+
+    def test_init_file_created(self, tmp_path: Path) -> None:
+        """Regular file that does not exist is created to fit the framebuffer."""
+        path = tmp_path / "fb"
+        sink = FramebufferSink(path, (4, 3), "RGB565")
+        sink.close()
+
+        assert path.stat().st_size == 4 * 3 * 2
+
+    def test_init_size_required(self, example_path: Path) -> None:
+        """Size must be provided for a regular file."""
+        with pytest.raises(ValueError):
+            FramebufferSink(example_path)
+
+    def test_init_pixel_format_unsupported(self, example_path: Path) -> None:
+        """Unsupported pixel formats are rejected."""
+        with pytest.raises(ValueError):
+            FramebufferSink(example_path, (4, 3), "YUV420")
+
+    @pytest.mark.parametrize(
+        "pixel_format, output",
+        [
+            ("RGB565", bytes([0xAA, 0x11])),
+            ("RGB888", bytes([0x56, 0x34, 0x12])),
+            ("BGR888", bytes([0x12, 0x34, 0x56])),
+            ("XRGB8888", bytes([0x56, 0x34, 0x12, 0x00])),
+            ("XBGR8888", bytes([0x12, 0x34, 0x56, 0x00])),
+        ],
+    )
+    def test_write_pixel_format(
+        self,
+        pixel_format: str,
+        output: bytes,
+        example_path: Path,
+        example_frame: pg.Surface,
+    ) -> None:
+        """Pixels are converted to the framebuffer pixel format."""
+        sink = FramebufferSink(example_path, (4, 3), pixel_format)
+        sink.write(example_frame, [example_frame.get_rect()])
+        sink.close()
+        bytes_per_pixel = len(output)
+        offset = 2 * 4 * bytes_per_pixel + bytes_per_pixel
+
+        assert example_path.read_bytes()[offset : offset + bytes_per_pixel] == output
+
+    def test_write_stride(self, example_path: Path, example_frame: pg.Surface) -> None:
+        """Rows are written at the framebuffer stride."""
+        sink = FramebufferSink(example_path, (4, 3), "BGR888", stride=16)
+        sink.write(example_frame, [example_frame.get_rect()])
+        sink.close()
+
+        assert example_path.read_bytes()[2 * 16 + 3 : 2 * 16 + 6] == bytes(
+            [0x12, 0x34, 0x56]
+        )
+
+    def test_write_changed_rows_only(
+        self, example_path: Path, example_frame: pg.Surface
+    ) -> None:
+        """Only rows covered by the changed areas are written."""
+        sink = FramebufferSink(example_path, (4, 3), "BGR888")
+        sink.write(example_frame, [pg.Rect(0, 0, 4, 2)])
+        sink.close()
+
+        assert example_path.read_bytes()[2 * 12 + 3 : 2 * 12 + 6] == bytes(3)
+
+    @pytest.mark.parametrize(
+        "rects, output",
+        [
+            ([], []),
+            ([pg.Rect(0, 2, 5, 3)], [(2, 5)]),
+            ([pg.Rect(0, 2, 5, 3), pg.Rect(9, 4, 1, 4)], [(2, 8)]),
+            ([pg.Rect(0, 6, 5, 3), pg.Rect(9, 0, 1, 4)], [(0, 4), (6, 9)]),
+            ([pg.Rect(0, -5, 5, 8), pg.Rect(0, 8, 5, 8)], [(0, 3), (8, 10)]),
+        ],
+    )
+    def test_row_spans(
+        self, rects: list[pg.Rect], output: list[tuple[int, int]]
+    ) -> None:
+        """Changed areas are merged into spans of rows within the frame."""
+        assert FramebufferSink._row_spans(rects, 10) == output
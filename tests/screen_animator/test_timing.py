@@ -0,0 +1,43 @@
+import pytest
+
+from screen_animator.timing import SimulatedClock, SystemClock
+
+
+class TestSystemClock:
+    def test_get_ticks_return_type(self) -> None:
+        """Ticks are `int` milliseconds."""
+        assert isinstance(SystemClock().get_ticks(), int)
+
+
+class TestSimulatedClock:
+    @pytest.mark.parametrize(
+        "fps, ticks, output", [(30, 1, 33), (30, 3, 100), (60, 90, 1500), (0, 5, 0)]
+    )
+    def test_get_ticks(self, fps: float, ticks: int, output: int) -> None:
+        """Time advances by one frame per tick."""
+        clock = SimulatedClock()
+        for _ in range(ticks):
+            clock.tick(fps)
+
+        assert clock.get_ticks() == output
+
+    def test_tick_elapsed(self) -> None:
+        """Milliseconds returned by ticks add up to time elapsed."""
+        clock = SimulatedClock()
+        elapsed = sum(clock.tick(30) for _ in range(100))
+
+        assert elapsed == clock.get_ticks()
+
+    def test_tick_default_fps(self) -> None:
+        """Frame rate set on creation used when not given to tick."""
+        clock = SimulatedClock(25)
+        clock.tick()
+
+        assert clock.get_ticks() == 40
+
+    def test_get_fps(self) -> None:
+        """Frame rate is the frame rate simulated."""
+        clock = SimulatedClock()
+        clock.tick(30)
+
+        assert clock.get_fps() == 30
@@ -0,0 +1,271 @@
+from collections.abc import Sequence
+from types import SimpleNamespace
+
+import pytest
+import pygame as pg
+from pygame._sdl2.video import Window, Renderer
+
+from screen_animator.instrumentation import FrameStats
+from screen_animator.items import Item
+from screen_animator.model import Snapshot
+from screen_animator.settings import SettingsState
+from screen_animator.sinks import FrameSink, NullSink
+from screen_animator.view import View, RendererView
+
+
+@pytest.fixture
+def example_renderer() -> Renderer:
+    """Provide renderer for a small window."""
+    return Renderer(Window("test", (100, 50)))
+
+
+@pytest.fixture
+def example_model() -> SimpleNamespace:
+    """Provide stand-in for a model with a single red item in the top-left."""
+    group = pg.sprite.Group()
+    content = pg.Surface((20, 10))
+    content.fill((255, 0, 0))
+    Item(group, content, pg.Rect(0, 0, 100, 50))
+
+    return SimpleNamespace(item_groups=[group])
+
+
+class TestRendererView:
+    @pytest.fixture
+    def example_settings(self) -> SettingsState:
+        """Provide settings state with a blue background."""
+        return SettingsState(bg_color=(0, 0, 255))
+
+    @pytest.mark.parametrize(
+        "rotated, position",
+        [(False, (0, 0)), (False, (19, 9)), (True, (99, 49)), (True, (80, 40))],
+    )
+    def test_update_item_drawn(
+        self,
+        rotated: bool,
+        position: tuple[int, int],
+        example_model: SimpleNamespace,
+        example_renderer: Renderer,
+        example_settings: SettingsState,
+    ) -> None:
+        """Items are drawn in position, rotated if required."""
+        view = RendererView(example_model, example_renderer, example_settings, rotated)
+        view.update()
+
+        assert example_renderer.to_surface().get_at(position) == (255, 0, 0)
+
+    def test_update_background_drawn(
+        self,
+        example_model: SimpleNamespace,
+        example_renderer: Renderer,
+        example_settings: SettingsState,
+    ) -> None:
+        """Background is drawn where there are no items."""
+        view = RendererView(example_model, example_renderer, example_settings)
+        view.update()
+
+        assert example_renderer.to_surface().get_at((50, 25)) == (0, 0, 255)
+
+    def test_update_textures_reused(
+        self,
+        example_model: SimpleNamespace,
+        example_renderer: Renderer,
+        example_settings: SettingsState,
+    ) -> None:
+        """Textures are reused between updates while content is unchanged."""
+        view = RendererView(example_model, example_renderer, example_settings)
+        view.update()
+        textures = dict(view._draw_list._converted)
+        example_model.item_groups[0].sprites()[0].rect.x += 5
+        view.update()
+
+        assert view._draw_list._converted == textures
+
+    def test_update_unchanged_skipped(
+        self,
+        example_model: SimpleNamespace,
+        example_renderer: Renderer,
+        example_settings: SettingsState,
+    ) -> None:
+        """Frame is skipped when nothing has changed."""
+        view = RendererView(example_model, example_renderer, example_settings)
+
+        assert view.update()
+        assert not view.update()
+
+    def test_update_textures_released(
+        self,
+        example_model: SimpleNamespace,
+        example_renderer: Renderer,
+        example_settings: SettingsState,
+    ) -> None:
+        """Textures are released once content is no longer displayed."""
+        view = RendererView(example_model, example_renderer, example_settings)
+        view.update()
+        example_model.item_groups[0].empty()
+        view.update()
+
+        assert len(view._draw_list._converted) == 0
+
+
+class RecordingSink(FrameSink):
+    """Sink that records the areas written, and whether it was closed."""
+
+    def __init__(self) -> None:
+        self.rects: list[list[pg.Rect]] = []
+        self.closed = False
+
+    def write(self, frame: pg.Surface, rects: Sequence[pg.Rect]) -> None:
+        self.rects.append(list(rects))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestView:
+    @pytest.fixture
+    def example_settings(self) -> SettingsState:
+        """Provide settings state with a blue background."""
+        return SettingsState(bg_color=(0, 0, 255))
+
+    @pytest.fixture
+    def example_view(
+        self, example_model: SimpleNamespace, example_settings: SettingsState
+    ) -> View:
+        """Provide view drawing to an off-screen surface and a recording sink."""
+        return View(
+            example_model,
+            pg.Surface((100, 50)),
+            example_settings,
+            sink=RecordingSink(),
+        )
+
+    def test_close_closes_sink(self, example_view: View) -> None:
+        """Closing the view closes its sink."""
+        example_view.close()
+
+        assert example_view._sink.closed
+
+    def test_update_sink_first_frame(self, example_view: View) -> None:
+        """Whole display is written for the first frame."""
+        view = example_view
+        view.update()
+
+        assert view._sink.rects[-1] == [pg.Rect(0, 0, 100, 50)]
+
+    def test_update_sink_unchanged(self, example_view: View) -> None:
+        """Frame is skipped when nothing has changed."""
+        view = example_view
+        view.update()
+
+        assert not view.update()
+        assert len(view._sink.rects) == 1
+
+    def test_update_sink_content_changed(
+        self, example_view: View, example_model: SimpleNamespace
+    ) -> None:
+        """Area of an item is written when its content is replaced."""
+        view = example_view
+        view.update()
+        item = example_model.item_groups[0].sprites()[0]
+        item.content = item.content.copy()
+
+        assert view.update()
+        assert view._sink.rects[-1] == [pg.Rect(0, 0, 20, 10), pg.Rect(0, 0, 20, 10)]
+
+    def test_update_sink_moved(
+        self, example_view: View, example_model: SimpleNamespace
+    ) -> None:
+        """Old and new areas are written when an item moves."""
+        view = example_view
+        view.update()
+        example_model.item_groups[0].sprites()[0].rect.x += 5
+        view.update()
+
+        assert view._sink.rects[-1] == [pg.Rect(5, 0, 20, 10), pg.Rect(0, 0, 20, 10)]
+
+    def test_update_sink_rotated(
+        self, example_model: SimpleNamespace, example_settings: SettingsState
+    ) -> None:
+        """Areas written are rotated with the display."""
+        view = View(
+            example_model,
+            pg.Surface((100, 50)),
+            example_settings,
+            True,
+            RecordingSink(),
+        )
+        view.update()
+        example_model.item_groups[0].empty()
+        view.update()
+
+        assert view._sink.rects[-1] == [pg.Rect(80, 40, 20, 10)]
+
+    def test_update_off_display_culled(
+        self, example_view: View, example_model: SimpleNamespace
+    ) -> None:
+        """Item entirely off the display is left out of the blits."""
+        view = example_view
+        example_model.item_groups[0].sprites()[0].rect.x = 100
+        view.update()
+
+        assert view._draw_list.blits == []
+        assert (view._draw_list.drawn, view._draw_list.culled) == (0, 1)
+
+    def test_update_moved_off_display_skipped(
+        self, example_view: View, example_model: SimpleNamespace
+    ) -> None:
+        """Moving an item while it is off the display is not a change."""
+        view = example_view
+        item = example_model.item_groups[0].sprites()[0]
+        item.rect.x = 150
+        view.update()
+        item.rect.x -= 10
+
+        assert not view.update()
+        assert len(view._sink.rects) == 1
+
+    def test_update_moved_onto_display(
+        self, example_view: View, example_model: SimpleNamespace
+    ) -> None:
+        """Only the new area is written when an item moves onto the display."""
+        view = example_view
+        item = example_model.item_groups[0].sprites()[0]
+        item.rect.x = 100
+        view.update()
+        item.rect.x -= 10
+
+        assert view.update()
+        assert view._sink.rects[-1] == [pg.Rect(90, 0, 20, 10)]
+
+    def test_update_stats_culled(
+        self, example_model: SimpleNamespace, example_settings: SettingsState
+    ) -> None:
+        """Items drawn and culled are counted in frame stats."""
+        stats = FrameStats()
+        view = View(
+            example_model,
+            pg.Surface((100, 50)),
+            example_settings,
+            sink=NullSink(),
+            stats=stats,
+        )
+        Item(example_model.item_groups[0], pg.Surface((20, 10)), pg.Rect(0, 0, 100, 50))
+        example_model.item_groups[0].sprites()[-1].rect.y = -10
+        view.update()
+        stats.end_frame()
+        stages = stats.summary()["stages"]
+
+        assert stages["view.drawn"]["max"] == 1
+        assert stages["view.culled"]["max"] == 1
+
+    def test_draw_snapshot(self, example_view: View) -> None:
+        """Snapshot is drawn instead of the current state of the model."""
+        view = example_view
+        item, content = pg.sprite.Sprite(), pg.Surface((10, 10))
+        content.fill((0, 255, 0))
+        view.draw(Snapshot((0, 0, 0), ((item, content, pg.Rect(50, 20, 10, 10)),)))
+
+        assert view._display.get_at((0, 0)) == pg.Color(0, 0, 0)
+        assert view._display.get_at((55, 25)) == pg.Color(0, 255, 0)
+        assert view._sink.rects[-1] == [pg.Rect(0, 0, 100, 50)]
@@ -0,0 +1,90 @@
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from screen_animator.instrumentation import FrameStats
+from screen_animator.settings import TimingSettings
+from screen_animator.watchdog import StallWatchdog
+
+
+def example_settings(fps: float) -> SimpleNamespace:
+    """Create stand-in settings manager with a target FPS."""
+    return SimpleNamespace(config=SimpleNamespace(timings=TimingSettings(fps, 2, 15)))
+
+
+def stall(seconds: float) -> None:
+    """Keep the main thread busy for a time."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStallWatchdog:
+    @pytest.fixture
+    def example_stats(self) -> FrameStats:
+        """Provide example `FrameStats`."""
+        return FrameStats()
+
+    @pytest.fixture
+    def example_watchdog(self, example_stats: FrameStats) -> StallWatchdog:
+        """Provide started `StallWatchdog` with a 20 ms threshold, stopped after use."""
+        watchdog = StallWatchdog(example_settings(100), 2, example_stats)
+        watchdog.start()
+        yield watchdog
+        watchdog.stop()
+
+    @pytest.mark.parametrize("fps, threshold", [(50, 0.08), (0, 4 / 60)])
+    def test_threshold(self, fps: int, threshold: float) -> None:
+        """Threshold is multiple of target frame time."""
+        watchdog = StallWatchdog(example_settings(fps))
+
+        assert watchdog.threshold == pytest.approx(threshold)
+
+    def test_threshold_follows_settings(self) -> None:
+        """Threshold follows the target FPS when settings are compiled again."""
+        settings_manager = example_settings(50)
+        watchdog = StallWatchdog(settings_manager)
+        settings_manager.config = SimpleNamespace(timings=TimingSettings(25, 2, 15))
+
+        assert watchdog.threshold == pytest.approx(0.16)
+
+    def test_no_stall(self, example_watchdog: StallWatchdog) -> None:
+        """Frames within threshold are not stalls."""
+        for _ in range(10):
+            time.sleep(0.005)
+            example_watchdog.heartbeat()
+
+        assert example_watchdog.stalls == 0
+
+    def test_stall_logged_once(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        example_stats: FrameStats,
+        example_watchdog: StallWatchdog,
+    ) -> None:
+        """Stall logged once with stage and stack of the main thread."""
+        example_stats.begin("model.RandomImagesItemGroup")
+        with caplog.at_level(logging.WARNING, "screen_animator.watchdog"):
+            stall(0.2)
+            example_watchdog.heartbeat()
+        example_stats.end()
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "screen_animator.watchdog"
+        ]
+
+        assert example_watchdog.stalls == 1
+        assert "model.RandomImagesItemGroup" in messages[0]
+        assert "in stall" in messages[0]
+        assert "stall ended" in messages[1]
+
+    def test_stalls_counted(self, example_watchdog: StallWatchdog) -> None:
+        """Every separate stall is detected."""
+        for _ in range(2):
+            stall(0.1)
+            example_watchdog.heartbeat()
+
+        assert example_watchdog.stalls == 2